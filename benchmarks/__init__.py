@@ -0,0 +1 @@
+"""Benchmarks of pyvelocity, executed as modules, e.g. `python -m benchmarks.toml_backends`."""
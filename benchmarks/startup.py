@@ -0,0 +1,309 @@
+"""Benchmark of import time and cold start latency of the command against the fixtures in tests/testresources.
+
+Compares the results with the baselines and fails when startup regresses.
+The number of imported modules depends only on Python, so its baseline is keyed by version and implementation
+and compared on any machine, e.g. in CI by tests/benchmarks/test_startup.py.
+Time isn't comparable on another machine, so its baseline is keyed by the whole environment.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import shutil
+import statistics
+
+# Reason: Accept risk of using subprocess since it executes this package by the same interpreter.
+import subprocess  # nosec B404
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+
+import click
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+
+PATH_FIXTURES = Path(__file__).parent.parent / "tests" / "testresources"
+PATH_BASELINE = Path(__file__).parent / "startup_baseline.json"
+# Options which don't need any project.
+COMMANDS_WITHOUT_PROJECT = ("--version", "--help")
+# Modules whose import time is measured, the entry point and what checking a project imports.
+MODULES = ("pyvelocity.cli", "pyvelocity.pyvelocity", "pyvelocity.checks.aggregation")
+MICROSECONDS_PER_MILLISECOND = 1000
+# Self, cumulative and name of module in each line of -X importtime.
+FIELDS_IMPORT_TIME = 3
+KIND_LATENCY = "latency"
+KIND_IMPORT_TIME = "import time"
+KIND_MODULES = "modules"
+# Keys of baselines in the file.
+BASELINES_MODULES = "modules"
+BASELINES_TIME = "time"
+# Scenario of bare interpreter to tell how much of startup pyvelocity is responsible for.
+SCENARIO_INTERPRETER = "interpreter"
+# Top-level packages whose modules are counted each, others are counted as one package, see count_modules().
+PACKAGES_COUNTED_BY_MODULE = frozenset({"pyvelocity", *sys.stdlib_module_names})
+
+
+def run(arguments: list[str], cwd: Path, *, is_without_site: bool = False) -> subprocess.CompletedProcess[str]:
+    """Executes the interpreter in a fresh process, so nothing is imported or cached beforehand.
+
+    Without site, .pth files in site-packages which import modules differently on each machine aren't executed,
+    and packages are found in the same paths as this process.
+    """
+    environment = {
+        **os.environ,
+        # To check in this process even when the daemon is running.
+        "PYVELOCITY_SOCKET": str(cwd / "nonexistent.sock"),
+    }
+    if is_without_site:
+        environment["PYTHONPATH"] = os.pathsep.join(path for path in sys.path if path)
+    # Reason: Arguments are built by this module. pylint: disable-next=subprocess-run-check
+    return subprocess.run(  # noqa: S603  # nosec B603
+        [sys.executable, *(["-S"] if is_without_site else []), *arguments],
+        cwd=cwd,
+        env=environment,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+
+def measure_latency(arguments: list[str], cwd: Path, repeat: int) -> float:
+    """Best milliseconds of the command end to end, the minimum is the least disturbed by other processes."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run(arguments, cwd)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def parse_import_time(stderr: str) -> Iterator[tuple[int, int, str]]:
+    """Self and cumulative microseconds and name of each module imported by output of -X importtime."""
+    for line in stderr.splitlines():
+        fields = [field.strip() for field in line.removeprefix("import time:").split("|")]
+        # Header line isn't digits.
+        if len(fields) == FIELDS_IMPORT_TIME and fields[0].isdigit():
+            yield int(fields[0]), int(fields[1]), fields[2]
+
+
+def sum_import_time(stderr: str, module: str | None = None) -> float:
+    """Milliseconds to import the module, or the sum of all imports when it's None."""
+    imports = list(parse_import_time(stderr))
+    if module is None:
+        return sum(self_time for self_time, _, _ in imports) / MICROSECONDS_PER_MILLISECOND
+    return next(cumulative for _, cumulative, name in imports if name == module) / MICROSECONDS_PER_MILLISECOND
+
+
+def count_modules(names: Iterable[str]) -> int:
+    """Number of modules counting each package of dependencies as one, since its submodules vary by version."""
+    own = {name for name in names if name.partition(".")[0] in PACKAGES_COUNTED_BY_MODULE}
+    return len(own) + len({name.partition(".")[0] for name in set(names) - own})
+
+
+class Measurement:
+    """Measurement of scenarios which execute the interpreter in fresh processes.
+
+    When modules only, time isn't measured, and the number of modules is measured once since it doesn't depend on noise.
+    """
+
+    def __init__(self, cwd: Path, repeat: int, *, is_modules_only: bool = False) -> None:
+        self.cwd = cwd
+        self.repeat = repeat
+        self.is_modules_only = is_modules_only
+
+    def measure_import_time(self, arguments: list[str], module: str | None = None) -> float:
+        """Best milliseconds to import the module, or the sum of every module the command imports when it's None."""
+        return min(
+            sum_import_time(run(["-X", "importtime", *arguments], self.cwd).stderr, module) for _ in range(self.repeat)
+        )
+
+    def measure_modules(self, arguments: list[str]) -> int:
+        """Number of modules which the command imports without site, so it's comparable on any machine."""
+        stderr = run(["-X", "importtime", *arguments], self.cwd, is_without_site=True).stderr
+        return count_modules(name for _, _, name in parse_import_time(stderr))
+
+    def measure_scenario(self, name: str, arguments: list[str]) -> dict[str, float]:
+        """Metrics of the scenario which executes the interpreter by the arguments."""
+        metrics: dict[str, float] = {f"{KIND_MODULES}: {name}": self.measure_modules(arguments)}
+        if not self.is_modules_only:
+            metrics[f"{KIND_LATENCY}: {name}"] = measure_latency(arguments, self.cwd, self.repeat)
+            metrics[f"{KIND_IMPORT_TIME}: {name}"] = self.measure_import_time(arguments)
+        return metrics
+
+    def measure_fixtures(self, fixtures: list[Path]) -> dict[str, float]:
+        """Median of the fixtures for checking each of them as pyproject.toml of a project without cache."""
+        list_metrics = []
+        for fixture in fixtures:
+            shutil.copy(fixture, self.cwd / "pyproject.toml")
+            list_metrics.append(self.measure_scenario("check", ["-m", "pyvelocity", "--no-cache"]))
+        return {name: statistics.median(metrics[name] for metrics in list_metrics) for name in list_metrics[0]}
+
+    def measure(self, fixtures: list[Path]) -> dict[str, float]:
+        """Metrics of startup keyed by names, time is in milliseconds."""
+        metrics = self.measure_scenario(SCENARIO_INTERPRETER, ["-c", "pass"])
+        for command in COMMANDS_WITHOUT_PROJECT:
+            metrics.update(self.measure_scenario(command, ["-m", "pyvelocity", command]))
+        for module in () if self.is_modules_only else MODULES:
+            metrics[f"{KIND_IMPORT_TIME}: {module}"] = self.measure_import_time(["-c", f"import {module}"], module)
+        return {**metrics, **self.measure_fixtures(fixtures)}
+
+
+def measure(fixtures: list[Path], repeat: int, *, is_modules_only: bool = False) -> dict[str, float]:
+    """Metrics of startup keyed by names, time is in milliseconds."""
+    with tempfile.TemporaryDirectory() as directory:
+        return Measurement(Path(directory), repeat, is_modules_only=is_modules_only).measure(fixtures)
+
+
+def format_metric(name: str, value: float) -> str:
+    return f"{value:.0f}" if name.startswith(KIND_MODULES) else f"{value:.1f} ms"
+
+
+def list_regressions(metrics: dict[str, float], baseline: dict[str, float], threshold: float) -> list[str]:
+    """Messages of metrics which regress from the baseline.
+
+    Time regresses when it's slower beyond the ratio of threshold,
+    the number of modules regresses when any module is added, e.g. a new heavy top-level import.
+    """
+    return [
+        f"{name}: {format_metric(name, value)} > {format_metric(name, baseline[name])}"
+        for name, value in metrics.items()
+        if name in baseline and value > baseline[name] * (1 if name.startswith(KIND_MODULES) else 1 + threshold)
+    ]
+
+
+def load_baselines(path_baseline: Path) -> dict[str, list[dict[str, Any]]]:
+    """Baselines of modules and time recorded in the file, empty when it doesn't exist yet."""
+    if not path_baseline.exists():
+        return {}
+    baselines: dict[str, list[dict[str, Any]]] = json.loads(path_baseline.read_text(encoding="utf-8"))
+    return baselines
+
+
+def find_baseline(baselines: list[dict[str, Any]], environment: dict[str, str]) -> dict[str, float] | None:
+    """Metrics of the baseline recorded on the environment."""
+    metrics = next((baseline["metrics"] for baseline in baselines if baseline["environment"] == environment), None)
+    return metrics if isinstance(metrics, dict) else None
+
+
+def find_baseline_modules(path_baseline: Path) -> dict[str, float] | None:
+    """Baseline of the number of modules recorded on the same version and implementation of Python."""
+    return find_baseline(load_baselines(path_baseline).get(BASELINES_MODULES, []), describe_interpreter())
+
+
+def compare(metrics: dict[str, float], path_baseline: Path, threshold: float) -> None:
+    """Raises ClickException when any metric regresses from the baselines.
+
+    The number of modules is always compared, so its baseline is required for this Python.
+    Time is compared only on the machine which recorded its baseline.
+    """
+    baseline_modules = find_baseline_modules(path_baseline)
+    if baseline_modules is None:
+        msg = f"No baseline of modules for {describe_interpreter()} in {path_baseline}, record it by --update."
+        raise click.ClickException(msg)
+    regressions = list_regressions(metrics, baseline_modules, threshold)
+    baseline_time = find_baseline(load_baselines(path_baseline).get(BASELINES_TIME, []), describe_environment())
+    if baseline_time is None:
+        click.echo(f"Warning: No baseline of time for {describe_environment()}, comparison of time skipped.", err=True)
+    else:
+        regressions.extend(list_regressions(metrics, baseline_time, threshold))
+    if regressions:
+        msg = "Startup regressed:\n" + "\n".join(regressions)
+        raise click.ClickException(msg)
+    click.echo("No regression.")
+
+
+def update(metrics: dict[str, float], path_baseline: Path) -> None:
+    """Records the metrics as the baselines of this Python and this environment, keeping others.
+
+    Baseline of time is recorded only when the metrics include time.
+    """
+    baselines = load_baselines(path_baseline)
+    modules = {name: value for name, value in metrics.items() if name.startswith(KIND_MODULES)}
+    durations = {name: round(value, 1) for name, value in metrics.items() if not name.startswith(KIND_MODULES)}
+    for key, environment, recorded in (
+        (BASELINES_MODULES, describe_interpreter(), modules),
+        (BASELINES_TIME, describe_environment(), durations),
+    ):
+        if recorded:
+            others = [baseline for baseline in baselines.get(key, []) if baseline["environment"] != environment]
+            baselines[key] = [*others, {"environment": environment, "metrics": recorded}]
+    path_baseline.write_text(json.dumps(baselines, indent=2) + "\n", encoding="utf-8")
+    click.echo(f"Baseline updated: {path_baseline}")
+
+
+def describe_interpreter() -> dict[str, str]:
+    """Version and implementation of Python, the number of modules is comparable on the same one on any machine."""
+    return {
+        "python": ".".join(platform.python_version_tuple()[:2]),
+        "implementation": platform.python_implementation(),
+    }
+
+
+def describe_environment() -> dict[str, str]:
+    """Environment of the measurement, baseline of time is comparable only on the same one."""
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+    }
+
+
+@click.command()
+@click.option("--repeat", type=click.IntRange(min=1), default=7, show_default=True, help="Runs for each metric.")
+@click.option("--fixtures", default="pyproject_*.toml", show_default=True, help="Glob of fixtures to check.")
+@click.option(
+    "--baseline",
+    "path_baseline",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=PATH_BASELINE,
+    show_default=True,
+    help="Machine-readable baselines of modules keyed by Python and of time keyed by environments in JSON.",
+)
+@click.option(
+    "--threshold",
+    type=click.FloatRange(min=0),
+    default=0.5,
+    show_default=True,
+    help="Ratio of slowdown from the baseline which fails.",
+)
+@click.option(
+    "--modules-only",
+    "is_modules_only",
+    is_flag=True,
+    help="Measure only the number of imported modules, which is fast and comparable on any machine.",
+)
+@click.option(
+    "--update",
+    "is_update",
+    is_flag=True,
+    help="Record the results as the baselines of this Python and this environment instead of comparing with them.",
+)
+# Reason: Options of command. pylint: disable-next=too-many-arguments
+def main(  # noqa: PLR0913
+    *,
+    repeat: int,
+    fixtures: str,
+    path_baseline: Path,
+    threshold: float,
+    is_modules_only: bool,
+    is_update: bool,
+) -> None:
+    """Reports import time and cold start latency and fails when they regress beyond the threshold of the baseline."""
+    metrics = measure(sorted(PATH_FIXTURES.glob(fixtures)), repeat, is_modules_only=is_modules_only)
+    for name, value in metrics.items():
+        click.echo(f"{name:<45} {format_metric(name, value):>10}")
+    if is_update:
+        update(metrics, path_baseline)
+        return
+    compare(metrics, path_baseline, threshold)
+
+
+if __name__ == "__main__":
+    main()
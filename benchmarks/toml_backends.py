@@ -0,0 +1,67 @@
+"""Benchmark of parse throughput of each TOML backend installed on synthetic large pyproject.toml."""
+
+from __future__ import annotations
+
+import time
+
+import click
+
+from pyvelocity.configurations.files.toml_backend import TomlBackend
+from pyvelocity.configurations.files.toml_backend import list_available_backends
+
+BYTES_PER_MEGABYTE = 1024 * 1024
+
+
+def synthesize(sections: int) -> str:
+    """Synthesizes pyproject.toml which has many dependencies, classifiers and tool sections, e.g. of monorepo."""
+    lines = [
+        "[project]",
+        'name = "synthetic"',
+        'version = "1.0.0"',
+        'requires-python = ">=3.10"',
+        "dependencies = [",
+        *(f'  "dependency-{index}>={index}.0",' for index in range(sections)),
+        "]",
+        "classifiers = [",
+        *(f'  "Programming Language :: Python :: 3.{minor}",' for minor in range(10, 15)),
+        "]",
+    ]
+    for index in range(sections):
+        lines.extend(
+            [
+                "",
+                f"[tool.synthetic-{index}]",
+                f"line-length = {index}",
+                f'select = ["A{index}", "B{index}", "C{index}"]',
+                f"enabled = {'true' if index % 2 else 'false'}",
+                f'per-file-ignores = {{ "tests/*" = ["S{index}"], "docs/*" = ["D{index}"] }}',
+            ],
+        )
+    return "\n".join(lines) + "\n"
+
+
+def measure(backend: TomlBackend, text: str, repeat: int) -> float:
+    """Best seconds to parse the text, the minimum is the least disturbed by other processes."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        backend.loads(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@click.command()
+@click.option("--sections", type=click.IntRange(min=1), default=1000, show_default=True, help="Tool sections.")
+@click.option("--repeat", type=click.IntRange(min=1), default=20, show_default=True, help="Parses for each backend.")
+def main(sections: int, repeat: int) -> None:
+    """Reports parse throughput of each TOML backend installed."""
+    text = synthesize(sections)
+    size = len(text.encode())
+    click.echo(f"Document: {size / BYTES_PER_MEGABYTE:.2f} MB")
+    for backend in list_available_backends():
+        seconds = measure(backend, text, repeat)
+        click.echo(f"{backend.name:<8} {seconds * 1000:8.2f} ms {size / BYTES_PER_MEGABYTE / seconds:8.2f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,6 @@
+"""Allows to execute pyvelocity by `python -m pyvelocity`."""
+
+from pyvelocity.client import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Implements asyncio API to embed pyvelocity into async applications.
+
+Checks access file system and discover packages synchronously,
+so each project is checked in a thread to avoid blocking the event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from itertools import islice
+from typing import TYPE_CHECKING
+
+from pyvelocity import pyvelocity
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+    from collections.abc import Iterable
+    from pathlib import Path
+
+    from pyvelocity.checks.aggregation import Results
+
+DEFAULT_CONCURRENCY = 8
+
+
+async def check_project(root: Path, *, semaphore: asyncio.Semaphore | None = None, threads: int = 1) -> Results:
+    """Checks the project located at the root directory without blocking the event loop.
+
+    When semaphore is given, the number of projects checked concurrently is bounded by it.
+    """
+    if semaphore is None:
+        return await asyncio.to_thread(pyvelocity.check_project, root, threads=threads)
+    async with semaphore:
+        return await asyncio.to_thread(pyvelocity.check_project, root, threads=threads)
+
+
+async def check_projects(
+    roots: Iterable[Path],
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    threads: int = 1,
+) -> AsyncGenerator[tuple[Path, Results], None]:
+    """Checks projects concurrently and yields pairs of root and results in order of completion.
+
+    At most concurrency projects are pending at once, so roots are consumed lazily to keep memory flat for many roots.
+    """
+    iterator = iter(roots)
+    pending: dict[asyncio.Task[Results], Path] = {}
+    try:
+        while True:
+            _refill(pending, islice(iterator, concurrency - len(pending)), threads=threads)
+            if not pending:
+                return
+            for completed in await _pop_completed(pending):
+                yield completed
+    finally:
+        # When the caller stops iteration, projects not yet checked are no longer needed.
+        for task in pending:
+            task.cancel()
+
+
+def _refill(pending: dict[asyncio.Task[Results], Path], roots: Iterable[Path], *, threads: int) -> None:
+    for root in roots:
+        pending[asyncio.ensure_future(check_project(root, threads=threads))] = root
+
+
+async def _pop_completed(pending: dict[asyncio.Task[Results], Path]) -> list[tuple[Path, Results]]:
+    done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+    return [(pending.pop(task), task.result()) for task in done]
@@ -0,0 +1,91 @@
+"""Public API to check many projects from Python without click.
+
+Results are yielded lazily so that callers can stream them, e.g. into a database, without building a list.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from pyvelocity import pyvelocity
+from pyvelocity import revisions as revisions_module
+from pyvelocity.checks import Result
+from pyvelocity.checks.aggregation import CHECK_CLASSES
+from pyvelocity.checks.aggregation import Results
+
+if TYPE_CHECKING:
+    from collections.abc import Collection
+    from collections.abc import Generator
+    from collections.abc import Iterable
+    from collections.abc import Mapping
+
+__all__ = ["CHECK_IDS", "Result", "Results", "check_documents", "check_many", "check_revisions"]
+
+CHECK_IDS = tuple(check_class.ID for check_class in CHECK_CLASSES)
+
+
+# Reason: Options of checks. pylint: disable-next=too-many-arguments
+def check_many(  # noqa: PLR0913
+    roots: Iterable[Path | str],
+    *,
+    select: Collection[str] | None = None,
+    jobs: int = 1,
+    threads: int = 1,
+    time_budget: float | None = None,
+    cache: bool = False,
+) -> Generator[tuple[Path, Result], None, None]:
+    """Checks projects in roots and yields pairs of root and result as soon as each result is produced.
+
+    Roots are consumed lazily, e.g. a generator reading them from a file.
+    When select is given, executes only checks with the IDs in CHECK_IDS.
+    When jobs is more than 1, projects are checked in worker processes. 0 means the number of CPUs.
+    When time budget in seconds is given, expensive checks which would exceed it are skipped.
+    When cache, results are cached in .pyvelocity_cache/ directory under each root.
+
+    Raises ValueError for unknown IDs of checks immediately rather than at the first iteration.
+    """
+    _validate(select)
+    return pyvelocity.stream_projects(
+        (Path(root) for root in roots),
+        jobs=jobs,
+        threads=threads,
+        time_budget=time_budget,
+        cache=cache,
+        select=select,
+    )
+
+
+def check_documents(documents: Mapping[str, str], *, select: Collection[str] | None = None) -> Results:
+    """Checks the project whose files are given as contents keyed by paths relative to the root.
+
+    E.g. {"pyproject.toml": ..., "README.md": ..., "src/package/__init__.py": ""}.
+    Files which affect results are pyproject.toml, README.md, setup.py, setup.cfg, __init__.py and py.typed.
+    The file system is never touched, so contents from object store can be checked concurrently in threads.
+    """
+    _validate(select)
+    return pyvelocity.check_documents(documents, select=select)
+
+
+def check_revisions(
+    repository: Path | str,
+    revisions: Iterable[str],
+    *,
+    directory: str = "",
+    select: Collection[str] | None = None,
+) -> Generator[tuple[str, Results | None], None, None]:
+    """Checks the project in each revision, e.g. tags, read from Git object database without checkout.
+
+    Yields pairs of revision and results lazily in order of revisions,
+    results are None when the revision or the directory of the project doesn't exist in it.
+    Works on bare repositories. See check_documents() for files read from each revision.
+    """
+    _validate(select)
+    return revisions_module.check_revisions(Path(repository), revisions, directory=directory, select=select)
+
+
+def _validate(select: Collection[str] | None) -> None:
+    unknown_ids = sorted(set(select or ()).difference(CHECK_IDS))
+    if unknown_ids:
+        msg = f"Unknown check IDs: {', '.join(unknown_ids)}"
+        raise ValueError(msg)
@@ -0,0 +1,149 @@
+"""Implements checks of built distributions read from archives without extraction."""
+
+from __future__ import annotations
+
+import tarfile
+import zipfile
+from email.parser import BytesHeaderParser
+from pathlib import PurePosixPath
+from typing import TYPE_CHECKING
+from typing import Any
+
+from pyvelocity.checks import TREE_FILE_NAMES
+from pyvelocity.checks.classifiers import Classifiers
+from pyvelocity.checks.keywords import Keywords
+from pyvelocity.checks.requires_python import RequiresPython
+from pyvelocity.checks.typed import Typed
+from pyvelocity.configurations.files.aggregation import InMemoryConfigurationFiles
+from pyvelocity.configurations.files.py_project_toml import WHERE_PY_PROJECT_TOML
+from pyvelocity.configurations.files.readme import DEFAULT_SCAN_LIMIT
+from pyvelocity.configurations.files.readme import WHERE_README_MD
+from pyvelocity.pyvelocity import check_configuration_files
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from email.message import Message
+    from pathlib import Path
+
+    from pyvelocity.checks.aggregation import Results
+
+# Checks which built distributions have enough information for.
+METADATA_CHECK_IDS = (Classifiers.ID, RequiresPython.ID, Keywords.ID, Typed.ID)
+SUFFIX_WHEEL = ".whl"
+SUFFIXES_SOURCE_DISTRIBUTION = (".tar.gz", ".tgz", ".tar.bz2", ".tar.xz", ".tar")
+NAME_PY_TYPED = "py.typed"
+
+
+class UnsupportedArchiveError(Exception):
+    """The file isn't a source distribution nor a wheel."""
+
+
+class SourceDistribution:
+    """Source distribution whose files are under a top-level directory, e.g. name-1.0.0/pyproject.toml."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def read(self) -> InMemoryConfigurationFiles:
+        """Streams members once, reads pyproject.toml, the head of README.md and names of package files.
+
+        README.md is read up to the default scan limit
+        since it may precede pyproject.toml which configures the limit in the stream.
+        """
+        documents = {}
+        readme_head = None
+        # Stream mode reads the compressed archive sequentially without seeking.
+        with tarfile.open(self.path, "r|*") as archive:
+            for name, member in self._iterate_files(archive):
+                if name == WHERE_PY_PROJECT_TOML:
+                    documents[name] = self._read(archive, member).decode("utf-8", errors="replace")
+                elif name == WHERE_README_MD:
+                    readme_head = self._read(archive, member, DEFAULT_SCAN_LIMIT)
+                elif PurePosixPath(name).name in TREE_FILE_NAMES:
+                    documents[name] = ""
+        return InMemoryConfigurationFiles(documents, self.path, readme_head=readme_head)
+
+    @staticmethod
+    def _iterate_files(archive: tarfile.TarFile) -> Generator[tuple[str, tarfile.TarInfo], None, None]:
+        """Files with paths relative to the top-level directory."""
+        for member in archive:
+            parts = PurePosixPath(member.name).parts
+            if member.isfile() and len(parts) > 1:
+                yield "/".join(parts[1:]), member
+
+    @staticmethod
+    def _read(archive: tarfile.TarFile, member: tarfile.TarInfo, size: int = -1) -> bytes:
+        file = archive.extractfile(member)
+        return b"" if file is None else file.read(size)
+
+
+class Wheel:
+    """Wheel whose metadata is in *.dist-info/METADATA instead of pyproject.toml."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def read(self) -> InMemoryConfigurationFiles:
+        """Reads METADATA and the list of files from the central directory without reading other members."""
+        with zipfile.ZipFile(self.path) as archive:
+            names = archive.namelist()
+            name_metadata = next(
+                (name for name in names if PurePosixPath(name).match("*.dist-info/METADATA")),
+                None,
+            )
+            if name_metadata is None:
+                msg = f"METADATA not found in {self.path}"
+                raise UnsupportedArchiveError(msg)
+            metadata = BytesHeaderParser().parsebytes(archive.read(name_metadata))
+        documents = {name: "" for name in names if PurePosixPath(name).name in TREE_FILE_NAMES}
+        return InMemoryConfigurationFiles(
+            documents,
+            self.path,
+            parsed_py_project_toml=self.convert(
+                metadata,
+                has_py_typed=any(name.endswith(NAME_PY_TYPED) for name in names),
+            ),
+        )
+
+    @staticmethod
+    def convert(metadata: Message, *, has_py_typed: bool) -> dict[str, Any]:
+        """Converts core metadata into parsed pyproject.toml which the checks understand.
+
+        Including py.typed in the wheel is what tool.setuptools.package-data configures in pyproject.toml.
+        """
+        project: dict[str, Any] = {"name": metadata.get("Name"), "version": metadata.get("Version")}
+        classifiers = metadata.get_all("Classifier")
+        if classifiers is not None:
+            project["classifiers"] = [str(classifier) for classifier in classifiers]
+        if "Requires-Python" in metadata:
+            project["requires-python"] = str(metadata["Requires-Python"])
+        if "Keywords" in metadata:
+            keywords = str(metadata["Keywords"])
+            # Core metadata separates keywords by comma, old tools separated them by space.
+            project["keywords"] = [keyword for keyword in keywords.replace(",", " ").split() if keyword]
+        parsed: dict[str, Any] = {"project": project}
+        if has_py_typed:
+            parsed["tool"] = {"setuptools": {"package-data": {"*": [NAME_PY_TYPED]}}}
+        return parsed
+
+
+def check_archive(path: Path) -> Results:
+    """Executes checks about metadata of the source distribution or the wheel without extracting it.
+
+    Raises UnsupportedArchiveError when the file isn't an archive of them.
+    """
+    try:
+        configuration_files = read_archive(path)
+    except (tarfile.TarError, zipfile.BadZipFile) as error:
+        msg = f"Broken archive: {path.name}: {error}"
+        raise UnsupportedArchiveError(msg) from error
+    return check_configuration_files(configuration_files, select=METADATA_CHECK_IDS)
+
+
+def read_archive(path: Path) -> InMemoryConfigurationFiles:
+    if path.name.endswith(SUFFIX_WHEEL):
+        return Wheel(path).read()
+    if path.name.endswith(SUFFIXES_SOURCE_DISTRIBUTION):
+        return SourceDistribution(path).read()
+    msg = f"Unsupported archive: {path.name}, expected {SUFFIX_WHEEL} or .tar.gz"
+    raise UnsupportedArchiveError(msg)
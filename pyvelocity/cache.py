@@ -0,0 +1,295 @@
+"""Implements on-disk cache of results keyed by fingerprints of inputs of checks."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import marshal
+import os
+import sys
+import threading
+from typing import TYPE_CHECKING
+from typing import Any
+
+from pyvelocity import __version__
+from pyvelocity.checks import Result
+from pyvelocity.configurations.files.py_project_toml import WHERE_PY_PROJECT_TOML
+from pyvelocity.constants import LATEST_PYTHON_VERSION
+from pyvelocity.discovery import PRUNED_DIRECTORY_NAMES
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+    from pyvelocity.checks import Check
+    from pyvelocity.configurations.files.snapshot import Snapshot
+
+WHERE_CACHE = ".pyvelocity_cache"
+NAME_RESULTS = "results.json"
+NAME_PARSED_PY_PROJECT_TOML = "pyproject.toml.marshal"
+DIGEST_MISSING = "missing"
+
+
+def fingerprint_tree(root: Path) -> str:
+    """Fingerprint of directory structure of the project, e.g. packages and py.typed files.
+
+    Directories are fingerprinted by their mtimes
+    since they change when entries in them are added, removed or renamed.
+    Except the root, whose mtime also changes when files at the root, e.g. README.md, are saved by editors,
+    only names of sub directories of the root are fingerprinted.
+    """
+    hash_object = hashlib.sha256()
+    stack = [""]
+    while stack:
+        relative_directory = stack.pop()
+        directory = root / relative_directory
+        try:
+            mtime = directory.stat().st_mtime_ns if relative_directory else 0
+            with os.scandir(directory) as iterator:
+                names = sorted(entry.name for entry in iterator if _is_walked(entry))
+        except OSError:
+            continue
+        hash_object.update(f"{relative_directory}\0{mtime}\n".encode())
+        # Reversed since the stack pops the last one first.
+        stack.extend(f"{relative_directory}/{name}" if relative_directory else name for name in reversed(names))
+    return hash_object.hexdigest()
+
+
+def identify_origin(directory: Path) -> str | None:
+    """Machine-local identity of the cache directory, its absolute path, device and inode.
+
+    Cache files copied from elsewhere, e.g. committed to Git and checked out, are in a directory of another identity,
+    so they are never trusted. None when the directory doesn't exist.
+    """
+    try:
+        stat = directory.stat()
+    except OSError:
+        return None
+    return hashlib.sha256(f"{directory.absolute()}\0{stat.st_dev}\0{stat.st_ino}".encode()).hexdigest()
+
+
+def _is_walked(entry: os.DirEntry[str]) -> bool:
+    return (
+        entry.name not in PRUNED_DIRECTORY_NAMES and entry.name != WHERE_CACHE and entry.is_dir(follow_symlinks=False)
+    )
+
+
+class Fingerprints:
+    """Fingerprints of inputs of checks in the project.
+
+    Content hash of file is reused from the previous run while its mtime and size are unchanged,
+    so that unchanged files are not read.
+    When the snapshot of the run is given, files are stat-ed and read through it.
+    """
+
+    def __init__(self, root: Path, previous: dict[str, dict[str, Any]], snapshot: Snapshot | None = None) -> None:
+        self.root = root
+        self.previous = previous
+        self.snapshot = snapshot
+        self.files: dict[str, dict[str, Any]] = {}
+        # Whether any file was hashed, then its mtime and size should be saved to skip hashing next time.
+        self.is_hashed = False
+        self._tree: str | None = None
+        # Checks may be executed concurrently on threads.
+        self.lock = threading.Lock()
+
+    def of_file(self, name: str) -> str:
+        """Fingerprint of the file relative to the root."""
+        with self.lock:
+            if name not in self.files:
+                self.files[name] = self._fingerprint_file(name)
+            return str(self.files[name]["digest"])
+
+    def of_tree(self) -> str:
+        """Fingerprint of directory structure of the project."""
+        with self.lock:
+            if self._tree is None:
+                self._tree = fingerprint_tree(self.root)
+            return self._tree
+
+    def _fingerprint_file(self, name: str) -> dict[str, Any]:
+        stat = self._stat(name)
+        if stat is None:
+            return {"digest": DIGEST_MISSING}
+        previous = self.previous.get(name, {})
+        if previous.get("mtime_ns") == stat.st_mtime_ns and previous.get("size") == stat.st_size:
+            return previous
+        self.is_hashed = True
+        try:
+            content = (self.root / name).read_bytes() if self.snapshot is None else self.snapshot.read_bytes(name)
+            digest = hashlib.sha256(content).hexdigest()
+        except OSError:
+            # E.g. directory, the check reports it in the same way every time.
+            digest = DIGEST_MISSING
+        return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "digest": digest}
+
+    def _stat(self, name: str) -> os.stat_result | None:
+        if self.snapshot is not None:
+            return self.snapshot.stat(name)
+        try:
+            return (self.root / name).stat()
+        except OSError:
+            return None
+
+
+class ParsedFileCache:
+    """On-disk cache of parsed pyproject.toml in .pyvelocity_cache/ directory, keyed by path, mtime and size.
+
+    Serialized by marshal, which loads faster than parsing TOML again in the next run, e.g. in other CI stages.
+    Parsed TOML including date and time isn't cached since marshal doesn't support them.
+    The file starts with the origin of the directory, so the one which isn't written in it is never unmarshaled.
+    """
+
+    def __init__(self, directory: Path, origin: str) -> None:
+        self.path = directory / NAME_PARSED_PY_PROJECT_TOML
+        self.header = origin.encode()
+
+    def get(self, path: Path, stat: os.stat_result) -> dict[str, Any] | None:
+        """Parsed file when the cached one has the same path, mtime and size."""
+        try:
+            content = self.path.read_bytes()
+            if not content.startswith(self.header):
+                return None
+            # Reason: The origin proves that the cache is written by pyvelocity in this directory.
+            data = marshal.loads(content[len(self.header) :])  # noqa: S302  # nosec B302
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if not isinstance(data, tuple) or data[:-1] != self._key(path, stat):
+            return None
+        parsed = data[-1]
+        return parsed if isinstance(parsed, dict) else None
+
+    def put(self, path: Path, stat: os.stat_result, parsed: dict[str, Any]) -> None:
+        """Saves the parsed file. Failure is ignored since the cache is only for speed."""
+        try:
+            content = self.header + marshal.dumps((*self._key(path, stat), parsed))
+        except ValueError:
+            return
+        path_temporary = self.path.with_name(f"{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path_temporary.write_bytes(content)
+            # Replaces atomically so that concurrent runs never read broken cache.
+            path_temporary.replace(self.path)
+        except OSError:
+            path_temporary.unlink(missing_ok=True)
+
+    @staticmethod
+    def _key(path: Path, stat: os.stat_result) -> tuple[Any, ...]:
+        # Format of marshal may change between Python versions.
+        return (__version__, sys.version_info[:2], str(path.absolute()), stat.st_mtime_ns, stat.st_size)
+
+
+class ResultCache:
+    """On-disk cache of results of checks in .pyvelocity_cache/ directory under the root of the project.
+
+    Result of each check is keyed by fingerprints of its inputs and the origin of the directory.
+    The whole cache is invalidated when the version of pyvelocity, the latest Python version or the origin changes.
+    """
+
+    def __init__(self, root: Path, snapshot: Snapshot | None = None) -> None:
+        self.directory = root / WHERE_CACHE
+        self.path = self.directory / NAME_RESULTS
+        # Prepares directory before fingerprinting since creating it changes mtime of the root.
+        self.origin = identify_origin(self.directory) if self._prepare_directory() else None
+        data = self._load()
+        self.entries: dict[str, dict[str, Any]] = data.get("results", {})
+        self.selection: dict[str, Any] | None = data.get("selection")
+        self.is_updated = False
+        self.fingerprints = Fingerprints(root, data.get("files", {}), snapshot)
+        self.parsed_files = None if self.origin is None else ParsedFileCache(self.directory, self.origin)
+
+    def get_all(self) -> list[Result] | None:
+        """Results of all selected checks of the previous run when none of their inputs changed.
+
+        Since this doesn't need check classes, the caller can skip parsing configuration files on hit.
+        """
+        if self.selection is None or self.selection.get("key") != self.fingerprints.of_file(WHERE_PY_PROJECT_TOML):
+            return None
+        results = []
+        for check_id in self.selection.get("ids", []):
+            entry = self.entries.get(check_id)
+            if entry is None:
+                return None
+            result = self._get(check_id, entry["inputs"], depends_on_tree=entry["depends_on_tree"])
+            if result is None:
+                return None
+            results.append(result)
+        return results
+
+    def get(self, check: Check) -> Result | None:
+        """Cached result of the check when none of its inputs changed."""
+        return self._get(check.ID, list(check.INPUTS), depends_on_tree=check.DEPENDS_ON_TREE)
+
+    def put(self, check: Check, result: Result) -> None:
+        self.is_updated = True
+        self.entries[check.ID] = {
+            "inputs": list(check.INPUTS),
+            "depends_on_tree": check.DEPENDS_ON_TREE,
+            "key": self._key(check.ID, list(check.INPUTS), depends_on_tree=check.DEPENDS_ON_TREE),
+            "is_ok": result.is_ok,
+            "message": result.message,
+        }
+
+    def select(self, check_ids: Iterable[str]) -> None:
+        """Records checks selected by the configuration in pyproject.toml in order of execution."""
+        self.is_updated = True
+        self.selection = {"key": self.fingerprints.of_file(WHERE_PY_PROJECT_TOML), "ids": list(check_ids)}
+
+    def save(self) -> None:
+        """Saves the cache when updated. Failure is ignored since the cache is only for speed."""
+        if self.origin is None or not (self.is_updated or self.fingerprints.is_hashed):
+            return
+        data = {
+            "version": __version__,
+            "latest_python_version": LATEST_PYTHON_VERSION,
+            "origin": self.origin,
+            "files": self.fingerprints.files,
+            "selection": self.selection,
+            "results": self.entries,
+        }
+        path_temporary = self.directory / f"{NAME_RESULTS}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            path_temporary.write_text(json.dumps(data), encoding="utf-8")
+            # Replaces atomically so that concurrent runs never read broken cache.
+            path_temporary.replace(self.path)
+        except OSError:
+            path_temporary.unlink(missing_ok=True)
+
+    def _get(self, check_id: str, inputs: list[str], *, depends_on_tree: bool) -> Result | None:
+        entry = self.entries.get(check_id)
+        if entry is None or entry["key"] != self._key(check_id, inputs, depends_on_tree=depends_on_tree):
+            return None
+        return Result(check_id, entry["is_ok"], entry["message"])
+
+    def _key(self, check_id: str, inputs: list[str], *, depends_on_tree: bool) -> str:
+        parts = [check_id, str(self.origin), *(f"{name}\0{self.fingerprints.of_file(name)}" for name in inputs)]
+        if depends_on_tree:
+            parts.append(f"\0{self.fingerprints.of_tree()}")
+        return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+    def _load(self) -> dict[str, Any]:
+        if self.origin is None:
+            return {}
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != __version__
+            or data.get("latest_python_version") != LATEST_PYTHON_VERSION
+            or data.get("origin") != self.origin
+        ):
+            return {}
+        return data
+
+    def _prepare_directory(self) -> bool:
+        try:
+            self.directory.mkdir(exist_ok=True)
+            path_gitignore = self.directory / ".gitignore"
+            if not path_gitignore.exists():
+                # Same as .pytest_cache and .ruff_cache, the cache is never committed.
+                path_gitignore.write_text("# Created by pyvelocity automatically.\n*\n", encoding="utf-8")
+        except OSError:
+            return False
+        return True
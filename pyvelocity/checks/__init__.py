@@ -2,11 +2,39 @@
 
 from abc import ABC
 from abc import abstractmethod
+from collections.abc import Set as AbstractSet
 from dataclasses import dataclass
+from dataclasses import field
+from enum import IntEnum
+from pathlib import Path
 from typing import ClassVar
 
 from pyvelocity.configurations.aggregation import Configurations
 from pyvelocity.configurations.files.aggregation import ConfigurationFiles
+from pyvelocity.configurations.files.py_project_toml import WHERE_PY_PROJECT_TOML
+from pyvelocity.configurations.files.sections.project import Project
+from pyvelocity.facts import Facts
+
+
+class Cost(IntEnum):
+    """Cost class of check, checks are executed in ascending order of cost."""
+
+    # Reads only parsed configuration files.
+    CHEAP = 0
+    # Accesses file system.
+    IO = 1
+    # Walks the project tree, e.g. package discovery.
+    EXPENSIVE = 2
+
+    @property
+    def estimated_seconds(self) -> float:
+        """Rough estimate of duration to decide whether the check fits in time budget."""
+        return ESTIMATED_SECONDS[self]
+
+
+ESTIMATED_SECONDS = {Cost.CHEAP: 0.0, Cost.IO: 0.005, Cost.EXPENSIVE: 0.05}
+# Names of files in sub directories which change directory structure checks depend on, e.g. packages.
+TREE_FILE_NAMES = frozenset({"__init__.py", "py.typed"})
 
 
 @dataclass
@@ -15,17 +43,61 @@ class Result:
     id: str
     is_ok: bool
     message: str
+    # Seconds taken to execute the check, which varies on each execution.
+    duration: float = field(default=0.0, compare=False)
 
 
 class Check(ABC):
     """Abstract check class."""
 
     ID: ClassVar[str]
+    COST: ClassVar[Cost] = Cost.CHEAP
+    # Files relative to the root which the result depends on.
+    INPUTS: ClassVar[tuple[str, ...]] = (WHERE_PY_PROJECT_TOML,)
+    # Whether the result also depends on directory structure of the project, e.g. packages and py.typed files.
+    DEPENDS_ON_TREE: ClassVar[bool] = False
 
     def __init__(self, configuration_files: ConfigurationFiles, configurations: Configurations) -> None:
         self.configuration_files = configuration_files
         self.configurations = configurations
 
+    @classmethod
+    def is_affected(cls, changed_inputs: AbstractSet[str], *, is_tree_changed: bool) -> bool:
+        """Whether the result may change when the inputs changed."""
+        return (cls.DEPENDS_ON_TREE and is_tree_changed) or not changed_inputs.isdisjoint(cls.INPUTS)
+
+    @classmethod
+    def estimate_seconds(cls) -> float:
+        """Rough estimate of duration to decide whether the check fits in time budget."""
+        return cls.COST.estimated_seconds
+
+    @property
+    def root(self) -> Path:
+        """Root directory of the project to check."""
+        return self.configuration_files.root
+
+    @property
+    def facts(self) -> Facts:
+        """Facts about the project shared by every check of the project."""
+        return self.configuration_files.facts
+
     @abstractmethod
     def execute(self) -> Result:
         raise NotImplementedError  # pragma: no cover
+
+
+class ProjectCheck(Check):
+    """Abstract check about [project] section in pyproject.toml."""
+
+    def execute(self) -> Result:
+        if self.facts.py_project_toml is None:
+            return Result(self.ID, is_ok=False, message=f"pyproject.toml is required for {self.ID} check")
+
+        if self.facts.project is None:
+            return Result(self.ID, is_ok=False, message="Project section is missing in pyproject.toml")
+
+        return self.check_section(self.facts.project)
+
+    @abstractmethod
+    def check_section(self, project: Project) -> Result:
+        raise NotImplementedError  # pragma: no cover
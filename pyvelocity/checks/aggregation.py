@@ -1,8 +1,16 @@
 """Implements aggregation of checks."""
 
-from collections.abc import Generator
+from __future__ import annotations
 
+import time
+from concurrent.futures import as_completed
+from dataclasses import replace
+from pathlib import PurePath
+from typing import TYPE_CHECKING
+
+from pyvelocity.checks import TREE_FILE_NAMES
 from pyvelocity.checks import Check
+from pyvelocity.checks import Cost
 from pyvelocity.checks import Result
 from pyvelocity.checks.badges import Badges
 from pyvelocity.checks.classifiers import Classifiers
@@ -14,8 +22,52 @@ from pyvelocity.checks.requires_python import RequiresPython
 from pyvelocity.checks.typed import Typed
 from pyvelocity.checks.using_py_project_toml import UsingPyProjectToml
 from pyvelocity.checks.zip_safe_false import ZipSafeFalse
-from pyvelocity.configurations.aggregation import Configurations
-from pyvelocity.configurations.files.aggregation import ConfigurationFiles
+from pyvelocity.configurations.files.py_project_toml import WHERE_PY_PROJECT_TOML
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+    from collections.abc import Set as AbstractSet
+    from concurrent.futures import Executor
+
+    from pyvelocity.cache import ResultCache
+    from pyvelocity.configurations.aggregation import Configurations
+    from pyvelocity.configurations.files.aggregation import ConfigurationFiles
+
+
+# Sort is stable, so checks in the same cost class keep the order in the list.
+CHECK_CLASSES: list[type[Check]] = sorted(
+    [
+        UsingPyProjectToml,
+        LegacySetupFiles,
+        LineLength,
+        Readme,
+        RequiresPython,
+        Classifiers,
+        ZipSafeFalse,
+        Typed,
+        Keywords,
+        Badges,
+    ],
+    key=lambda check_class: check_class.COST,
+)
+
+
+def list_affected_check_ids(files: Iterable[str]) -> set[str]:
+    """IDs of checks whose results may change when the files relative to the root changed, e.g. files to commit.
+
+    Every check is affected by pyproject.toml since it may change the filter of checks.
+    Checks depending on directory structure are affected by files which make packages typed.
+    """
+    paths = [PurePath(file).as_posix() for file in files]
+    if WHERE_PY_PROJECT_TOML in paths:
+        return {check_class.ID for check_class in CHECK_CLASSES}
+    is_tree_changed = any("/" in path and path.rsplit("/", 1)[-1] in TREE_FILE_NAMES for path in paths)
+    return {
+        check_class.ID
+        for check_class in CHECK_CLASSES
+        if check_class.is_affected(set(paths), is_tree_changed=is_tree_changed)
+    }
 
 
 class Results:
@@ -24,6 +76,18 @@ class Results:
     def __init__(self, results: list[Result]) -> None:
         self.results = results
 
+    @classmethod
+    def collect(cls, results: Iterable[Result], *, fail_fast: bool = False) -> Results:
+        """Collects results. When fail_fast, stops at the first failing result."""
+        if not fail_fast:
+            return cls(list(results))
+        collected = []
+        for result in results:
+            collected.append(result)
+            if not result.is_ok:
+                break
+        return cls(collected)
+
     @property
     def message(self) -> str:
         return "\n".join([result.message for result in self.results if result.message])
@@ -33,27 +97,77 @@ class Results:
         return all(result.is_ok for result in self.results)
 
 
+class TimeBudget:
+    """Time budget to skip checks which are estimated to exceed it.
+
+    Cheap checks are never skipped.
+    """
+
+    def __init__(self, seconds: float) -> None:
+        self.seconds = seconds
+        self.start = time.perf_counter()
+
+    def allows(self, check: Check) -> bool:
+        if check.COST is Cost.CHEAP:
+            return True
+        return time.perf_counter() - self.start + check.estimate_seconds() <= self.seconds
+
+    def build_skipped_result(self, check: Check) -> Result:
+        message = f"Skipped {check.ID} check since it may exceed time budget {self.seconds * 1000:g}ms"
+        return Result(check.ID, is_ok=True, message=message)
+
+
 class Checks:
-    """Aggregation of Check."""
-
-    def __init__(self, configuration_files: ConfigurationFiles, configurations: Configurations) -> None:
-        check_classes: list[type[Check]] = [
-            UsingPyProjectToml,
-            LegacySetupFiles,
-            LineLength,
-            Readme,
-            RequiresPython,
-            Classifiers,
-            ZipSafeFalse,
-            Typed,
-            Keywords,
-            Badges,
-        ]
-        self.checks = (
+    """Aggregation of Check.
+
+    Checks are executed in ascending order of cost to report cheap results first.
+    When time budget in seconds is given, expensive checks which would exceed it are skipped.
+    When cache is given, checks whose inputs are unchanged return cached results.
+    """
+
+    def __init__(
+        self,
+        configuration_files: ConfigurationFiles,
+        configurations: Configurations,
+        *,
+        time_budget: float | None = None,
+        cache: ResultCache | None = None,
+    ) -> None:
+        self.checks = [
             check_class(configuration_files, configurations)
-            for check_class in check_classes
+            for check_class in CHECK_CLASSES
             if check_class.ID not in configurations.pyvelocity.filter.value
-        )
+        ]
+        self.time_budget = time_budget
+        self.cache = cache
+        if cache is not None:
+            cache.select(check.ID for check in self.checks)
+
+    def only(self, check_ids: AbstractSet[str]) -> None:
+        """Narrows down checks to execute to the IDs."""
+        self.checks = [check for check in self.checks if check.ID in check_ids]
+
+    def execute(self, executor: Executor | None = None, *, ordered: bool = True) -> Iterator[Result]:
+        """Executes checks and yields results in order of check classes.
+
+        When executor is given, checks are executed concurrently on it since they are independent of each other.
+        Then, when not ordered, results are yielded in order of completion.
+        """
+        time_budget = None if self.time_budget is None else TimeBudget(self.time_budget)
+        if executor is None:
+            return (self._execute(check, time_budget) for check in self.checks)
+        # Submits all checks at once and yields results in order of submission.
+        futures = [executor.submit(self._execute, check, time_budget) for check in self.checks]
+        return (future.result() for future in (futures if ordered else as_completed(futures)))
 
-    def execute(self) -> Generator[Result, None, None]:
-        return (check.execute() for check in self.checks)
+    def _execute(self, check: Check, time_budget: TimeBudget | None) -> Result:
+        start = time.perf_counter()
+        if self.cache is not None and (result := self.cache.get(check)) is not None:
+            return replace(result, duration=time.perf_counter() - start)
+        if time_budget is not None and not time_budget.allows(check):
+            return time_budget.build_skipped_result(check)
+        start = time.perf_counter()
+        result = check.execute()
+        if self.cache is not None:
+            self.cache.put(check, result)
+        return replace(result, duration=time.perf_counter() - start)
@@ -1,9 +1,10 @@
 """Implements badges check."""
 
-from pathlib import Path
-
 from pyvelocity.checks import Check
+from pyvelocity.checks import Cost
 from pyvelocity.checks import Result
+from pyvelocity.configurations.files.py_project_toml import WHERE_PY_PROJECT_TOML
+from pyvelocity.configurations.files.readme import WHERE_README_MD
 from pyvelocity.configurations.files.readme import ReadMe
 
 
@@ -11,13 +12,15 @@ class Badges(Check):
     """Checks that README.md contains expected badges."""
 
     ID = "badges"
+    COST = Cost.IO
+    # The scan limit of README.md is configured in pyproject.toml.
+    INPUTS = (WHERE_README_MD, WHERE_PY_PROJECT_TOML)
 
     def execute(self) -> Result:
-        readme_path = Path("README.md")
-        if not readme_path.exists():
+        readme = self.facts.readme
+        if readme is None:
             return Result(self.ID, is_ok=False, message="README.md file not found")
 
-        readme = ReadMe(readme_path)
         missing_badges = self._get_missing_badges(readme)
 
         if missing_badges:
@@ -2,31 +2,21 @@
 
 from __future__ import annotations
 
-import re
 from typing import TYPE_CHECKING
 
-from pyvelocity.checks import Check
+from pyvelocity.checks import ProjectCheck
 from pyvelocity.checks import Result
 
 if TYPE_CHECKING:
     from pyvelocity.configurations.files.sections.project import Project
 
 
-class Classifiers(Check):
+class Classifiers(ProjectCheck):
     """Check that classifiers are consistent with requires-python."""
 
     ID = "classifiers"
 
-    def execute(self) -> Result:
-        if self.configuration_files.py_project_toml is None:
-            return Result(self.ID, is_ok=False, message="pyproject.toml is required for classifiers check")
-
-        if self.configuration_files.py_project_toml.project is None:
-            return Result(self.ID, is_ok=False, message="Project section is missing in pyproject.toml")
-
-        return self._check_classifiers(self.configuration_files.py_project_toml.project)
-
-    def _check_classifiers(self, project: Project) -> Result:
+    def check_section(self, project: Project) -> Result:
         """Check that classifiers are consistent with requires-python."""
         classifiers_value = project.classifiers.value
         if classifiers_value is None:
@@ -42,9 +32,9 @@ class Classifiers(Check):
                 is_ok=False,
                 message="classifiers field must be a list in [project] section of pyproject.toml",
             )
-        return self.compare_classifiers_with_requires_python(project, classifiers_value)
+        return self.compare_classifiers_with_requires_python(project)
 
-    def compare_classifiers_with_requires_python(self, project: Project, classifiers_value: list[str]) -> Result:
+    def compare_classifiers_with_requires_python(self, project: Project) -> Result:
         """Compare classifiers against requires-python to ensure consistency."""
         requires_python_value = project.requires_python.value
         if requires_python_value is None:  # pylint: disable=duplicate-code
@@ -54,7 +44,7 @@ class Classifiers(Check):
                 message="requires-python field is missing in [project] section of pyproject.toml",
             )
 
-        supported_versions = project.get_requires_python_supported_versions(project)
+        supported_versions = self.facts.supported_versions
         if not supported_versions:
             return Result(
                 self.ID,
@@ -64,7 +54,7 @@ class Classifiers(Check):
                 ),
             )
 
-        classifier_versions = self.get_classifier_python_versions(classifiers_value)
+        classifier_versions = self.facts.classifiers.python_versions if self.facts.classifiers else set()
         return self._validate_version_consistency(supported_versions, classifier_versions, requires_python_value)
 
     def _validate_version_consistency(
@@ -99,15 +89,3 @@ class Classifiers(Check):
             extra_classifiers = [f"Programming Language :: Python :: {v}" for v in sorted_extra]
             error_parts.append(f"extra classifiers: {', '.join(extra_classifiers)}")
         return error_parts
-
-    def get_classifier_python_versions(self, classifiers: list[str]) -> set[str]:
-        """Extract Python versions from Programming Language :: Python :: X.Y classifiers."""
-        versions = set()
-        python_version_pattern = r"^Programming Language :: Python :: (\d+\.\d+)$"
-
-        for classifier in classifiers:
-            match = re.match(python_version_pattern, classifier.strip())
-            if match:
-                versions.add(match.group(1))
-
-        return versions
@@ -1,25 +1,16 @@
 """Implements keywords check."""
 
-from pyvelocity.checks import Check
+from pyvelocity.checks import ProjectCheck
 from pyvelocity.checks import Result
 from pyvelocity.configurations.files.sections.project import Project
 
 
-class Keywords(Check):
+class Keywords(ProjectCheck):
     """Checks that at least one keyword is defined in the project section."""
 
     ID = "keywords"
 
-    def execute(self) -> Result:
-        if self.configuration_files.py_project_toml is None:
-            return Result(self.ID, is_ok=False, message="pyproject.toml is required for keywords check")
-
-        if self.configuration_files.py_project_toml.project is None:
-            return Result(self.ID, is_ok=False, message="Project section is missing in pyproject.toml")
-
-        return self.check_keywords(self.configuration_files.py_project_toml.project)
-
-    def check_keywords(self, project: Project) -> Result:
+    def check_section(self, project: Project) -> Result:
         """Checks that at least one keyword is defined in the project section."""
         keywords_value = project.keywords.value
 
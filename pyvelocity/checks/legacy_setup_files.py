@@ -1,8 +1,7 @@
 """Implements legacy-setup-files check."""
 
-from pathlib import Path
-
 from pyvelocity.checks import Check
+from pyvelocity.checks import Cost
 from pyvelocity.checks import Result
 
 
@@ -10,6 +9,8 @@ class LegacySetupFiles(Check):
     """Checks that neither setup.py nor setup.cfg is used."""
 
     ID = "legacy-setup-files"
+    COST = Cost.IO
+    INPUTS = ("setup.py", "setup.cfg")
 
     def execute(self) -> Result:
         """Execute the legacy setup files check."""
@@ -24,16 +25,5 @@ class LegacySetupFiles(Check):
         return Result(self.ID, is_ok=False, message=message)
 
     def _find_legacy_files(self) -> list[str]:
-        """Find legacy setup files in the current directory."""
-        legacy_files = []
-
-        setup_py = Path("setup.py")
-        setup_cfg = Path("setup.cfg")
-
-        if setup_py.exists():
-            legacy_files.append("setup.py")
-
-        if setup_cfg.exists():
-            legacy_files.append("setup.cfg")
-
-        return legacy_files
+        """Find legacy setup files in the project root."""
+        return [name for name in self.INPUTS if self.configuration_files.exists(name)]
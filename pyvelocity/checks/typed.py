@@ -2,55 +2,52 @@
 
 from __future__ import annotations
 
-from pathlib import Path
+import sys
+from pathlib import PurePosixPath
 from typing import TYPE_CHECKING
 
-from packagediscovery import Setuptools
-
 from pyvelocity.checks import Check
+from pyvelocity.checks import Cost
 from pyvelocity.checks import Result
+from pyvelocity.configurations.files.aggregation import WHERE_SETUP_CFG
+from pyvelocity.configurations.files.py_project_toml import WHERE_PY_PROJECT_TOML
 
 if TYPE_CHECKING:
-    from pyvelocity.configurations.files.py_project_toml import PyProjectToml
-
-
-class TypingClassifierValidator:
-    """Validates the presence of 'Typing :: Typed' classifier in project metadata."""
-
-    def __init__(self, py_project_toml: PyProjectToml | None) -> None:
-        """Initialize with pyproject.toml configuration."""
-        self.py_project_toml = py_project_toml
-        self.classifiers_value = self._extract_classifiers_value()
+    from collections.abc import Mapping
 
-    def is_typing_classifier_present(self) -> bool:
-        """Check if 'Typing :: Typed' classifier is present in pyproject.toml."""
-        classifiers = self._get_classifiers_list()
-        return classifiers is not None and "Typing :: Typed" in classifiers
+    from setuptools.dist import Distribution
 
-    def _get_classifiers_list(self) -> list[str] | None:
-        """Extract classifiers list from pyproject.toml, returning None if invalid."""
-        if self.classifiers_value is None:
-            return None
-        return self.classifiers_value if isinstance(self.classifiers_value, list) else None
-
-    def _extract_classifiers_value(self) -> object | None:
-        """Extract classifiers value from project configuration, returning None if invalid."""
-        if self.py_project_toml is None:
-            return None
-        project = self.py_project_toml.project
-        if project is None:
-            return None
-        return project.classifiers.value
+# Importing setuptools takes most of duration of the check in a cold process, measured by python -X importtime.
+ESTIMATED_SECONDS_IMPORT_SETUPTOOLS = 0.2
 
 
 class Typed(Check):
     """Check about py.typed configuration and file presence."""
 
     ID = "typed"
+    COST = Cost.EXPENSIVE
+    # Packages can be configured explicitly in them.
+    INPUTS = (WHERE_PY_PROJECT_TOML, WHERE_SETUP_CFG)
+    DEPENDS_ON_TREE = True
+
+    @classmethod
+    def estimate_seconds(cls) -> float:
+        """Includes importing setuptools unless it's already imported, e.g. by the daemon or the previous project."""
+        is_imported = "setuptools" in sys.modules
+        return super().estimate_seconds() + (0.0 if is_imported else ESTIMATED_SECONDS_IMPORT_SETUPTOOLS)
 
     def execute(self) -> Result:
-        """Execute the typed check."""
-        check_results = self._perform_typed_checks()
+        """Execute the typed check.
+
+        Ambiguous layout of packages is reported with the message of setuptools instead of missing py.typed.
+        """
+        # Reason: Setuptools takes most of startup time, so it's imported only when packages are discovered.
+        from setuptools.errors import PackageDiscoveryError  # noqa: PLC0415  pylint: disable=import-outside-toplevel
+
+        try:
+            check_results = self._perform_typed_checks()
+        except PackageDiscoveryError as error:
+            return Result(self.ID, is_ok=False, message=f"Failed to discover packages: {error}")
 
         if all(check_results.values()):
             return Result(self.ID, is_ok=True, message="")
@@ -60,11 +57,10 @@ class Typed(Check):
 
     def _perform_typed_checks(self) -> dict[str, bool]:
         """Perform all typed check validations and return results."""
-        classifier_validator = TypingClassifierValidator(self.configuration_files.py_project_toml)
         return {
             "package_data_config": self._check_package_data_config(),
             "py_typed_files": self._check_py_typed_files(),
-            "typing_classifier": classifier_validator.is_typing_classifier_present(),
+            "typing_classifier": self.facts.has_typing_classifier,
         }
 
     def _build_error_messages(self, check_results: dict[str, bool]) -> list[str]:
@@ -87,10 +83,10 @@ class Typed(Check):
 
     def _get_package_data(self) -> dict[str, list[str]] | None:
         """Extract package-data from pyproject.toml."""
-        if self.configuration_files.py_project_toml is None:
+        if self.facts.py_project_toml is None:
             return None
 
-        setuptools = self.configuration_files.py_project_toml.setuptools
+        setuptools = self.facts.py_project_toml.setuptools
         if setuptools is None or setuptools.package_data.value is None:
             return None
 
@@ -105,29 +101,43 @@ class Typed(Check):
         return "*" in package_data and "py.typed" in package_data["*"]
 
     def _check_py_typed_files(self) -> bool:
-        """Check if py.typed files exist in package directories."""
+        """Check if py.typed files exist in package directories.
+
+        Ambiguous layout of packages is misconfiguration of the project, so it's raised instead of missing py.typed.
+        """
+        # Reason: Setuptools takes most of startup time, so it's imported only when packages are discovered.
+        from setuptools.errors import PackageDiscoveryError  # noqa: PLC0415  pylint: disable=import-outside-toplevel
+
         try:
-            package_list = self._discover_packages()
+            distribution = self._discover_packages()
+            package_list = distribution.packages
             if not package_list:
                 return False
-            return self._validate_py_typed_files(package_list)
+            return self._validate_py_typed_files(package_list, distribution.package_dir or {})
+        except PackageDiscoveryError:
+            raise
         except (OSError, ImportError, RuntimeError):
             # If package discovery fails, we can't validate
             return False
 
-    def _discover_packages(self) -> list[str]:
-        """Discover all packages in the current directory."""
-        setuptools = Setuptools()
-        return setuptools.packages
+    def _discover_packages(self) -> Distribution:
+        """Discover all packages in the project root."""
+        return self.facts.distribution
 
-    def _validate_py_typed_files(self, package_list: list[str]) -> bool:
+    def _validate_py_typed_files(self, package_list: list[str], package_dir: Mapping[str, str]) -> bool:
         """Validate that py.typed files exist in top-level packages."""
         # Only check top-level packages (those without dots in the name)
         top_level_packages = [pkg for pkg in package_list if "." not in pkg]
-        return all(self._py_typed_exists_for_package(package) for package in top_level_packages)
+        return all(self._py_typed_exists_for_package(package, package_dir) for package in top_level_packages)
 
-    def _py_typed_exists_for_package(self, package: str) -> bool:
+    def _py_typed_exists_for_package(self, package: str, package_dir: Mapping[str, str]) -> bool:
         """Check if py.typed file exists for a specific package."""
-        package_path = Path(package.replace(".", "/"))
-        py_typed_path = package_path / "py.typed"
-        return py_typed_path.exists()
+        package_path = self._resolve_package_path(package, package_dir)
+        return self.configuration_files.exists(package_path / "py.typed")
+
+    @staticmethod
+    def _resolve_package_path(package: str, package_dir: Mapping[str, str]) -> PurePosixPath:
+        """Resolve the directory of package relative to the root, considering src-layout."""
+        if package in package_dir:
+            return PurePosixPath(package_dir[package])
+        return PurePosixPath(package_dir.get("", "")) / package.replace(".", "/")
@@ -1,12 +1,61 @@
 """Console script for pyvelocity."""
 
+from __future__ import annotations
+
+import json
+import subprocess  # nosec B404
+import sys
+import time
+from contextlib import closing
+from contextlib import suppress
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import NoReturn
+
 import click
 from click import ClickException
 
-from pyvelocity.checks.aggregation import Checks
-from pyvelocity.checks.aggregation import Results
-from pyvelocity.configurations.aggregation import Configurations
-from pyvelocity.configurations.files.aggregation import ConfigurationFiles
+from pyvelocity import __version__
+from pyvelocity.client import COMMAND_PING
+from pyvelocity.client import COMMAND_STOP
+from pyvelocity.client import Client
+from pyvelocity.client import DaemonUnavailableError
+from pyvelocity.client import get_socket_path
+from pyvelocity.configurations.files.memo import PARSED_FILES
+from pyvelocity.configurations.files.snapshot import SYSCALLS
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from pyvelocity.checks import Result
+    from pyvelocity.checks.aggregation import Results
+    from pyvelocity.watch import Change
+    from pyvelocity.watch import Watcher
+
+# Modules which check projects are imported by commands which execute them,
+# so that `--version`, `--help` and sub commands which don't check projects start without importing them.
+
+FORMAT_TEXT = "text"
+FORMAT_NDJSON = "ndjson"
+TIMEOUT_START_DAEMON = 10.0
+INTERVAL_POLL_DAEMON = 0.05
+
+
+class MainGroup(click.Group):
+    """Group which invokes check command when the first argument isn't a sub command.
+
+    So that `pyvelocity [ROOTS]...` keeps working beside `pyvelocity daemon start`.
+    Options of the group itself such as `--version` are kept, `--help` shows help of check command.
+    """
+
+    DEFAULT_COMMAND = "check"
+
+    def parse_args(self, ctx: click.Context, args: list[str]) -> list[str]:
+        options = {option for param in self.params for option in param.opts}
+        if not args or args[0] not in {*self.commands, *options}:
+            args = [self.DEFAULT_COMMAND, *args]
+        return super().parse_args(ctx, args)
 
 
 def echo_success() -> None:
@@ -23,16 +72,495 @@ def echo_success() -> None:
         click.echo("Looks high velocity!")
 
 
-@click.command()
+def convert_duration(_ctx: click.Context, _param: click.Parameter, value: str | None) -> float | None:
+    """Converts duration such as "200ms" or "1.5s" into seconds. Number without unit means seconds."""
+    if value is None:
+        return None
+    text = value.strip().lower()
+    try:
+        seconds = float(text.removesuffix("ms")) / 1000 if text.endswith("ms") else float(text.removesuffix("s"))
+    except ValueError as error:
+        msg = f"{value!r} is not a valid duration, e.g. 200ms or 1.5s."
+        raise click.BadParameter(msg) from error
+    if seconds < 0:
+        msg = f"{value!r} is negative."
+        raise click.BadParameter(msg)
+    return seconds
+
+
+def report_syscalls(ctx: click.Context, _param: click.Parameter, value: bool) -> None:  # noqa: FBT001
+    """Echos the number of system calls to access files of projects to stderr when the command finishes."""
+    if not value:
+        return
+    SYSCALLS.clear()
+    ctx.call_on_close(lambda: click.echo(f"System calls: {SYSCALLS.summarize()}", err=True))
+
+
+def echo_results(list_root: list[Path], list_results: Iterable[Results], *, fail_fast: bool) -> bool:
+    """Echos results of projects and returns whether all of them are ok."""
+    is_ok = True
+    for root, results in zip(list_root, list_results, strict=False):
+        if results.message:
+            if len(list_root) > 1:
+                click.echo(f"{root}:")
+            click.echo(results.message)
+        is_ok = is_ok and results.is_ok
+        if fail_fast and not is_ok:
+            break
+    return is_ok
+
+
+def echo_ndjson(stream: Iterable[tuple[Path, Result]], *, fail_fast: bool) -> bool:
+    """Echos each result as a line of JSON as soon as it is produced and returns whether all of them are ok."""
+    is_ok = True
+    for root, result in stream:
+        # Function click.echo() flushes, so consumers can process each line before the scan ends.
+        click.echo(
+            json.dumps(
+                {
+                    "id": result.id,
+                    "is_ok": result.is_ok,
+                    "message": result.message,
+                    "project": str(root),
+                    "duration": result.duration,
+                },
+            ),
+        )
+        is_ok = is_ok and result.is_ok
+        if fail_fast and not is_ok:
+            break
+    return is_ok
+
+
+def watch_projects(watcher: Watcher, *, is_multiple: bool) -> None:
+    """Echos results of projects whenever their inputs change until interrupted."""
+    # To keep parsed configuration files in memory between iterations.
+    PARSED_FILES.is_enabled = True
+    with suppress(KeyboardInterrupt):
+        for change in watcher.watch():
+            echo_change(change, is_multiple=is_multiple)
+
+
+def echo_change(change: Change, *, is_multiple: bool) -> None:
+    if change.changed_inputs:
+        click.echo(f"Changed: {', '.join(change.changed_inputs)}")
+    if is_multiple:
+        click.echo(f"{change.root}:")
+    if change.results.message:
+        click.echo(change.results.message)
+    if change.results.is_ok:
+        echo_success()
+
+
+def list_roots(roots: tuple[Path, ...], *, recursive: bool, changed_since: str | None = None) -> list[Path]:
+    """Lists root directories of projects to check."""
+    # Reason: To import discovery only when projects are checked.
+    from pyvelocity.discovery import ProjectFinder  # noqa: PLC0415  pylint: disable=import-outside-toplevel
+
+    for root in roots:
+        if not root.is_dir():
+            msg = f"Directory {str(root)!r} does not exist."
+            raise click.BadParameter(msg, param_hint="'[ROOTS]...'")
+    list_root = list(roots) or [Path()]
+    list_project = (
+        [project for root in list_root for project in ProjectFinder(root).find()] if recursive else list_root
+    )
+    if not list_project:
+        msg = "No pyproject.toml found."
+        raise ClickException(msg)
+    if changed_since is None:
+        return list_project
+    return select_changed_projects(list_root, list_project, changed_since)
+
+
+def select_changed_projects(list_root: list[Path], list_project: list[Path], ref: str) -> list[Path]:
+    """Selects projects which own any file changed since the ref in order of projects."""
+    # Reason: To import Git only when --changed-since is specified.
+    from pyvelocity.discovery import ProjectIndex  # noqa: PLC0415  pylint: disable=import-outside-toplevel
+    from pyvelocity.git import Git  # noqa: PLC0415  pylint: disable=import-outside-toplevel
+    from pyvelocity.git import GitError  # noqa: PLC0415  pylint: disable=import-outside-toplevel
+
+    try:
+        changed_files = {path for root in list_root for path in Git(root).list_changed_files(ref)}
+    except GitError as error:
+        msg = f"Failed to list files changed since {ref}: {error}"
+        raise ClickException(msg) from error
+    selected = ProjectIndex(list_project).select(changed_files)
+    return [project for project in list_project if project in selected]
+
+
+def list_changed_files(
+    files: tuple[Path, ...],
+    *,
+    recursive: bool,
+    watch: bool,
+    changed_since: str | None,
+) -> tuple[list[Path], dict[Path, list[str]]]:
+    """Lists the project in current directory and changed files in it for --files."""
+    if recursive or watch or changed_since is not None:
+        msg = "--files can't be used with --recursive, --watch or --changed-since."
+        raise click.UsageError(msg)
+    return [Path()], {Path(): [str(file) for file in files]}
+
+
+@click.group(cls=MainGroup)
+@click.version_option(__version__, prog_name="pyvelocity")
 def main() -> None:
-    """Console script for pyvelocity."""
-    configuration_files = ConfigurationFiles()
-    configurations = Configurations(configuration_files)
-    results = Results(list(Checks(configuration_files, configurations).execute()))
-    if results.message:
-        click.echo(results.message)
-    if not results.is_ok:
-        exception = ClickException("Looks there are some of improvements.")
-        exception.exit_code = 3
-        raise exception
-    echo_success()
+    """Console script for pyvelocity.
+
+    Checks projects by default, see `pyvelocity check --help`.
+    """
+
+
+@main.command()
+@click.argument("roots", nargs=-1, type=click.Path(path_type=Path))
+@click.option(
+    "--recursive",
+    "-r",
+    is_flag=True,
+    help="Find every project which has pyproject.toml under ROOTS and check them.",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help="Number of worker processes to check projects. 0 means the number of CPUs.",
+)
+@click.option(
+    "--threads",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of threads to execute checks concurrently in each project.",
+)
+@click.option("--fail-fast", is_flag=True, help="Stop at the first failing check.")
+@click.option(
+    "--time-budget",
+    callback=convert_duration,
+    help="Skip expensive checks which would exceed the duration for each project, e.g. 200ms.",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice([FORMAT_TEXT, FORMAT_NDJSON]),
+    default=FORMAT_TEXT,
+    show_default=True,
+    help="Output format. ndjson writes a line of JSON for each check as soon as it completes.",
+)
+@click.option(
+    "--cache/--no-cache",
+    default=False,
+    show_default=True,
+    help="Reuse results of checks whose inputs are unchanged from .pyvelocity_cache/ directory in each project.",
+)
+@click.option(
+    "--watch",
+    is_flag=True,
+    help="Keep checking whenever inputs of checks change, re-evaluating only affected checks. Stop by Ctrl+C.",
+)
+@click.option(
+    "--files",
+    "is_files",
+    is_flag=True,
+    help=(
+        "Treat ROOTS as changed files relative to the project in current directory"
+        " and execute only checks whose inputs are in them, e.g. pass_filenames of pre-commit."
+    ),
+)
+@click.option(
+    "--changed-since",
+    metavar="REF",
+    help="Check only projects which own files changed since the Git ref, e.g. origin/main.",
+)
+@click.option(
+    "--archive",
+    is_flag=True,
+    help=(
+        "Treat ROOTS as source distributions (.tar.gz) and wheels (.whl)"
+        " and check their metadata without extracting them: classifiers, requires-python, keywords and typed."
+    ),
+)
+@click.option(
+    "--stats",
+    is_flag=True,
+    expose_value=False,
+    callback=report_syscalls,
+    help=(
+        "Report the number of system calls to access files of projects to stderr,"
+        " which are network round trips on NFS. Worker processes of --jobs are not counted."
+    ),
+)
+# Reason: Options of command. pylint: disable-next=too-many-arguments
+def check(  # noqa: PLR0913
+    roots: tuple[Path, ...],
+    *,
+    recursive: bool,
+    jobs: int,
+    threads: int,
+    fail_fast: bool,
+    time_budget: float | None,
+    output_format: str,
+    cache: bool,
+    watch: bool,
+    is_files: bool,
+    changed_since: str | None,
+    archive: bool,
+) -> None:
+    """Checks projects in ROOTS. Checks current directory when no ROOTS is specified."""
+    if archive:
+        is_exclusive = not (recursive or watch or is_files or changed_since is not None)
+        check_archives(roots, output_format=output_format, fail_fast=fail_fast, is_exclusive=is_exclusive)
+        return
+    list_root, files = (
+        list_changed_files(roots, recursive=recursive, watch=watch, changed_since=changed_since)
+        if is_files
+        else (list_roots(roots, recursive=recursive, changed_since=changed_since), None)
+    )
+    if watch:
+        # Reason: To import watcher only when --watch is specified.
+        from pyvelocity.watch import Watcher  # noqa: PLC0415  pylint: disable=import-outside-toplevel
+
+        watch_projects(Watcher(list_root, threads=threads, time_budget=time_budget), is_multiple=len(list_root) > 1)
+        return
+    is_ok = execute_projects(
+        list_root,
+        output_format=output_format,
+        jobs=jobs,
+        threads=threads,
+        fail_fast=fail_fast,
+        time_budget=time_budget,
+        cache=cache,
+        files=files,
+    )
+    if not is_ok:
+        raise_improvements()
+    if output_format == FORMAT_TEXT:
+        echo_success()
+
+
+# Reason: Options of command. pylint: disable-next=too-many-arguments
+def execute_projects(  # noqa: PLR0913
+    list_root: list[Path],
+    *,
+    output_format: str,
+    jobs: int,
+    threads: int,
+    fail_fast: bool,
+    time_budget: float | None,
+    cache: bool,
+    files: dict[Path, list[str]] | None,
+) -> bool:
+    """Checks projects, echos results in the format and returns whether all of them are ok."""
+    # Reason: To import checks only when projects are checked.
+    from pyvelocity.pyvelocity import check_projects  # noqa: PLC0415  pylint: disable=import-outside-toplevel
+    from pyvelocity.pyvelocity import stream_projects  # noqa: PLC0415  pylint: disable=import-outside-toplevel
+
+    if output_format == FORMAT_NDJSON:
+        stream = stream_projects(
+            list_root,
+            jobs=jobs,
+            threads=threads,
+            time_budget=time_budget,
+            cache=cache,
+            files=files,
+        )
+        # To cancel checks not yet executed when fail fast.
+        with closing(stream):
+            return echo_ndjson(stream, fail_fast=fail_fast)
+    list_results = check_projects(
+        list_root,
+        jobs=jobs,
+        threads=threads,
+        fail_fast=fail_fast,
+        time_budget=time_budget,
+        cache=cache,
+        files=files,
+    )
+    # To cancel projects not yet checked when fail fast.
+    with closing(list_results):
+        return echo_results(list_root, list_results, fail_fast=fail_fast)
+
+
+def check_archives(archives: tuple[Path, ...], *, output_format: str, fail_fast: bool, is_exclusive: bool) -> None:
+    """Checks metadata of source distributions and wheels in the archives without extracting them."""
+    # Reason: To import parsers of archives only when --archive is specified.
+    from pyvelocity.archives import UnsupportedArchiveError  # noqa: PLC0415  pylint: disable=import-outside-toplevel
+
+    validate_archives(archives, is_exclusive=is_exclusive)
+    try:
+        is_ok = echo_archives(archives, output_format=output_format, fail_fast=fail_fast)
+    except (UnsupportedArchiveError, OSError) as error:
+        raise ClickException(str(error)) from error
+    if not is_ok:
+        raise_improvements()
+    if output_format == FORMAT_TEXT:
+        echo_success()
+
+
+def validate_archives(archives: tuple[Path, ...], *, is_exclusive: bool) -> None:
+    if not is_exclusive:
+        msg = "--archive can't be used with --recursive, --watch, --files or --changed-since."
+        raise click.UsageError(msg)
+    for archive in archives:
+        if not archive.is_file():
+            msg = f"File {str(archive)!r} does not exist."
+            raise click.BadParameter(msg, param_hint="'[ROOTS]...'")
+
+
+def echo_archives(archives: tuple[Path, ...], *, output_format: str, fail_fast: bool) -> bool:
+    """Echos results of archives in the format and returns whether all of them are ok."""
+    # Reason: To import parsers of archives only when --archive is specified.
+    from pyvelocity.archives import check_archive  # noqa: PLC0415  pylint: disable=import-outside-toplevel
+
+    if output_format == FORMAT_NDJSON:
+        stream = ((archive, result) for archive in archives for result in check_archive(archive).results)
+        return echo_ndjson(stream, fail_fast=fail_fast)
+    return echo_results(list(archives), (check_archive(archive) for archive in archives), fail_fast=fail_fast)
+
+
+def raise_improvements() -> NoReturn:
+    """Exits with status code 3 which means checks found improvements."""
+    exception = ClickException("Looks there are some of improvements.")
+    exception.exit_code = 3
+    raise exception
+
+
+def echo_revision(revision: str, results: Results | None, *, output_format: str) -> bool:
+    """Echos results of the revision and returns whether all of them are ok."""
+    if results is None:
+        if output_format == FORMAT_NDJSON:
+            click.echo(json.dumps({"revision": revision, "error": "not found"}))
+        else:
+            click.echo(f"Error: Project not found in revision: {revision}", err=True)
+        return False
+    if output_format == FORMAT_NDJSON:
+        for result in results.results:
+            line = {"revision": revision, "id": result.id, "is_ok": result.is_ok, "message": result.message}
+            click.echo(json.dumps(line))
+    else:
+        click.echo(f"{revision}:")
+        click.echo(results.message or "OK")
+    return results.is_ok
+
+
+@main.command()
+@click.argument("list_revision", metavar="[REVISIONS]...", nargs=-1)
+@click.option(
+    "--repository",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    default=Path(),
+    help="Git repository, which may be bare. Current directory by default.",
+)
+@click.option("--directory", default="", help="Directory of the project in the repository. Root by default.")
+@click.option("--tags", is_flag=True, help="Check every tag in order of creation date after REVISIONS.")
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice([FORMAT_TEXT, FORMAT_NDJSON]),
+    default=FORMAT_TEXT,
+    show_default=True,
+    help="Output format. ndjson writes a line of JSON for each check of each revision.",
+)
+def revisions(
+    list_revision: tuple[str, ...],
+    *,
+    repository: Path,
+    directory: str,
+    tags: bool,
+    output_format: str,
+) -> None:
+    """Checks the project in REVISIONS, e.g. commits and tags, read from Git object database without checkout."""
+    # Reason: To import Git and checks only when revisions are checked.
+    from pyvelocity.git import Git  # noqa: PLC0415  pylint: disable=import-outside-toplevel
+    from pyvelocity.git import GitError  # noqa: PLC0415  pylint: disable=import-outside-toplevel
+    from pyvelocity.revisions import check_revisions  # noqa: PLC0415  pylint: disable=import-outside-toplevel
+
+    try:
+        all_revisions = [*list_revision, *(Git(repository).list_tags() if tags else [])]
+        is_ok = True
+        for revision, results in check_revisions(repository, all_revisions, directory=directory):
+            is_ok = echo_revision(revision, results, output_format=output_format) and is_ok
+    except GitError as error:
+        raise ClickException(str(error)) from error
+    if not is_ok:
+        raise_improvements()
+
+
+@main.group()
+def daemon() -> None:
+    """Manages the daemon which keeps warm interpreter to respond quickly.
+
+    While the daemon is running, pyvelocity forwards commands to it.
+    """
+
+
+def ping(client: Client) -> dict[str, Any] | None:
+    """Returns the response of the daemon or None when it isn't running."""
+    try:
+        return client.send(COMMAND_PING)
+    except DaemonUnavailableError:
+        return None
+
+
+def wait_for_daemon(client: Client, process: subprocess.Popen[bytes]) -> None:
+    """Waits until the daemon starts to accept requests."""
+    deadline = time.monotonic() + TIMEOUT_START_DAEMON
+    while ping(client) is None:
+        if process.poll() is not None or time.monotonic() > deadline:
+            msg = "Failed to start daemon."
+            raise ClickException(msg)
+        time.sleep(INTERVAL_POLL_DAEMON)
+
+
+@daemon.command()
+@click.option("--foreground", is_flag=True, help="Serve in this process instead of background process.")
+def start(*, foreground: bool) -> None:
+    """Starts the daemon."""
+    client = Client(get_socket_path())
+    if ping(client) is not None:
+        msg = f"Daemon is already running: {client.path}"
+        raise ClickException(msg)
+    if foreground:
+        # Reason: Daemon imports checks to warm them up.
+        from pyvelocity.daemon import Daemon  # noqa: PLC0415  pylint: disable=import-outside-toplevel
+
+        try:
+            Daemon(client.path, main).serve_forever()
+        except DaemonUnavailableError as error:
+            raise ClickException(str(error)) from error
+        return
+    # Reason: Accept risk of using subprocess since it executes this package by the same interpreter.
+    process = subprocess.Popen(  # nosec B603
+        [sys.executable, "-m", "pyvelocity", "daemon", "start", "--foreground"],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        # To keep running after the terminal is closed.
+        start_new_session=True,
+    )
+    wait_for_daemon(client, process)
+    click.echo(f"Daemon started: {client.path}")
+
+
+@daemon.command()
+def stop() -> None:
+    """Stops the daemon."""
+    try:
+        Client(get_socket_path()).send(COMMAND_STOP)
+    except DaemonUnavailableError as error:
+        msg = "Daemon is not running."
+        raise ClickException(msg) from error
+    click.echo("Daemon stopped.")
+
+
+@daemon.command()
+def status() -> None:
+    """Shows whether the daemon is running."""
+    client = Client(get_socket_path())
+    response = ping(client)
+    if response is None:
+        msg = "Daemon is not running."
+        raise ClickException(msg)
+    click.echo(f"Daemon is running: pid {response['pid']}, version {response['version']}, {client.path}")
@@ -0,0 +1,184 @@
+"""Implements entry point which forwards the command to the daemon when it's running.
+
+This module imports only standard libraries which are fast to import,
+since skipping cold import of click, TOML parser and setuptools is the purpose of the daemon.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import stat
+import sys
+import tempfile
+from contextlib import suppress
+from pathlib import Path
+from typing import IO
+from typing import Any
+
+from pyvelocity import __version__
+
+ENVIRONMENT_VARIABLE_SOCKET = "PYVELOCITY_SOCKET"
+ENVIRONMENT_VARIABLE_RUNTIME_DIRECTORY = "XDG_RUNTIME_DIR"
+NAME_SOCKET = "pyvelocity.sock"
+COMMAND_DAEMON = "daemon"
+COMMAND_PING = "ping"
+COMMAND_STOP = "stop"
+# Options which keep the command running until interrupted, which would occupy the daemon serving one by one.
+OPTIONS_IN_PROCESS = frozenset({"--watch"})
+TIMEOUT_CONNECT = 0.5
+# The daemon serves one by one, so it may not accept the request in time while serving another client.
+TIMEOUT_ACCEPT = 1.0
+
+
+class DaemonUnavailableError(Exception):
+    """The daemon isn't running or can't handle the request."""
+
+
+def get_socket_path() -> Path:
+    """Path of Unix socket of the daemon in the runtime directory of the user, which is private for each user.
+
+    When there is no runtime directory, the daemon creates a directory only for the user in the temporary directory.
+    """
+    path = os.environ.get(ENVIRONMENT_VARIABLE_SOCKET)
+    if path:
+        return Path(path)
+    runtime_directory = os.environ.get(ENVIRONMENT_VARIABLE_RUNTIME_DIRECTORY)
+    if runtime_directory:
+        return Path(runtime_directory) / NAME_SOCKET
+    # Reason: os.getuid() doesn't exist on Windows, which doesn't reach here since it has no AF_UNIX.
+    return Path(tempfile.gettempdir()) / f"pyvelocity-{os.getuid()}" / NAME_SOCKET  # pylint: disable=no-member
+
+
+def verify_directory(directory: Path) -> None:
+    """Raises DaemonUnavailableError when other users can replace files in the directory.
+
+    Directory with sticky bit such as /tmp is safe since only the owner can remove or rename each file in it.
+    """
+    status = directory.stat()
+    is_writable_by_others = status.st_mode & (stat.S_IWGRP | stat.S_IWOTH) and not status.st_mode & stat.S_ISVTX
+    # Reason: os.getuid() doesn't exist on Windows, which doesn't reach here since it has no AF_UNIX.
+    if status.st_uid not in {os.getuid(), 0} or is_writable_by_others:  # pylint: disable=no-member
+        msg = f"Directory of socket is not private for the user: {directory}"
+        raise DaemonUnavailableError(msg)
+
+
+def verify_socket(path: Path) -> None:
+    """Raises DaemonUnavailableError unless the socket is created by the user, not to trust other users' daemon."""
+    try:
+        verify_directory(path.parent)
+        status = path.lstat()
+    except OSError as error:
+        raise DaemonUnavailableError(str(error)) from error
+    # Reason: os.getuid() doesn't exist on Windows, which doesn't reach here since it has no AF_UNIX.
+    if not stat.S_ISSOCK(status.st_mode) or status.st_uid != os.getuid():  # pylint: disable=no-member
+        msg = f"Socket is not created by the user: {path}"
+        raise DaemonUnavailableError(msg)
+
+
+def is_in_process(argv: list[str]) -> bool:
+    """Whether the command is executed in the process of the client instead of the daemon."""
+    return argv[:1] == [COMMAND_DAEMON] or not OPTIONS_IN_PROCESS.isdisjoint(argv)
+
+
+def write_message(file: IO[str], message: dict[str, Any]) -> None:
+    """Writes message as a line of JSON."""
+    file.write(json.dumps(message) + "\n")
+    file.flush()
+
+
+def read_message(file: IO[str]) -> dict[str, Any]:
+    """Reads message written by write_message()."""
+    line = file.readline()
+    if not line:
+        msg = "Connection closed."
+        raise ConnectionError(msg)
+    message: dict[str, Any] = json.loads(line)
+    return message
+
+
+class Client:
+    """Client of the daemon over Unix socket."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def request(self, message: dict[str, Any]) -> tuple[socket.socket, IO[str]]:
+        """Sends the request and returns the connection to read responses."""
+        if not hasattr(socket, "AF_UNIX"):
+            msg = "Unix socket is not available on this platform."
+            raise DaemonUnavailableError(msg)
+        verify_socket(self.path)
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)  # pylint: disable=no-member
+        try:
+            connection.settimeout(TIMEOUT_CONNECT)
+            connection.connect(str(self.path))
+            # Busy or hung daemon doesn't respond in time, responses after acceptance may take long time.
+            connection.settimeout(TIMEOUT_ACCEPT)
+            file = connection.makefile("rw", encoding="utf-8")
+            write_message(file, {"version": __version__, **message})
+        except OSError as error:
+            connection.close()
+            raise DaemonUnavailableError(str(error)) from error
+        return connection, file
+
+    def forward(self, argv: list[str]) -> int:
+        """Executes the command in the daemon, echos its output and returns the exit code."""
+        connection, file = self.request({"argv": argv, "cwd": str(Path.cwd())})
+        with connection, file:
+            # Failure before acceptance falls back to execute in this process.
+            self._read_response(file, is_output=False)
+            # Checking many projects may take long time.
+            connection.settimeout(None)
+            is_output = False
+            while True:
+                message = self._read_response(file, is_output=is_output)
+                self._echo(message)
+                if "exit_code" in message:
+                    return int(message["exit_code"])
+                is_output = True
+
+    def send(self, command: str) -> dict[str, Any]:
+        """Sends the command to control the daemon and returns its response."""
+        connection, file = self.request({"command": command})
+        with connection, file:
+            try:
+                return read_message(file)
+            except (OSError, ValueError) as error:
+                raise DaemonUnavailableError(str(error)) from error
+
+    @staticmethod
+    def _read_response(file: IO[str], *, is_output: bool) -> dict[str, Any]:
+        """Reads response. Before any output, failure falls back to execute in this process."""
+        try:
+            message = read_message(file)
+        except (OSError, ValueError) as error:
+            if not is_output:
+                raise DaemonUnavailableError(str(error)) from error
+            return {"stderr": f"Error: Daemon disconnected: {error}\n", "exit_code": 1}
+        if "error" in message:
+            raise DaemonUnavailableError(message["error"])
+        return message
+
+    @staticmethod
+    def _echo(message: dict[str, str]) -> None:
+        for name, stream in (("stdout", sys.stdout), ("stderr", sys.stderr)):
+            if name in message:
+                stream.write(message[name])
+                stream.flush()
+
+
+def main() -> None:
+    """Console script for pyvelocity.
+
+    Forwards the command to the daemon when it's running, otherwise executes it in this process.
+    """
+    argv = sys.argv[1:]
+    if not is_in_process(argv):
+        with suppress(DaemonUnavailableError):
+            sys.exit(Client(get_socket_path()).forward(argv))
+    # Reason: To import click and checks only when the daemon isn't running.
+    from pyvelocity.cli import main as main_cli  # noqa: PLC0415  pylint: disable=import-outside-toplevel
+
+    main_cli()
@@ -1,5 +1,7 @@
 """Implements aggregation of tools."""
 
+from functools import cached_property
+
 from pyvelocity.configurations.files.aggregation import ConfigurationFiles
 from pyvelocity.configurations.tools.black import Black
 from pyvelocity.configurations.tools.docformatter import Docformatter
@@ -10,15 +12,40 @@ from pyvelocity.configurations.tools.pyvelocity import Pyvelocity
 from pyvelocity.configurations.tools.ruff import Ruff
 
 
-# Reason: Aggregation class. pylint: disable=too-few-public-methods
 class Configurations:
-    """Aggregation of tools."""
+    """Aggregation of tools.
+
+    Each tool is resolved on first access and then reused,
+    so tools which no enabled check reads, e.g. when line-length is filtered out, are never resolved.
+    """
 
     def __init__(self, configuration_files: ConfigurationFiles) -> None:
-        self.black = Black(configuration_files)
-        self.docformatter = Docformatter(configuration_files)
-        self.flake8 = Flake8(configuration_files)
-        self.isort = Isort(configuration_files)
-        self.pylint = Pylint(configuration_files)
-        self.pyvelocity = Pyvelocity(configuration_files)
-        self.ruff = Ruff(configuration_files)
+        self.configuration_files = configuration_files
+
+    @cached_property
+    def black(self) -> Black:
+        return Black(self.configuration_files)
+
+    @cached_property
+    def docformatter(self) -> Docformatter:
+        return Docformatter(self.configuration_files)
+
+    @cached_property
+    def flake8(self) -> Flake8:
+        return Flake8(self.configuration_files)
+
+    @cached_property
+    def isort(self) -> Isort:
+        return Isort(self.configuration_files)
+
+    @cached_property
+    def pylint(self) -> Pylint:
+        return Pylint(self.configuration_files)
+
+    @cached_property
+    def pyvelocity(self) -> Pyvelocity:
+        return Pyvelocity(self.configuration_files)
+
+    @cached_property
+    def ruff(self) -> Ruff:
+        return Ruff(self.configuration_files)
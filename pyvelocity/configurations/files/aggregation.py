@@ -1,13 +1,230 @@
 """Implements aggregation of configuration files."""
 
+from __future__ import annotations
+
+import warnings
+from fnmatch import fnmatchcase
+from functools import cached_property
 from pathlib import Path
+from pathlib import PurePath
+from pathlib import PurePosixPath
+from typing import TYPE_CHECKING
+from typing import Any
 
+from pyvelocity.configurations.files import toml_backend
+from pyvelocity.configurations.files.memo import PARSED_FILES
 from pyvelocity.configurations.files.py_project_toml import WHERE_PY_PROJECT_TOML
 from pyvelocity.configurations.files.py_project_toml import PyProjectToml
+from pyvelocity.configurations.files.readme import DEFAULT_SCAN_LIMIT
+from pyvelocity.configurations.files.readme import WHERE_README_MD
+from pyvelocity.configurations.files.readme import ReadMe
+from pyvelocity.configurations.files.snapshot import Snapshot
+from pyvelocity.facts import Facts
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from setuptools.dist import Distribution
+
+    from pyvelocity.cache import ParsedFileCache
+
+NAME_SRC = "src"
+WHERE_SETUP_CFG = "setup.cfg"
+NAME_INIT = "__init__.py"
 
 
-# Reason: Aggregation class. pylint: disable=too-few-public-methods
 class ConfigurationFiles:
-    def __init__(self) -> None:
-        path_py_project_toml = Path(WHERE_PY_PROJECT_TOML)
-        self.py_project_toml = PyProjectToml(path_py_project_toml) if path_py_project_toml.exists() else None
+    """Configuration files of the project located at the root directory.
+
+    The root defaults to the current working directory.
+    Checks access files of the project only through this class, so that subclasses can provide them from elsewhere.
+    Files are accessed through the snapshot, which can be shared with the cache of results in the same run.
+    When the on-disk cache of parsed files is given, unchanged pyproject.toml isn't parsed again.
+    """
+
+    def __init__(
+        self,
+        root: Path | None = None,
+        *,
+        snapshot: Snapshot | None = None,
+        parsed_files: ParsedFileCache | None = None,
+    ) -> None:
+        self.root = Path() if root is None else root
+        self.snapshot = Snapshot(self.root) if snapshot is None else snapshot
+        self.parsed_files = parsed_files
+        self.py_project_toml = self.read_py_project_toml()
+
+    @cached_property
+    def facts(self) -> Facts:
+        """Memoized facts derived from configuration files of the project."""
+        return Facts(self)
+
+    def read_py_project_toml(self) -> PyProjectToml | None:
+        """pyproject.toml in the root. None when it doesn't exist."""
+        if not self.exists(WHERE_PY_PROJECT_TOML):
+            return None
+        if self.parsed_files is None:
+            return PARSED_FILES.get(PyProjectToml.from_bytes, self.snapshot, WHERE_PY_PROJECT_TOML)
+        return PyProjectToml.from_mapping(self._load_py_project_toml(self.parsed_files))
+
+    def _load_py_project_toml(self, parsed_files: ParsedFileCache) -> dict[str, Any]:
+        """Parsed pyproject.toml from the on-disk cache, parses and caches it when it changed."""
+        path = self.root / WHERE_PY_PROJECT_TOML
+        stat = self.snapshot.stat(WHERE_PY_PROJECT_TOML)
+        parsed = None if stat is None else parsed_files.get(path, stat)
+        if parsed is None:
+            parsed = toml_backend.loads(self.snapshot.read_text(WHERE_PY_PROJECT_TOML))
+            if stat is not None:
+                parsed_files.put(path, stat, parsed)
+        return parsed
+
+    def read_readme(self) -> ReadMe | None:
+        """Head of README.md in the root up to the scan limit. None when it doesn't exist."""
+        if not self.exists(WHERE_README_MD):
+            return None
+        return PARSED_FILES.get(ReadMe.from_bytes, self.snapshot, WHERE_README_MD, size=self.readme_scan_limit)
+
+    @property
+    def readme_scan_limit(self) -> int:
+        """Bytes at the top of README.md to scan for badges, configured by readme-scan-kib in [tool.pyvelocity]."""
+        section = None if self.py_project_toml is None else self.py_project_toml.pyvelocity
+        kib = None if section is None else section.readme_scan_kib.value
+        # Since bool is also int, true isn't taken as 1 KiB.
+        return kib * 1024 if isinstance(kib, int) and not isinstance(kib, bool) and kib > 0 else DEFAULT_SCAN_LIMIT
+
+    def exists(self, name: str | PurePath) -> bool:
+        """Whether the file relative to the root exists."""
+        return self.snapshot.exists(name)
+
+    def discover_packages(self) -> Distribution:
+        """Packages configured in setup.cfg and pyproject.toml, or discovered by setuptools automatic discovery.
+
+        Explicit packages, package-dir and packages.find are respected as same as setuptools builds the project.
+        Setuptools resolves the layout against `src_root` and paths in configuration files against their directory,
+        so the current working directory doesn't matter.
+        """
+        # Reason: Setuptools takes most of startup time, so it's imported only when packages are discovered.
+        from setuptools.discovery import ConfigDiscovery  # noqa: PLC0415  pylint: disable=import-outside-toplevel
+        from setuptools.dist import Distribution  # noqa: PLC0415  pylint: disable=import-outside-toplevel
+
+        distribution = Distribution({"src_root": str(self.root)})
+        # Order of setuptools, pyproject.toml overrides setup.cfg.
+        names = [name for name in (WHERE_SETUP_CFG, WHERE_PY_PROJECT_TOML) if self.exists(name)]
+        # Warnings about configuration are for building, e.g. beta support of [tool.setuptools], not for checking.
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            distribution.parse_config_files(filenames=[str(self.root / name) for name in names])
+        ConfigDiscovery(distribution)()
+        return distribution
+
+
+class InMemoryConfigurationFiles(ConfigurationFiles):
+    """Files of the project given as contents in memory keyed by paths relative to the root, e.g. blobs.
+
+    Never touches the file system, so projects can be checked concurrently without writing them to disk.
+    The root is only used to label the project.
+    When pyproject.toml already parsed is given, it's used instead of the document, e.g. converted from metadata.
+    When the head of README.md is given as bytes, it's used instead of the document, e.g. read from an archive.
+    """
+
+    def __init__(
+        self,
+        documents: Mapping[str, str],
+        root: Path | None = None,
+        *,
+        parsed_py_project_toml: Mapping[str, Any] | None = None,
+        readme_head: bytes | None = None,
+    ) -> None:
+        self.documents = {PurePosixPath(name).as_posix(): content for name, content in documents.items()}
+        if readme_head is not None:
+            self.documents.setdefault(WHERE_README_MD, "")
+        self.parsed_py_project_toml = parsed_py_project_toml
+        self.readme_head = readme_head
+        super().__init__(root)
+
+    def read_py_project_toml(self) -> PyProjectToml | None:
+        if self.parsed_py_project_toml is not None:
+            return PyProjectToml.from_mapping(self.parsed_py_project_toml)
+        content = self.documents.get(WHERE_PY_PROJECT_TOML)
+        return None if content is None else PyProjectToml.from_string(content)
+
+    def read_readme(self) -> ReadMe | None:
+        content = self.readme_head if self.readme_head is not None else self.documents.get(WHERE_README_MD)
+        return None if content is None else ReadMe(content=content, limit=self.readme_scan_limit)
+
+    def exists(self, name: str | PurePath) -> bool:
+        return PurePosixPath(name).as_posix() in self.documents
+
+    def discover_packages(self) -> Distribution:
+        """Packages configured in [tool.setuptools] of pyproject.toml, otherwise discovered in the documents.
+
+        Covers explicit packages, package-dir and packages.find of pyproject.toml,
+        and src-layout and flat-layout of setuptools automatic discovery except namespace packages.
+        Legacy setup.cfg isn't parsed.
+        """
+        # Reason: Setuptools takes most of startup time, so it's imported only when packages are discovered.
+        from setuptools.dist import Distribution  # noqa: PLC0415  pylint: disable=import-outside-toplevel
+
+        setuptools = None if self.py_project_toml is None else self.py_project_toml.setuptools
+        packages = None if setuptools is None else setuptools.packages.value
+        if isinstance(packages, list):
+            package_dir = None if setuptools is None else setuptools.package_dir.value
+            return Distribution(
+                {"packages": packages, "package_dir": package_dir if isinstance(package_dir, dict) else {}},
+            )
+        if isinstance(packages, dict) and isinstance(packages.get("find"), dict):
+            return self._find_packages(packages["find"])
+        return self._discover_by_layout()
+
+    def _find_packages(self, find: Mapping[str, Any]) -> Distribution:
+        """Packages found as same as packages.find of setuptools, which includes namespace packages by default."""
+        # Reason: Setuptools takes most of startup time, so it's imported only when packages are discovered.
+        from setuptools.dist import Distribution  # noqa: PLC0415  pylint: disable=import-outside-toplevel
+
+        include = find.get("include", ["*"])
+        exclude = find.get("exclude", [])
+        wheres = [PurePosixPath(where) for where in find.get("where", ["."])]
+        packages: list[str] = []
+        package_dir: dict[str, str] = {}
+        for base in wheres:
+            found = [
+                package
+                for package in self._list_packages(base, namespaces=find.get("namespaces", True))
+                if any(fnmatchcase(package, pattern) for pattern in include)
+                and not any(fnmatchcase(package, pattern) for pattern in exclude)
+            ]
+            packages.extend(found)
+            if base.parts and len(wheres) > 1:
+                package_dir.update({package: (base / package).as_posix() for package in found if "." not in package})
+        # Same as setuptools, a single directory is mapped as the root of packages.
+        if len(wheres) == 1 and wheres[0].parts:
+            package_dir[""] = wheres[0].as_posix()
+        return Distribution({"packages": packages, "package_dir": package_dir})
+
+    def _discover_by_layout(self) -> Distribution:
+        """Directories which have __init__.py in src directory when it exists, otherwise in the root."""
+        # Reason: Setuptools takes most of startup time, so it's imported only when packages are discovered.
+        from setuptools.discovery import FlatLayoutPackageFinder  # noqa: PLC0415  pylint: disable=import-outside-toplevel
+        from setuptools.dist import Distribution  # noqa: PLC0415  pylint: disable=import-outside-toplevel
+
+        paths = [PurePosixPath(name) for name in self.documents]
+        is_src_layout = any(len(path.parts) > 1 and path.parts[0] == NAME_SRC for path in paths)
+        packages = self._list_packages(PurePosixPath(NAME_SRC if is_src_layout else ""), namespaces=False)
+        if is_src_layout:
+            return Distribution({"packages": packages, "package_dir": {"": NAME_SRC}})
+        excluded = FlatLayoutPackageFinder.DEFAULT_EXCLUDE
+        return Distribution(
+            {"packages": [package for package in packages if not any(fnmatchcase(package, e) for e in excluded)]},
+        )
+
+    def _list_packages(self, base: PurePosixPath, *, namespaces: bool) -> list[str]:
+        """Dotted names of directories under the base which have __init__.py, or any directory for namespaces."""
+        directories = {
+            parent
+            for path in map(PurePosixPath, self.documents)
+            for parent in path.parents
+            if parent != base
+            and parent.is_relative_to(base)
+            and (namespaces or (path.parent == parent and path.name == NAME_INIT))
+        }
+        return sorted(".".join(directory.relative_to(base).parts) for directory in directories)
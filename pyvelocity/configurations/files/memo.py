@@ -0,0 +1,53 @@
+"""Implements memo of parsed configuration files shared across runs in the same process."""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import TypeVar
+from typing import cast
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from pyvelocity.configurations.files.snapshot import Snapshot
+
+T = TypeVar("T")
+
+
+class ParsedFiles:
+    """Parsed configuration files memoized while their mtime and size are unchanged.
+
+    Disabled by default since one-shot run parses each file only once.
+    The daemon enables it to reuse parsed files across requests.
+    """
+
+    def __init__(self) -> None:
+        self.is_enabled = False
+        self.entries: dict[tuple[Callable[[bytes], Any], Path, int | None], tuple[int, int, Any]] = {}
+        # Checks may be executed concurrently on threads.
+        self.lock = threading.Lock()
+
+    def get(self, parse: Callable[[bytes], T], snapshot: Snapshot, name: str, *, size: int | None = None) -> T:
+        """Returns the file in the snapshot parsed from its content by the function, parses it again only when it changed.
+
+        The snapshot provides status and content, so the file is stat-ed and read at most once in the run.
+        When the size is given, only the head of the file up to the size is parsed.
+        """
+        stat = snapshot.stat(name) if self.is_enabled else None
+        if stat is None:
+            return parse(snapshot.read_bytes(name, size))
+        key = (parse, (snapshot.root / name).absolute(), size)
+        with self.lock:
+            entry = self.entries.get(key)
+        if entry is not None and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cast("T", entry[2])
+        parsed = parse(snapshot.read_bytes(name, size))
+        with self.lock:
+            self.entries[key] = (stat.st_mtime_ns, stat.st_size, parsed)
+        return parsed
+
+
+PARSED_FILES = ParsedFiles()
@@ -1,44 +1,99 @@
 """Implements pyproject.toml."""
 
-from pathlib import Path
+from __future__ import annotations
 
-import tomli
+from functools import cached_property
+from typing import TYPE_CHECKING
+from typing import Any
 
 from pyvelocity.configurations.files import ConfigurationFile
+from pyvelocity.configurations.files import toml_backend
 from pyvelocity.configurations.files.sections.black import Black
 from pyvelocity.configurations.files.sections.docformatter import Docformatter
 from pyvelocity.configurations.files.sections.factory import PyProjectTomlSectionFactory
 from pyvelocity.configurations.files.sections.flake8 import Flake8
 from pyvelocity.configurations.files.sections.isort import Isort
 from pyvelocity.configurations.files.sections.project import Project
+from pyvelocity.configurations.files.sections.pylint import Pylint
 from pyvelocity.configurations.files.sections.pylint import PyProjectTomlPylintFactory
 from pyvelocity.configurations.files.sections.pyvelocity import Pyvelocity
 from pyvelocity.configurations.files.sections.ruff import Ruff
 from pyvelocity.configurations.files.sections.setuptools import Setuptools
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from pathlib import Path
+
 WHERE_PY_PROJECT_TOML = "pyproject.toml"
+NODE_TOOL = "tool"
 
 
-# Reason: Specification of pyproject.toml . pylint: disable=too-many-instance-attributes
 class PyProjectToml(ConfigurationFile):
     """pyproject.toml."""
 
-    def __init__(self, path_py_project_toml: Path) -> None:
+    def __init__(self, path_py_project_toml: Path | None = None, *, parsed_toml: dict[str, Any] | None = None) -> None:
+        """Parses the file at the path, or takes TOML already parsed, see from_string() and from_mapping()."""
         super().__init__()
-        parsed_toml = tomli.loads(path_py_project_toml.read_text(encoding="utf-8"))
-        node_tool = "tool"
-        tool = parsed_toml.get(node_tool, {})
-        self.black = PyProjectTomlSectionFactory.create(self, node_tool, Black, tool)
-        self.docformatter = PyProjectTomlSectionFactory.create(self, node_tool, Docformatter, tool)
-        self.flake8 = PyProjectTomlSectionFactory.create(self, node_tool, Flake8, tool)
-        self.isort = PyProjectTomlSectionFactory.create(self, node_tool, Isort, tool)
-        self.pylint = PyProjectTomlPylintFactory.create(self, node_tool, tool)
-        self.pyvelocity = PyProjectTomlSectionFactory.create(self, node_tool, Pyvelocity, tool)
-        self.ruff = PyProjectTomlSectionFactory.create(self, node_tool, Ruff, tool)
-        self.setuptools = PyProjectTomlSectionFactory.create(self, node_tool, Setuptools, tool)
-
-        # Project section is at root level, not under [tool]
-        self.project = PyProjectTomlSectionFactory.create(self, None, Project, parsed_toml)
+        if parsed_toml is None:
+            if path_py_project_toml is None:
+                msg = "Either path or parsed TOML is required."
+                raise TypeError(msg)
+            parsed_toml = toml_backend.loads(path_py_project_toml.read_text(encoding="utf-8"))
+        self.parsed_toml = parsed_toml
+        self.tool = parsed_toml.get(NODE_TOOL, {})
+
+    # Sections are built on first access, so only sections which enabled checks read are built.
+    @cached_property
+    def black(self) -> Black | None:
+        return PyProjectTomlSectionFactory.create(self, NODE_TOOL, Black, self.tool)
+
+    @cached_property
+    def docformatter(self) -> Docformatter | None:
+        return PyProjectTomlSectionFactory.create(self, NODE_TOOL, Docformatter, self.tool)
+
+    @cached_property
+    def flake8(self) -> Flake8 | None:
+        return PyProjectTomlSectionFactory.create(self, NODE_TOOL, Flake8, self.tool)
+
+    @cached_property
+    def isort(self) -> Isort | None:
+        return PyProjectTomlSectionFactory.create(self, NODE_TOOL, Isort, self.tool)
+
+    @cached_property
+    def pylint(self) -> Pylint | None:
+        return PyProjectTomlPylintFactory.create(self, NODE_TOOL, self.tool)
+
+    @cached_property
+    def pyvelocity(self) -> Pyvelocity | None:
+        return PyProjectTomlSectionFactory.create(self, NODE_TOOL, Pyvelocity, self.tool)
+
+    @cached_property
+    def ruff(self) -> Ruff | None:
+        return PyProjectTomlSectionFactory.create(self, NODE_TOOL, Ruff, self.tool)
+
+    @cached_property
+    def setuptools(self) -> Setuptools | None:
+        return PyProjectTomlSectionFactory.create(self, NODE_TOOL, Setuptools, self.tool)
+
+    @cached_property
+    def project(self) -> Project | None:
+        """Project section is at root level, not under [tool]."""
+        return PyProjectTomlSectionFactory.create(self, None, Project, self.parsed_toml)
+
+    @classmethod
+    def from_string(cls, text: str) -> PyProjectToml:
+        """Parses content of pyproject.toml given in memory."""
+        return cls(parsed_toml=toml_backend.loads(text))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> PyProjectToml:
+        """Parses content of pyproject.toml read as bytes."""
+        return cls.from_string(data.decode("utf-8"))
+
+    @classmethod
+    def from_mapping(cls, parsed_toml: Mapping[str, Any]) -> PyProjectToml:
+        """Takes pyproject.toml already parsed, e.g. by the caller's TOML parser."""
+        return cls(parsed_toml=dict(parsed_toml))
 
     @property
     def name(self) -> str:
@@ -1,7 +1,10 @@
 """Implements README.md file."""
 
+from __future__ import annotations
+
 import re
-from pathlib import Path
+from functools import cache
+from typing import TYPE_CHECKING
 
 from pyvelocity.configurations.files import ConfigurationFile
 from pyvelocity.regex.github import RegexPatternsGitHub
@@ -9,15 +12,67 @@ from pyvelocity.regex.pypi import RegexPatternsPyPI
 from pyvelocity.regex.qlty import RegexPatternsQlty
 from pyvelocity.regex.shieldsio import RegexPatternsShieldsIO
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 WHERE_README_MD = "README.md"
+# Badges are at the top, so only the head of README.md is scanned, e.g. generated README.md may be megabytes.
+DEFAULT_SCAN_LIMIT = 64 * 1024
+
+
+@cache
+def compile_badge_patterns() -> dict[str, re.Pattern[bytes]]:
+    """Compiles regex patterns of badges as bytes patterns only once per process, so README.md isn't decoded."""
+    patterns = {
+        "test": RegexPatternsGitHub.workflow_badge("Test"),
+        "codeql": RegexPatternsGitHub.workflow_badge("CodeQL"),
+        "coverage": RegexPatternsQlty.coverage_badge(),
+        "maintainability": RegexPatternsQlty.maintainability_badge(),
+        "dependabot": RegexPatternsGitHub.dependabot_badge(),
+        "python_versions": RegexPatternsPyPI.python_versions_badge(),
+        "social": RegexPatternsShieldsIO.x_badge(),
+    }
+    return {name: re.compile(pattern.encode()) for name, pattern in patterns.items()}
 
 
 class ReadMe(ConfigurationFile):
-    """README.md file."""
+    """README.md file.
+
+    Keeps only the head of the file up to the scan limit as bytes and searches badges in it without decoding.
+    """
 
-    def __init__(self, path_readme: Path) -> None:
+    def __init__(
+        self,
+        path_readme: Path | None = None,
+        *,
+        content: str | bytes | None = None,
+        limit: int = DEFAULT_SCAN_LIMIT,
+    ) -> None:
+        """Reads the head of the file at the path, or takes content already read, see from_string()."""
         super().__init__()
-        self.content = path_readme.read_text(encoding="utf-8") if path_readme.exists() else ""
+        if content is None:
+            content = b"" if path_readme is None or not path_readme.exists() else self._read_head(path_readme, limit)
+        self.data = (content.encode() if isinstance(content, str) else content)[:limit]
+
+    @classmethod
+    def from_string(cls, content: str) -> ReadMe:
+        """README.md whose content is given in memory."""
+        return cls(content=content)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> ReadMe:
+        """README.md whose head is given as bytes, e.g. read up to the scan limit."""
+        return cls(content=data)
+
+    @property
+    def content(self) -> str:
+        """Decoded head of the file, the last character may be replaced when a multibyte character is cut."""
+        return self.data.decode("utf-8", errors="replace")
+
+    @staticmethod
+    def _read_head(path_readme: Path, limit: int) -> bytes:
+        with path_readme.open("rb") as file:
+            return file.read(limit)
 
     @property
     def name(self) -> str:
@@ -25,32 +80,35 @@ class ReadMe(ConfigurationFile):
 
     def has_badge(self, badge_text: str) -> bool:
         """Check if README contains a specific badge text."""
-        return badge_text in self.content
+        return badge_text.encode() in self.data
 
     def has_test_badge(self) -> bool:
         """Check if README contains Test badge with strict markdown format."""
-        return bool(re.compile(RegexPatternsGitHub.workflow_badge("Test")).search(self.content))
+        return self._search("test")
 
     def has_codeql_badge(self) -> bool:
         """Check if README contains CodeQL badge with strict markdown format."""
-        return bool(re.compile(RegexPatternsGitHub.workflow_badge("CodeQL")).search(self.content))
+        return self._search("codeql")
 
     def has_coverage_badge(self) -> bool:
         """Check if README contains Code Coverage badge with strict markdown format."""
-        return bool(re.compile(RegexPatternsQlty.coverage_badge()).search(self.content))
+        return self._search("coverage")
 
     def has_maintainability_badge(self) -> bool:
         """Check if README contains Maintainability badge with strict markdown format."""
-        return bool(re.compile(RegexPatternsQlty.maintainability_badge()).search(self.content))
+        return self._search("maintainability")
 
     def has_dependabot_badge(self) -> bool:
         """Check if README contains Dependabot badge with strict markdown format."""
-        return bool(re.compile(RegexPatternsGitHub.dependabot_badge()).search(self.content))
+        return self._search("dependabot")
 
     def has_python_versions_badge(self) -> bool:
         """Check if README contains Python versions badge with strict markdown format."""
-        return bool(re.compile(RegexPatternsPyPI.python_versions_badge()).search(self.content))
+        return self._search("python_versions")
 
     def has_social_badge(self) -> bool:
         """Check if README contains social/sharing badge with strict markdown format."""
-        return bool(re.compile(RegexPatternsShieldsIO.x_badge()).search(self.content))
+        return self._search("social")
+
+    def _search(self, name: str) -> bool:
+        return bool(compile_badge_patterns()[name].search(self.data))
@@ -9,6 +9,7 @@ from typing import ClassVar
 from pyvelocity.configurations.files.sections import ConfigurationFileParameter
 from pyvelocity.configurations.files.sections import Section
 from pyvelocity.constants import LATEST_PYTHON_VERSION
+from pyvelocity.regex.markdown import RegexPatternsMarkDown
 
 
 class RequiresPythonAnalyzer:
@@ -30,21 +31,21 @@ class RequiresPythonAnalyzer:
 
     def handle_equals_or_greater_than(self) -> str | None:
         """Handle >= version specifications."""
-        ge_match = re.search(r">=(\d+)\.(\d+)", self.value)
+        ge_match = re.search(RegexPatternsMarkDown.GREATER_EQUAL_VERSION, self.value)
         if ge_match:
             return f"{ge_match.group(1)}.{ge_match.group(2)}"
         return None
 
     def handle_same_major_version(self) -> str | None:
         """Handle same major version specifications."""
-        compat_match = re.search(r"~=(\d+)\.(\d+)", self.value)
+        compat_match = re.search(RegexPatternsMarkDown.COMPATIBLE_RELEASE_VERSION, self.value)
         if compat_match:
             return f"{compat_match.group(1)}.{compat_match.group(2)}"
         return None
 
     def handle_exact_version_specifications(self) -> str | None:
         """Handle exact version specifications."""
-        exact_match = re.search(r"^(\d+)\.(\d+)$", self.value.strip())
+        exact_match = re.search(RegexPatternsMarkDown.EXACT_VERSION, self.value.strip())
         if exact_match:
             return f"{exact_match.group(1)}.{exact_match.group(2)}"
         return None
@@ -80,6 +81,10 @@ class RequiresPythonAnalyzer:
                 supported.add(version)
         return supported
 
+    def supports_latest_python(self) -> bool:
+        """Check if the requires-python specification supports the latest Python version."""
+        return self.version_satisfies_requirement(LATEST_PYTHON_VERSION, self.value)
+
     def version_satisfies_requirement(self, version: str, requirement: str) -> bool:
         """Check if a version satisfies the requires-python requirement."""
         major, minor = map(int, version.split("."))
@@ -92,7 +97,7 @@ class RequiresPythonAnalyzer:
 
     def _check_greater_equal_requirement(self, major: int, minor: int, requirement: str) -> bool:
         """Check if version satisfies >= requirement with optional upper bound."""
-        ge_match = re.search(r">=(\d+)\.(\d+)", requirement)
+        ge_match = re.search(RegexPatternsMarkDown.GREATER_EQUAL_VERSION, requirement)
         if not ge_match:
             return False
 
@@ -107,7 +112,7 @@ class RequiresPythonAnalyzer:
         if "<" not in requirement:
             return True
 
-        lt_match = re.search(r"<(\d+)\.(\d+)", requirement)
+        lt_match = re.search(RegexPatternsMarkDown.LESS_THAN_VERSION, requirement)
         if not lt_match:
             return True
 
@@ -116,7 +121,7 @@ class RequiresPythonAnalyzer:
 
     def _check_compatible_release_requirement(self, major: int, minor: int, requirement: str) -> bool:
         """Check if version satisfies ~= compatible release requirement."""
-        compat_match = re.search(r"~=(\d+)\.(\d+)", requirement)
+        compat_match = re.search(RegexPatternsMarkDown.COMPATIBLE_RELEASE_VERSION, requirement)
         if not compat_match:
             return False
 
@@ -125,7 +130,7 @@ class RequiresPythonAnalyzer:
 
     def _check_exact_version_requirement(self, major: int, minor: int, requirement: str) -> bool:
         """Check if version satisfies exact version requirement."""
-        exact_match = re.search(r"^(\d+)\.(\d+)$", requirement.strip())
+        exact_match = re.search(RegexPatternsMarkDown.EXACT_VERSION, requirement.strip())
         if not exact_match:
             return False
 
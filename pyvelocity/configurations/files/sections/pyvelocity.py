@@ -12,5 +12,6 @@ from pyvelocity.configurations.files.sections import Section
 @dataclass
 class Pyvelocity(Section):
     NAME: ClassVar[str] = "pyvelocity"
-    LIST_PARAMETER_NAME: ClassVar[list[str]] = ["filter"]
+    LIST_PARAMETER_NAME: ClassVar[list[str]] = ["filter", "readme-scan-kib"]
     filter: ConfigurationFileParameter[list[str] | None]
+    readme_scan_kib: ConfigurationFileParameter[int | None]
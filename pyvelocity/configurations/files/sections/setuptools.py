@@ -15,6 +15,9 @@ class Setuptools(Section):
     """Represents the [tool.setuptools] section in pyproject.toml configuration files."""
 
     NAME: ClassVar[str] = "setuptools"
-    LIST_PARAMETER_NAME: ClassVar[list[str]] = ["zip-safe", "package-data"]
+    LIST_PARAMETER_NAME: ClassVar[list[str]] = ["zip-safe", "package-data", "packages", "package-dir"]
     zip_safe: ConfigurationFileParameter[str | None]
     package_data: ConfigurationFileParameter[dict[str, Any] | None]
+    # List of packages, or table of find directive, e.g. {"find": {"where": ["src"]}}.
+    packages: ConfigurationFileParameter[list[str] | dict[str, Any] | None]
+    package_dir: ConfigurationFileParameter[dict[str, str] | None]
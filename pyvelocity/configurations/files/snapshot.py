@@ -0,0 +1,156 @@
+"""Implements snapshot of files of the project which a run touches."""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import Counter
+from pathlib import PurePath
+from pathlib import PurePosixPath
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+SYSCALL_SCANDIR = "scandir"
+SYSCALL_STAT = "stat"
+SYSCALL_READ = "read"
+
+
+class SyscallCounter:
+    """Number of system calls by snapshots in this process, e.g. to report them after the run."""
+
+    def __init__(self) -> None:
+        self.counts: Counter[str] = Counter()
+        self.lock = threading.Lock()
+
+    def add(self, syscall: str) -> None:
+        with self.lock:
+            self.counts[syscall] += 1
+
+    def clear(self) -> None:
+        with self.lock:
+            self.counts.clear()
+
+    def summarize(self) -> str:
+        with self.lock:
+            details = ", ".join(f"{syscall}: {count}" for syscall, count in sorted(self.counts.items()))
+            return f"{self.counts.total()} ({details})" if details else "0"
+
+
+SYSCALLS = SyscallCounter()
+
+
+class Snapshot:
+    """Memoized view of files of the project located at the root during a run.
+
+    Each directory is listed by os.scandir() at most once and existence of entries in it is answered from the listing,
+    so checks which look for several files, e.g. setup.py, setup.cfg and py.typed of each package,
+    don't pay for a stat each, which is a network round trip on NFS.
+    Each file is stat-ed and read at most once, or its head up to the size of each request.
+    Files changed during the run aren't reflected, create a new snapshot for the next run.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.listings: dict[str, dict[str, os.DirEntry[str]]] = {}
+        self.stats: dict[str, os.stat_result | None] = {}
+        self.contents: dict[str, bytes] = {}
+        self.heads: dict[tuple[str, int], bytes] = {}
+        self.syscalls: Counter[str] = Counter()
+        # Checks may be executed concurrently on threads.
+        self.lock = threading.RLock()
+
+    def prefetch(self, names: Iterable[str]) -> None:
+        """Lists directories which contain the files relative to the root in one batch before checks start."""
+        with self.lock:
+            for directory in {self._split(name)[0] for name in names}:
+                self._list(directory)
+
+    def exists(self, name: str | PurePath) -> bool:
+        """Whether the file or directory relative to the root exists."""
+        directory, base = self._split(name)
+        with self.lock:
+            entry = self._list(directory).get(base)
+            if entry is None:
+                return False
+            # Only broken symbolic link is listed but doesn't exist.
+            return not entry.is_symlink() or self.stat(name) is not None
+
+    def stat(self, name: str | PurePath) -> os.stat_result | None:
+        """Status of the file relative to the root following symbolic link. None when it doesn't exist."""
+        key = PurePosixPath(name).as_posix()
+        with self.lock:
+            if key not in self.stats:
+                self.stats[key] = self._stat(key)
+            return self.stats[key]
+
+    def read_bytes(self, name: str | PurePath, size: int | None = None) -> bytes:
+        """Content of the file relative to the root. Raises OSError as same as Path.read_bytes().
+
+        When the size is given, reads only the head up to the size, e.g. to bound memory for large files.
+        """
+        key = PurePosixPath(name).as_posix()
+        with self.lock:
+            if key in self.contents:
+                return self.contents[key][:size]
+            if size is None:
+                self.contents[key] = self._read(key, -1)
+                return self.contents[key]
+            if (key, size) not in self.heads:
+                self.heads[key, size] = self._read(key, size)
+            return self.heads[key, size]
+
+    def read_text(self, name: str | PurePath) -> str:
+        return self.read_bytes(name).decode("utf-8")
+
+    def _read(self, key: str, size: int) -> bytes:
+        if not self.exists(key):
+            msg = f"No such file: {self.root / key}"
+            raise FileNotFoundError(msg)
+        self._count(SYSCALL_READ)
+        with (self.root / key).open("rb") as file:
+            return file.read(size)
+
+    def _stat(self, key: str) -> os.stat_result | None:
+        directory, base = self._split(key)
+        entry = self._list(directory).get(base)
+        if entry is None:
+            return None
+        self._count(SYSCALL_STAT)
+        try:
+            return entry.stat()
+        except OSError:
+            return None
+
+    def _list(self, directory: str) -> dict[str, os.DirEntry[str]]:
+        """Entries of the directory relative to the root keyed by names, empty when it isn't a directory."""
+        if directory not in self.listings:
+            # Listing of parent directory tells whether it's a directory without a failing system call.
+            if directory and not self._is_directory(directory):
+                self.listings[directory] = {}
+                return self.listings[directory]
+            self._count(SYSCALL_SCANDIR)
+            try:
+                with os.scandir(self.root / directory) as iterator:
+                    self.listings[directory] = {entry.name: entry for entry in iterator}
+            except OSError:
+                self.listings[directory] = {}
+        return self.listings[directory]
+
+    def _is_directory(self, directory: str) -> bool:
+        parent, base = self._split(directory)
+        entry = self._list(parent).get(base)
+        return entry is not None and entry.is_dir()
+
+    def _count(self, syscall: str) -> None:
+        self.syscalls[syscall] += 1
+        SYSCALLS.add(syscall)
+
+    @staticmethod
+    def _split(name: str | PurePath) -> tuple[str, str]:
+        """Directory relative to the root and base name, directory is empty for files at the root."""
+        path = PurePosixPath(name)
+        directory = path.parent.as_posix()
+        return "" if directory == "." else directory, path.name
@@ -0,0 +1,67 @@
+"""Implements backends of TOML parsing.
+
+Standard library tomllib is preferred and tomli is the fallback on Python older than 3.11.
+A faster parser can be plugged in by the environment variable when it's installed, e.g. PYVELOCITY_TOML_BACKEND=rtoml.
+"""
+
+from __future__ import annotations
+
+import importlib
+import os
+from dataclasses import dataclass
+from functools import cache
+from typing import TYPE_CHECKING
+from typing import Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+ENVIRONMENT_VARIABLE_TOML_BACKEND = "PYVELOCITY_TOML_BACKEND"
+# Modules which provide loads() returning dict, only they can be selected by the environment variable.
+KNOWN_BACKENDS = ("rtoml", "tomllib", "tomli")
+DEFAULT_BACKENDS = ("tomllib", "tomli")
+
+
+@dataclass(frozen=True)
+class TomlBackend:
+    """Parser of TOML document."""
+
+    name: str
+    loads: Callable[[str], dict[str, Any]]
+
+
+def load_backend(name: str) -> TomlBackend | None:
+    """Imports the backend. None when it isn't installed."""
+    if name not in KNOWN_BACKENDS:
+        return None
+    try:
+        module = importlib.import_module(name)
+    except ImportError:
+        return None
+    return TomlBackend(name, module.loads)
+
+
+def list_available_backends() -> list[TomlBackend]:
+    """Backends installed in the environment, e.g. to compare them by benchmark."""
+    backends = (load_backend(name) for name in KNOWN_BACKENDS)
+    return [backend for backend in backends if backend is not None]
+
+
+@cache
+def get_backend() -> TomlBackend:
+    """Backend selected by the environment variable when it's installed, otherwise the first default one installed.
+
+    Imported only once per process on the first parse, so startup doesn't pay for it.
+    """
+    requested = os.environ.get(ENVIRONMENT_VARIABLE_TOML_BACKEND)
+    for name in (requested, *DEFAULT_BACKENDS) if requested else DEFAULT_BACKENDS:
+        backend = load_backend(name)
+        if backend is not None:
+            return backend
+    msg = "tomli is required on Python older than 3.11."
+    raise ModuleNotFoundError(msg)
+
+
+def loads(text: str) -> dict[str, Any]:
+    """Parses TOML document by the backend."""
+    return get_backend().loads(text)
@@ -0,0 +1,154 @@
+"""Implements daemon which keeps warm interpreter to respond to the thin client quickly."""
+
+from __future__ import annotations
+
+import io
+import os
+import socket
+import traceback
+from contextlib import redirect_stderr
+from contextlib import redirect_stdout
+from contextlib import suppress
+from pathlib import Path
+from typing import IO
+from typing import TYPE_CHECKING
+from typing import Any
+
+import click
+
+from pyvelocity import __version__
+from pyvelocity.client import COMMAND_PING
+from pyvelocity.client import COMMAND_STOP
+from pyvelocity.client import TIMEOUT_ACCEPT
+from pyvelocity.client import is_in_process
+from pyvelocity.client import read_message
+from pyvelocity.client import verify_directory
+from pyvelocity.client import verify_socket
+from pyvelocity.client import write_message
+from pyvelocity.configurations.files.memo import PARSED_FILES
+from pyvelocity.pyvelocity import warm_up
+
+if TYPE_CHECKING:
+    from typing_extensions import Buffer
+
+
+class WriterToClient(io.RawIOBase):
+    """Writer which sends each write to the client immediately to keep streaming output."""
+
+    def __init__(self, file: IO[str], name: str) -> None:
+        super().__init__()
+        self.file = file
+        self.name = name
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, buffer: Buffer) -> int:
+        data = bytes(buffer)
+        if data:
+            write_message(self.file, {self.name: data.decode("utf-8")})
+        return len(data)
+
+    @classmethod
+    def open_text(cls, file: IO[str], name: str) -> io.TextIOWrapper:
+        """Text stream which passes each write through to the client."""
+        return io.TextIOWrapper(cls(file, name), encoding="utf-8", write_through=True)
+
+
+class Daemon:
+    """Daemon which executes commands forwarded from the client one by one.
+
+    Modules are already imported, regex patterns are compiled and parsed configuration files are memoized
+    while their mtime and size are unchanged, so each command doesn't pay for cold start.
+    """
+
+    def __init__(self, path: Path, command: click.Command) -> None:
+        self.path = path
+        self.command = command
+        self.is_running = False
+
+    def serve_forever(self) -> None:
+        """Serves until stop command is received."""
+        warm_up()
+        PARSED_FILES.is_enabled = True
+        self.prepare()
+        # Reason: Windows doesn't reach here since the command checks AF_UNIX. pylint: disable-next=no-member
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+            server.bind(str(self.path))
+            # Since socket is private for the user.
+            self.path.chmod(0o600)
+            server.listen()
+            self.is_running = True
+            try:
+                while self.is_running:
+                    connection, _ = server.accept()
+                    # Client which doesn't send the request in time can't block other clients.
+                    connection.settimeout(TIMEOUT_ACCEPT)
+                    with connection, connection.makefile("rw", encoding="utf-8") as file:
+                        self.handle(connection, file)
+            finally:
+                self.path.unlink(missing_ok=True)
+
+    def prepare(self) -> None:
+        """Creates the directory only for the user and removes socket file of the user remaining."""
+        self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        verify_directory(self.path.parent)
+        # Socket file remains when the previous daemon was killed, file of other user must not be reused.
+        if self.path.exists() or self.path.is_symlink():
+            verify_socket(self.path)
+            self.path.unlink()
+
+    def handle(self, connection: socket.socket, file: IO[str]) -> None:
+        """Handles request from the client. Failure of communication only affects the request."""
+        with suppress(OSError, ValueError):
+            request = read_message(file)
+            connection.settimeout(None)
+            write_message(file, self.respond(request, file))
+
+    def respond(self, request: dict[str, Any], file: IO[str]) -> dict[str, Any]:
+        """Executes the request and returns the last response.
+
+        Commands to control the daemon are accepted from any version of client to stop outdated daemon.
+        """
+        command = request.get("command")
+        if command in {COMMAND_PING, COMMAND_STOP}:
+            self.is_running = command != COMMAND_STOP
+            return {"pid": os.getpid(), "version": __version__}
+        if request.get("version") != __version__:
+            return {"error": f"Daemon is running different version: {__version__}"}
+        if is_in_process(request["argv"]):
+            return {"error": "Command runs until interrupted, execute it in the process of the client."}
+        # So that the client knows the daemon isn't busy and waits for the result however long it takes.
+        write_message(file, {"accepted": True})
+        return {"exit_code": self.execute(request["argv"], request["cwd"], file)}
+
+    def execute(self, argv: list[str], cwd: str, file: IO[str]) -> int:
+        """Executes the command in the current directory of the client and streams its output."""
+        stdout = WriterToClient.open_text(file, "stdout")
+        stderr = WriterToClient.open_text(file, "stderr")
+        cwd_daemon = Path.cwd()
+        os.chdir(cwd)
+        try:
+            with redirect_stdout(stdout), redirect_stderr(stderr):
+                return self.invoke(argv, stderr)
+        finally:
+            os.chdir(cwd_daemon)
+
+    def invoke(self, argv: list[str], stderr: IO[str]) -> int:
+        """Invokes the command as same as standalone mode except exiting the process.
+
+        Unexpected error is reported to the client as traceback, so that a project can't stop the daemon.
+        """
+        try:
+            exit_code = self.command.main(argv, prog_name="pyvelocity", standalone_mode=False)
+        except click.ClickException as error:
+            error.show(file=stderr)
+            return error.exit_code
+        except click.Abort:
+            click.echo("Aborted!", file=stderr)
+            return 1
+        # Reason: Same as uncaught exception in process of the client. pylint: disable-next=broad-exception-caught
+        except Exception:  # noqa: BLE001
+            traceback.print_exc(file=stderr)
+            return 1
+        return exit_code if isinstance(exit_code, int) else 0
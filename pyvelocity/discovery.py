@@ -0,0 +1,194 @@
+"""Implements discovery of projects in directory tree."""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from typing import TYPE_CHECKING
+
+from pyvelocity.configurations.files.py_project_toml import WHERE_PY_PROJECT_TOML
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from collections.abc import Iterable
+    from pathlib import Path
+
+PRUNED_DIRECTORY_NAMES = frozenset(
+    {
+        ".git",
+        ".hg",
+        ".mypy_cache",
+        ".nox",
+        ".pytest_cache",
+        ".ruff_cache",
+        ".tox",
+        ".venv",
+        "__pycache__",
+        "build",
+        "node_modules",
+    },
+)
+WHERE_GITIGNORE = ".gitignore"
+
+
+@dataclass(frozen=True)
+class GitIgnorePattern:
+    """A pattern in .gitignore file.
+
+    Supports the subset of gitignore syntax which is enough to prune directories:
+    negation by leading "!", directory only pattern by trailing "/", anchored pattern by including "/",
+    pattern matching in all directories by leading "**/" and glob.
+    """
+
+    base: str
+    pattern: str
+    is_negation: bool
+    is_directory_only: bool
+    is_anchored: bool
+
+    @classmethod
+    def parse(cls, base: str, line: str) -> GitIgnorePattern | None:
+        """Parses line of .gitignore file placed at base directory relative to the root of walk."""
+        pattern = line.rstrip("\n").rstrip()
+        if not pattern or pattern.startswith("#"):
+            return None
+        is_negation = pattern.startswith("!")
+        pattern = pattern.removeprefix("!")
+        is_directory_only = pattern.endswith("/")
+        pattern = pattern.rstrip("/")
+        # Leading "**/" matches in all directories even when the rest includes "/".
+        is_anchored = not pattern.startswith("**/") and "/" in pattern
+        pattern = pattern.removeprefix("**/").lstrip("/")
+        if not pattern:
+            return None
+        return cls(base, pattern, is_negation, is_directory_only, is_anchored)
+
+    def matches(self, relative_path: str, *, is_directory: bool) -> bool:
+        """Returns whether the path relative to the root of walk matches this pattern."""
+        if self.is_directory_only and not is_directory:
+            return False
+        if self.base:
+            if not relative_path.startswith(self.base + "/"):
+                return False
+            relative_path = relative_path[len(self.base) + 1 :]
+        if self.is_anchored:
+            return fnmatchcase(relative_path, self.pattern)
+        # Unanchored pattern matches the same number of trailing segments of the path.
+        segments = self.pattern.count("/") + 1
+        return fnmatchcase("/".join(relative_path.split("/")[-segments:]), self.pattern)
+
+
+class GitIgnore:
+    """Accumulated patterns of .gitignore files from the root of walk to the current directory."""
+
+    def __init__(self, patterns: tuple[GitIgnorePattern, ...] = ()) -> None:
+        self.patterns = patterns
+
+    def extend(self, base: str, path_gitignore: Path) -> GitIgnore:
+        """Returns new instance which also includes patterns in .gitignore file placed at base directory."""
+        try:
+            lines = path_gitignore.read_text(encoding="utf-8").splitlines()
+        except (OSError, UnicodeDecodeError):
+            return self
+        patterns = (GitIgnorePattern.parse(base, line) for line in lines)
+        return GitIgnore(self.patterns + tuple(pattern for pattern in patterns if pattern is not None))
+
+    def is_ignored(self, relative_path: str, *, is_directory: bool) -> bool:
+        """The last matching pattern decides as same as Git."""
+        is_ignored = False
+        for pattern in self.patterns:
+            if pattern.matches(relative_path, is_directory=is_directory):
+                is_ignored = not pattern.is_negation
+        return is_ignored
+
+
+class ProjectFinder:
+    """Finds projects which have pyproject.toml under the directory.
+
+    Walks the tree by os.scandir() and prunes directories which never contain projects to check,
+    e.g. .git, .venv, node_modules, build and directories ignored by .gitignore files.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    def find(self) -> Generator[Path, None, None]:
+        """Yields root directories of projects in order of path."""
+        stack: list[tuple[str, GitIgnore]] = [("", GitIgnore())]
+        while stack:
+            relative_directory, git_ignore = stack.pop()
+            directory = self.root / relative_directory
+            try:
+                with os.scandir(directory) as iterator:
+                    entries = sorted(iterator, key=lambda entry: entry.name)
+            except OSError:
+                continue
+            names = {entry.name for entry in entries}
+            if WHERE_PY_PROJECT_TOML in names:
+                yield directory
+            if WHERE_GITIGNORE in names:
+                git_ignore = git_ignore.extend(relative_directory, directory / WHERE_GITIGNORE)
+            # Reversed since the stack pops the last one first.
+            stack.extend(
+                (relative_path, git_ignore)
+                for relative_path in reversed(self._list_sub_directory(relative_directory, entries, git_ignore))
+            )
+
+    @staticmethod
+    def _list_sub_directory(
+        relative_directory: str,
+        entries: list[os.DirEntry[str]],
+        git_ignore: GitIgnore,
+    ) -> list[str]:
+        """Lists sub directories to walk next except pruned ones."""
+        sub_directories = []
+        for entry in entries:
+            if entry.name in PRUNED_DIRECTORY_NAMES or not entry.is_dir(follow_symlinks=False):
+                continue
+            relative_path = f"{relative_directory}/{entry.name}" if relative_directory else entry.name
+            if git_ignore.is_ignored(relative_path, is_directory=True):
+                continue
+            sub_directories.append(relative_path)
+        return sub_directories
+
+
+class PrefixNode:
+    """Node of prefix index for a part of path."""
+
+    def __init__(self) -> None:
+        self.children: dict[str, PrefixNode] = {}
+        self.root: Path | None = None
+
+
+class ProjectIndex:
+    """Prefix index of root directories of projects to look up the project which owns a path.
+
+    Each lookup walks parts of the path once, regardless of the number of projects.
+    The deepest project owns the path when projects are nested.
+    """
+
+    def __init__(self, roots: Iterable[Path]) -> None:
+        self.tree = PrefixNode()
+        for root in roots:
+            node = self.tree
+            for part in root.resolve().parts:
+                node = node.children.setdefault(part, PrefixNode())
+            node.root = root
+
+    def find_owner(self, path: Path) -> Path | None:
+        """Returns the root of the project which contains the absolute path."""
+        owner = None
+        node = self.tree
+        for part in path.parts:
+            child = node.children.get(part)
+            if child is None:
+                break
+            node = child
+            owner = node.root or owner
+        return owner
+
+    def select(self, paths: Iterable[Path]) -> set[Path]:
+        """Roots of projects which own any of the absolute paths."""
+        owners = (self.find_owner(path) for path in paths)
+        return {owner for owner in owners if owner is not None}
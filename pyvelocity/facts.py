@@ -0,0 +1,101 @@
+"""Implements facts about the project shared by checks."""
+
+from __future__ import annotations
+
+import re
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyvelocity.configurations.files.sections.project import RequiresPythonAnalyzer
+from pyvelocity.regex.markdown import RegexPatternsMarkDown
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from setuptools.dist import Distribution
+
+    from pyvelocity.configurations.files.aggregation import ConfigurationFiles
+    from pyvelocity.configurations.files.py_project_toml import PyProjectToml
+    from pyvelocity.configurations.files.readme import ReadMe
+    from pyvelocity.configurations.files.sections.project import Project
+
+TYPING_CLASSIFIER = "Typing :: Typed"
+
+
+class ClassifierIndex:
+    """Index of classifiers to look up without walking the list each time."""
+
+    PATTERN_PYTHON_VERSION = re.compile(RegexPatternsMarkDown.PYTHON_VERSION_CLASSIFIER)
+
+    def __init__(self, classifiers: Iterable[str]) -> None:
+        self.classifiers = frozenset(classifier.strip() for classifier in classifiers)
+        self.python_versions = self._extract_python_versions()
+
+    def __contains__(self, classifier: str) -> bool:
+        return classifier in self.classifiers
+
+    def _extract_python_versions(self) -> set[str]:
+        """Extract Python versions from Programming Language :: Python :: X.Y classifiers."""
+        matches = (self.PATTERN_PYTHON_VERSION.match(classifier) for classifier in self.classifiers)
+        return {match.group(1) for match in matches if match}
+
+
+class Facts:
+    """Memoized facts about the project derived from configuration files.
+
+    Each fact is computed on first access and shared by every check of the project.
+    Facts depend on other facts by accessing them, so dependencies are also computed at most once.
+    """
+
+    def __init__(self, configuration_files: ConfigurationFiles) -> None:
+        self.configuration_files = configuration_files
+
+    @property
+    def py_project_toml(self) -> PyProjectToml | None:
+        return self.configuration_files.py_project_toml
+
+    @cached_property
+    def project(self) -> Project | None:
+        """[project] section, depends on pyproject.toml."""
+        return None if self.py_project_toml is None else self.py_project_toml.project
+
+    @cached_property
+    def requires_python(self) -> RequiresPythonAnalyzer | None:
+        """Parsed requires-python specifier, depends on [project] section."""
+        if self.project is None or self.project.requires_python.value is None:
+            return None
+        return RequiresPythonAnalyzer(self.project.requires_python.value)
+
+    @cached_property
+    def supported_versions(self) -> set[str]:
+        """Python versions which satisfy requires-python, depends on requires-python specifier."""
+        if self.requires_python is None:
+            return set()
+        return self.requires_python.get_requires_python_supported_versions()
+
+    @cached_property
+    def supports_latest_python(self) -> bool:
+        """Whether requires-python supports the latest Python version, depends on requires-python specifier."""
+        return self.requires_python is not None and self.requires_python.supports_latest_python()
+
+    @cached_property
+    def classifiers(self) -> ClassifierIndex | None:
+        """Index of classifiers, depends on [project] section. None when classifiers is not a list."""
+        if self.project is None or not isinstance(self.project.classifiers.value, list):
+            return None
+        return ClassifierIndex(self.project.classifiers.value)
+
+    @cached_property
+    def has_typing_classifier(self) -> bool:
+        """Whether 'Typing :: Typed' classifier is present, depends on index of classifiers."""
+        return self.classifiers is not None and TYPING_CLASSIFIER in self.classifiers
+
+    @cached_property
+    def readme(self) -> ReadMe | None:
+        """README.md in the project root. None when it doesn't exist."""
+        return self.configuration_files.read_readme()
+
+    @cached_property
+    def distribution(self) -> Distribution:
+        """Packages discovered in the project root."""
+        return self.configuration_files.discover_packages()
@@ -0,0 +1,163 @@
+"""Implements access to local Git repository by git command."""
+
+from __future__ import annotations
+
+import shutil
+
+# Reason: Accept risk of using subprocess.
+import subprocess  # nosec B404
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+# Header of object read by cat-file consists of object ID, type and size.
+LENGTH_HEADER = 3
+TYPE_BLOB = "blob"
+TYPE_TREE = "tree"
+MODE_TREE = b"40000"
+
+
+class GitError(Exception):
+    """Git command isn't available or failed."""
+
+
+class Git:
+    """Git command executed in the working tree which contains the directory."""
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+
+    def run(self, *args: str) -> str:
+        """Executes git command and returns its standard output."""
+        executable = shutil.which("git")
+        if executable is None:
+            msg = "git command not found."
+            raise GitError(msg)
+        # Reason: Arguments are not passed through shell. pylint: disable-next=subprocess-run-check
+        completed_process = subprocess.run(  # noqa: S603  # nosec B603
+            [executable, "-C", str(self.directory), *args],
+            capture_output=True,
+            check=False,
+            text=True,
+            encoding="utf-8",
+        )
+        if completed_process.returncode != 0:
+            raise GitError(completed_process.stderr.strip())
+        return completed_process.stdout
+
+    def list_changed_files(self, ref: str) -> list[Path]:
+        """Lists absolute paths of files changed in the working tree since the ref, including removed ones."""
+        if ref.startswith("-"):
+            msg = f"Invalid ref: {ref!r}"
+            raise GitError(msg)
+        top_level = Path(self.run("rev-parse", "--show-toplevel").strip()).resolve()
+        # Option -z keeps paths including special characters as is, "--" separates ref from paths.
+        output = self.run("diff", "--name-only", "-z", ref, "--")
+        return [top_level / name for name in output.split("\0") if name]
+
+    def list_tags(self) -> list[str]:
+        """Lists tags in order of creation date, e.g. releases."""
+        output = self.run("for-each-ref", "--sort=creatordate", "--format=%(refname:short)", "refs/tags")
+        return output.splitlines()
+
+
+@dataclass(frozen=True)
+class TreeEntry:
+    """Entry of tree object."""
+
+    name: str
+    object_id: str
+    is_tree: bool
+
+
+class CatFile:
+    """Long-lived `git cat-file --batch` process which reads objects without checkout.
+
+    Every object is read through the same pipe, so reading many revisions doesn't pay for starting git each time.
+    Works on bare repositories.
+    """
+
+    def __init__(self, repository: Path) -> None:
+        executable = shutil.which("git")
+        if executable is None:
+            msg = "git command not found."
+            raise GitError(msg)
+        # Reason: Arguments are not passed through shell. pylint: disable-next=consider-using-with
+        self.process = subprocess.Popen(  # noqa: S603  # nosec B603
+            [executable, "-C", str(repository), "cat-file", "--batch"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self.process.stdin is not None:
+            self.process.stdin.close()
+        self.process.wait()
+        if self.process.stdout is not None:
+            self.process.stdout.close()
+
+    def read(self, name: str) -> GitObject | None:
+        """Reads the object, e.g. "HEAD:pyproject.toml". None when it doesn't exist."""
+        if "\n" in name or self.process.stdin is None or self.process.stdout is None:
+            return None
+        self.process.stdin.write(name.encode("utf-8") + b"\n")
+        self.process.stdin.flush()
+        header = self.process.stdout.readline()
+        if not header:
+            msg = "git cat-file exited unexpectedly."
+            raise GitError(msg)
+        parts = header.split()
+        # Header is "<name> missing" or "<name> ambiguous" when the object can't be resolved.
+        if len(parts) != LENGTH_HEADER or not parts[2].isdigit():
+            return None
+        content = self.process.stdout.read(int(parts[2]))
+        # Content is followed by a line feed.
+        self.process.stdout.read(1)
+        return GitObject(parts[0].decode("ascii"), parts[1].decode("ascii"), content)
+
+    def read_blob(self, name: str) -> bytes | None:
+        git_object = self.read(name)
+        return None if git_object is None or git_object.type != TYPE_BLOB else git_object.content
+
+    def read_tree(self, name: str) -> list[TreeEntry] | None:
+        """Returns entries of the tree, e.g. "HEAD:" for the root directory. None when it isn't a tree."""
+        git_object = self.read(name)
+        if git_object is None or git_object.type != TYPE_TREE:
+            return None
+        return git_object.parse_tree()
+
+
+@dataclass(frozen=True)
+class GitObject:
+    """Object read from object database."""
+
+    object_id: str
+    type: str
+    content: bytes
+
+    def parse_tree(self) -> list[TreeEntry]:
+        """Parses tree object which consists of entries of mode, name, null character and binary object ID."""
+        entries = []
+        # Binary object ID has the same length as the hexadecimal one of this object in half,
+        # 20 bytes in SHA-1 repository and 32 bytes in SHA-256 repository.
+        length_id = len(self.object_id) // 2
+        index = 0
+        while index < len(self.content):
+            end_mode = self.content.index(b" ", index)
+            end_name = self.content.index(b"\0", end_mode)
+            end_id = end_name + 1 + length_id
+            name = self.content[end_mode + 1 : end_name].decode("utf-8", errors="replace")
+            is_tree = self.content[index:end_mode] == MODE_TREE
+            entries.append(TreeEntry(name, self.content[end_name + 1 : end_id].hex(), is_tree=is_tree))
+            index = end_id
+        return entries
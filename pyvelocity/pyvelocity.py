@@ -1 +1,302 @@
 """Main module."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Sized
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from contextlib import closing
+from functools import partial
+from typing import TYPE_CHECKING
+
+from pyvelocity.cache import ResultCache
+from pyvelocity.checks.aggregation import CHECK_CLASSES
+from pyvelocity.checks.aggregation import Checks
+from pyvelocity.checks.aggregation import Results
+from pyvelocity.checks.aggregation import list_affected_check_ids
+from pyvelocity.configurations.aggregation import Configurations
+from pyvelocity.configurations.files.aggregation import ConfigurationFiles
+from pyvelocity.configurations.files.aggregation import InMemoryConfigurationFiles
+from pyvelocity.configurations.files.readme import compile_badge_patterns
+from pyvelocity.configurations.files.snapshot import Snapshot
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Collection
+    from collections.abc import Generator
+    from collections.abc import Iterable
+    from collections.abc import Mapping
+    from collections.abc import Set as AbstractSet
+    from concurrent.futures import Future
+    from pathlib import Path
+
+    from pyvelocity.checks import Result
+
+# To amortize the cost of inter-process communication when there are many projects.
+CHUNKS_PER_WORKER = 4
+# To keep workers busy while bounding projects submitted but not yet yielded.
+PENDING_PER_WORKER = 4
+# Files which checks look for, listed in one batch before checks start.
+INPUTS = frozenset(name for check_class in CHECK_CLASSES for name in check_class.INPUTS)
+
+
+# Reason: Options of checks. pylint: disable-next=too-many-arguments
+def stream_project(  # noqa: PLR0913
+    root: Path,
+    *,
+    threads: int = 1,
+    time_budget: float | None = None,
+    ordered: bool = False,
+    cache: bool = False,
+    files: Collection[str] | None = None,
+    select: Collection[str] | None = None,
+) -> Generator[Result, None, None]:
+    """Checks the project located at the root directory and yields each result as soon as it is produced.
+
+    When threads is more than 1, checks are executed concurrently on thread pool
+    to overlap latency of file system access, and results are yielded in order of completion unless ordered.
+    When time budget in seconds is given, expensive checks which would exceed it are skipped.
+    When cache, results are cached in .pyvelocity_cache/ directory under the root
+    and configuration files are not even parsed when none of inputs of checks changed.
+    When changed files relative to the root are given, e.g. files to commit,
+    executes only checks whose inputs are in them.
+    When IDs of checks are selected, executes only them in addition to the filter in pyproject.toml.
+    """
+    check_ids = _list_check_ids(files, select)
+    if check_ids is not None and not check_ids:
+        # E.g. only source code changed, then configuration files are not even parsed.
+        return
+    snapshot = Snapshot(root)
+    snapshot.prefetch(INPUTS)
+    result_cache = ResultCache(root, snapshot) if cache else None
+    try:
+        yield from _execute_checks(
+            snapshot,
+            threads=threads,
+            time_budget=time_budget,
+            ordered=ordered,
+            cache=result_cache,
+            check_ids=check_ids,
+        )
+    finally:
+        if result_cache is not None:
+            result_cache.save()
+
+
+def _list_check_ids(files: Collection[str] | None, select: Collection[str] | None) -> set[str] | None:
+    """IDs of checks to execute, None means every check."""
+    if files is None and select is None:
+        return None
+    check_ids = {check_class.ID for check_class in CHECK_CLASSES} if files is None else list_affected_check_ids(files)
+    return check_ids if select is None else check_ids.intersection(select)
+
+
+# Reason: Options of checks. pylint: disable-next=too-many-arguments
+def _execute_checks(  # noqa: PLR0913
+    snapshot: Snapshot,
+    *,
+    threads: int,
+    time_budget: float | None,
+    ordered: bool,
+    cache: ResultCache | None,
+    check_ids: AbstractSet[str] | None,
+) -> Generator[Result, None, None]:
+    # When all checks are executed, cached results can be returned without parsing configuration files.
+    results = None if cache is None or check_ids is not None else cache.get_all()
+    if results is not None:
+        yield from results
+        return
+    parsed_files = None if cache is None else cache.parsed_files
+    configuration_files = ConfigurationFiles(snapshot.root, snapshot=snapshot, parsed_files=parsed_files)
+    configurations = Configurations(configuration_files)
+    checks = Checks(configuration_files, configurations, time_budget=time_budget, cache=cache)
+    if check_ids is not None:
+        checks.only(check_ids)
+    yield from _execute(checks, threads=threads, ordered=ordered)
+
+
+def _execute(checks: Checks, *, threads: int, ordered: bool) -> Generator[Result, None, None]:
+    if threads <= 1:
+        yield from checks.execute()
+        return
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        try:
+            yield from checks.execute(executor, ordered=ordered)
+        finally:
+            # When the caller stops iteration, e.g. fail fast, checks not yet started are no longer needed.
+            executor.shutdown(cancel_futures=True)
+
+
+# Reason: Options of checks. pylint: disable-next=too-many-arguments
+def check_project(  # noqa: PLR0913
+    root: Path,
+    *,
+    threads: int = 1,
+    fail_fast: bool = False,
+    time_budget: float | None = None,
+    cache: bool = False,
+    files: Collection[str] | None = None,
+    select: Collection[str] | None = None,
+) -> Results:
+    """Checks the project located at the root directory without changing the current working directory.
+
+    Results are in order of checks even when checks are executed concurrently.
+    When fail_fast, stops at the first failing result.
+    See stream_project() for other arguments.
+    """
+    results = stream_project(
+        root,
+        threads=threads,
+        time_budget=time_budget,
+        ordered=True,
+        cache=cache,
+        files=files,
+        select=select,
+    )
+    with closing(results):
+        return Results.collect(results, fail_fast=fail_fast)
+
+
+def check_documents(documents: Mapping[str, str], *, select: Collection[str] | None = None) -> Results:
+    """Checks the project whose files are given as contents keyed by paths relative to the root."""
+    return check_configuration_files(InMemoryConfigurationFiles(documents), select=select)
+
+
+def check_configuration_files(
+    configuration_files: ConfigurationFiles,
+    *,
+    select: Collection[str] | None = None,
+) -> Results:
+    """Checks the project whose files are provided by the configuration files, e.g. in memory."""
+    checks = Checks(configuration_files, Configurations(configuration_files))
+    if select is not None:
+        checks.only(set(select))
+    return Results(list(checks.execute()))
+
+
+def warm_up() -> None:
+    """Prepares worker process before the first project so that it isn't paid for each project."""
+    compile_badge_patterns()
+
+
+# Reason: Options of checks. pylint: disable-next=too-many-arguments
+def _check_project_files(  # noqa: PLR0913
+    root: Path,
+    files: Collection[str] | None,
+    *,
+    threads: int,
+    fail_fast: bool,
+    time_budget: float | None,
+    cache: bool,
+) -> Results:
+    """Takes changed files as positional argument to be mapped in worker processes with roots."""
+    return check_project(root, threads=threads, fail_fast=fail_fast, time_budget=time_budget, cache=cache, files=files)
+
+
+# Reason: Options of checks. pylint: disable-next=too-many-arguments
+def check_projects(  # noqa: PLR0913
+    roots: list[Path],
+    *,
+    jobs: int = 1,
+    threads: int = 1,
+    fail_fast: bool = False,
+    time_budget: float | None = None,
+    cache: bool = False,
+    files: Mapping[Path, Collection[str]] | None = None,
+) -> Generator[Results, None, None]:
+    """Checks projects and yields results in order of roots.
+
+    When jobs is more than 1, projects are checked in worker processes. 0 means the number of CPUs.
+    When changed files are given, they are looked up by root. See check_project() for other arguments.
+    """
+    check = partial(_check_project_files, threads=threads, fail_fast=fail_fast, time_budget=time_budget, cache=cache)
+    list_files = [None if files is None else files.get(root, ()) for root in roots]
+    max_workers = min(jobs or os.cpu_count() or 1, len(roots))
+    if max_workers <= 1:
+        yield from (check(root, files_root) for root, files_root in zip(roots, list_files, strict=True))
+        return
+    chunksize = max(1, len(roots) // (max_workers * CHUNKS_PER_WORKER))
+    # Reason: Multiprocessing takes much of startup time, so it's imported only when projects are checked in parallel.
+    from concurrent.futures import ProcessPoolExecutor  # noqa: PLC0415  pylint: disable=import-outside-toplevel
+
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=warm_up) as executor:
+        try:
+            # Executor.map() yields results in order of input even when later ones complete first.
+            yield from executor.map(check, roots, list_files, chunksize=chunksize)
+        finally:
+            # When the caller stops iteration, e.g. fail fast, projects not yet checked are no longer needed.
+            executor.shutdown(cancel_futures=True)
+
+
+# Reason: Options of checks. pylint: disable-next=too-many-arguments
+def stream_projects(  # noqa: PLR0913
+    roots: Iterable[Path],
+    *,
+    jobs: int = 1,
+    threads: int = 1,
+    time_budget: float | None = None,
+    cache: bool = False,
+    files: Mapping[Path, Collection[str]] | None = None,
+    select: Collection[str] | None = None,
+) -> Generator[tuple[Path, Result], None, None]:
+    """Checks projects and yields pairs of root and result as soon as each result is produced.
+
+    Roots are consumed lazily, so a generator of many roots is never built into a list.
+    When jobs is more than 1, projects are checked in worker processes
+    and results of each project are yielded together when the project completes.
+    See check_projects() and stream_project() for other arguments.
+    """
+    max_workers = jobs or os.cpu_count() or 1
+    if isinstance(roots, Sized):
+        max_workers = min(max_workers, len(roots))
+    if max_workers <= 1:
+        for root in roots:
+            files_root = None if files is None else files.get(root, ())
+            stream = stream_project(
+                root,
+                threads=threads,
+                time_budget=time_budget,
+                cache=cache,
+                files=files_root,
+                select=select,
+            )
+            with closing(stream) as results:
+                yield from ((root, result) for result in results)
+        return
+    check = partial(check_project, threads=threads, time_budget=time_budget, cache=cache, select=select)
+    yield from _stream_in_processes(roots, check, max_workers=max_workers, files=files)
+
+
+def _stream_in_processes(
+    roots: Iterable[Path],
+    check: Callable[..., Results],
+    *,
+    max_workers: int,
+    files: Mapping[Path, Collection[str]] | None,
+) -> Generator[tuple[Path, Result], None, None]:
+    """Bounds the number of projects submitted but not yet yielded to keep memory flat for many roots."""
+    # Reason: Multiprocessing takes much of startup time, so it's imported only when projects are checked in parallel.
+    from concurrent.futures import ProcessPoolExecutor  # noqa: PLC0415  pylint: disable=import-outside-toplevel
+
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=warm_up) as executor:
+        try:
+            pending: dict[Future[Results], Path] = {}
+            for root in roots:
+                if len(pending) >= max_workers * PENDING_PER_WORKER:
+                    yield from _pop_completed(pending)
+                files_root = None if files is None else files.get(root, ())
+                pending[executor.submit(check, root, files=files_root)] = root
+            while pending:
+                yield from _pop_completed(pending)
+        finally:
+            # When the caller stops iteration, projects not yet checked are no longer needed.
+            executor.shutdown(cancel_futures=True)
+
+
+def _pop_completed(pending: dict[Future[Results], Path]) -> Generator[tuple[Path, Result], None, None]:
+    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+    for future in done:
+        root = pending.pop(future)
+        yield from ((root, result) for result in future.result().results)
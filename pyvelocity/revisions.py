@@ -0,0 +1,92 @@
+"""Implements checks of revisions read from Git object database without checkout."""
+
+from __future__ import annotations
+
+from pathlib import PurePosixPath
+from typing import TYPE_CHECKING
+
+from pyvelocity.checks import TREE_FILE_NAMES
+from pyvelocity.checks.legacy_setup_files import LegacySetupFiles
+from pyvelocity.configurations.files.aggregation import NAME_SRC
+from pyvelocity.configurations.files.py_project_toml import WHERE_PY_PROJECT_TOML
+from pyvelocity.configurations.files.readme import WHERE_README_MD
+from pyvelocity.git import CatFile
+from pyvelocity.pyvelocity import check_documents
+
+if TYPE_CHECKING:
+    from collections.abc import Collection
+    from collections.abc import Generator
+    from collections.abc import Iterable
+    from pathlib import Path
+
+    from pyvelocity.checks.aggregation import Results
+    from pyvelocity.git import TreeEntry
+
+# Files whose contents checks read, other files only need to exist.
+READ_FILE_NAMES = (WHERE_PY_PROJECT_TOML, WHERE_README_MD)
+
+
+class RevisionReader:
+    """Reads files of the project which checks depend on from revisions.
+
+    Reads only the project directory, src directory and top-level package directories instead of the whole tree.
+    """
+
+    def __init__(self, cat_file: CatFile, directory: str = "") -> None:
+        self.cat_file = cat_file
+        path = PurePosixPath(directory).as_posix().lstrip("/")
+        # Path of the root of the tree is empty, e.g. "HEAD:".
+        self.directory = "" if path == "." else path
+
+    def read(self, revision: str) -> dict[str, str] | None:
+        """Documents of the project keyed by paths relative to the project. None when the revision doesn't exist."""
+        entries = self.cat_file.read_tree(f"{revision}:{self.directory}")
+        if entries is None:
+            return None
+        documents = {}
+        by_name = {entry.name: entry for entry in entries}
+        for name in READ_FILE_NAMES:
+            content = self._read_blob(by_name.get(name))
+            if content is not None:
+                documents[name] = content
+        documents.update((name, "") for name in LegacySetupFiles.INPUTS if name in by_name)
+        documents.update(self._list_package_files(by_name))
+        return documents
+
+    def _read_blob(self, entry: TreeEntry | None) -> str | None:
+        if entry is None or entry.is_tree:
+            return None
+        content = self.cat_file.read_blob(entry.object_id)
+        return None if content is None else content.decode("utf-8", errors="replace")
+
+    def _list_package_files(self, by_name: dict[str, TreeEntry]) -> Generator[tuple[str, str], None, None]:
+        """Lists __init__.py and py.typed in top-level directories of src-layout or flat-layout."""
+        src = by_name.get(NAME_SRC)
+        is_src_layout = src is not None and src.is_tree
+        entries = self.cat_file.read_tree(src.object_id) if src is not None and is_src_layout else by_name.values()
+        base = f"{NAME_SRC}/" if is_src_layout else ""
+        for directory in entries or []:
+            if not directory.is_tree or directory.name.startswith("."):
+                continue
+            for entry in self.cat_file.read_tree(directory.object_id) or []:
+                if entry.name in TREE_FILE_NAMES and not entry.is_tree:
+                    yield f"{base}{directory.name}/{entry.name}", ""
+
+
+def check_revisions(
+    repository: Path,
+    revisions: Iterable[str],
+    *,
+    directory: str = "",
+    select: Collection[str] | None = None,
+) -> Generator[tuple[str, Results | None], None, None]:
+    """Checks the project in each revision and yields pairs of revision and results in order of revisions.
+
+    Results are None when the revision or the directory doesn't exist in it.
+    Every revision is read through one cat-file process, which also works on bare repositories.
+    """
+    with CatFile(repository) as cat_file:
+        reader = RevisionReader(cat_file, directory)
+        for revision in revisions:
+            documents = reader.read(revision)
+            yield revision, None if documents is None else check_documents(documents, select=select)
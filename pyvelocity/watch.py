@@ -0,0 +1,136 @@
+"""Implements watch mode which re-evaluates only checks whose inputs changed."""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from pyvelocity.cache import fingerprint_tree
+from pyvelocity.checks.aggregation import CHECK_CLASSES
+from pyvelocity.checks.aggregation import Checks
+from pyvelocity.checks.aggregation import Results
+from pyvelocity.configurations.aggregation import Configurations
+from pyvelocity.configurations.files.aggregation import ConfigurationFiles
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from pyvelocity.checks import Result
+
+POLL_INTERVAL = 0.5
+NAME_TREE = "package directories"
+WATCHED_FILES = tuple(sorted({name for check_class in CHECK_CLASSES for name in check_class.INPUTS}))
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """Stats of inputs of checks, which are cheap to take on every poll."""
+
+    files: dict[str, tuple[int, int] | None]
+    tree: str
+
+    @classmethod
+    def take(cls, root: Path) -> Snapshot:
+        return cls({name: cls._stat(root / name) for name in WATCHED_FILES}, fingerprint_tree(root))
+
+    @staticmethod
+    def _stat(path: Path) -> tuple[int, int] | None:
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def list_changed_files(self, previous: Snapshot) -> set[str]:
+        return {name for name, stat in self.files.items() if previous.files.get(name) != stat}
+
+
+@dataclass(frozen=True)
+class Change:
+    """Results of the project re-evaluated since the inputs changed. Changed inputs are empty at the first time."""
+
+    root: Path
+    changed_inputs: list[str]
+    results: Results
+
+
+class ProjectWatch:
+    """State of the project kept in memory between iterations."""
+
+    def __init__(self, root: Path, *, threads: int = 1, time_budget: float | None = None) -> None:
+        self.root = root
+        self.threads = threads
+        self.time_budget = time_budget
+        self.snapshot = Snapshot.take(root)
+        self.results: dict[str, Result] = {}
+
+    def poll(self) -> Change | None:
+        """Re-evaluates checks affected by inputs changed since the previous poll."""
+        snapshot = Snapshot.take(self.root)
+        changed_files = snapshot.list_changed_files(self.snapshot)
+        is_tree_changed = snapshot.tree != self.snapshot.tree
+        self.snapshot = snapshot
+        if not changed_files and not is_tree_changed:
+            return None
+        results = self.evaluate(changed_files, is_tree_changed=is_tree_changed)
+        changed_inputs = sorted(changed_files) + ([NAME_TREE] if is_tree_changed else [])
+        return Change(self.root, changed_inputs, results)
+
+    def evaluate(self, changed_files: set[str], *, is_tree_changed: bool) -> Results:
+        """Executes affected checks and checks which haven't been executed yet, e.g. removed from filter."""
+        configuration_files = ConfigurationFiles(self.root)
+        checks = Checks(configuration_files, Configurations(configuration_files), time_budget=self.time_budget)
+        selected = [check.ID for check in checks.checks]
+        checks.only(
+            {
+                check.ID
+                for check in checks.checks
+                if check.ID not in self.results or check.is_affected(changed_files, is_tree_changed=is_tree_changed)
+            },
+        )
+        self.results.update((result.id, result) for result in self._execute(checks))
+        self.results = {check_id: self.results[check_id] for check_id in selected}
+        return Results(list(self.results.values()))
+
+    def _execute(self, checks: Checks) -> Iterator[Result]:
+        if self.threads <= 1:
+            return checks.execute()
+        with ThreadPoolExecutor(max_workers=self.threads) as executor:
+            return iter(list(checks.execute(executor)))
+
+
+class Watcher:
+    """Watches projects by polling stats of inputs of checks.
+
+    Polling needs no dependency and works on every platform and file system, e.g. network file system.
+    """
+
+    def __init__(
+        self,
+        roots: Iterable[Path],
+        *,
+        threads: int = 1,
+        time_budget: float | None = None,
+        interval: float = POLL_INTERVAL,
+    ) -> None:
+        self.projects = [ProjectWatch(root, threads=threads, time_budget=time_budget) for root in roots]
+        self.interval = interval
+
+    def watch(self) -> Generator[Change, None, None]:
+        """Yields results of all projects at first, then yields results of projects whenever their inputs change."""
+        for project in self.projects:
+            yield Change(project.root, [], project.evaluate(set(), is_tree_changed=False))
+        while True:
+            time.sleep(self.interval)
+            yield from self.poll()
+
+    def poll(self) -> Generator[Change, None, None]:
+        for project in self.projects:
+            change = project.poll()
+            if change is not None:
+                yield change
@@ -3,13 +3,32 @@
 Execute 'invoke --list' for guidance on using Invoke
 """
 
+from __future__ import annotations
+
 from invoke import Collection
+from invoke import Context
+from invoke import Result
+from invoke import task
 from invokelint import _clean
 from invokelint import dist
 from invokelint import lint
 from invokelint import path
 from invokelint import style
 from invokelint import test
+from invokelint.run import run_in_pty
+
+
+@task(
+    help={
+        "modules-only": "Measure only the number of imported modules, which is comparable on any machine.",
+        "update": "Record the results as the baselines of this environment instead of comparing with them.",
+    },
+)
+def benchmark(context: Context, *, modules_only: bool = False, update: bool = False) -> Result:
+    """Measures import time and cold start latency and fails when they regress from the baseline."""
+    options = [option for option, is_enabled in (("--modules-only", modules_only), ("--update", update)) if is_enabled]
+    return run_in_pty(context, " ".join(["python -m benchmarks.startup", *options]))
+
 
 ns = Collection()
 ns.add_collection(_clean, name="clean")
@@ -18,3 +37,4 @@ ns.add_collection(lint)
 ns.add_collection(path)
 ns.add_collection(style)
 ns.add_collection(test)
+ns.add_task(benchmark)
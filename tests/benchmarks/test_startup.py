@@ -0,0 +1,97 @@
+"""Tests for startup.py."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import click
+import pytest
+
+from benchmarks.startup import PATH_BASELINE
+from benchmarks.startup import PATH_FIXTURES
+from benchmarks.startup import compare
+from benchmarks.startup import count_modules
+from benchmarks.startup import describe_interpreter
+from benchmarks.startup import find_baseline_modules
+from benchmarks.startup import list_regressions
+from benchmarks.startup import measure
+from benchmarks.startup import parse_import_time
+from benchmarks.startup import sum_import_time
+from benchmarks.startup import update
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+STDERR_IMPORT_TIME = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:        80 |        200 |   io
+import time:      1500 |       1700 | pyvelocity.cli
+"""
+
+
+def test_parse_import_time() -> None:
+    """Header line and other output are skipped."""
+    stderr = STDERR_IMPORT_TIME + "Traceback (most recent call last):\n"
+    assert list(parse_import_time(stderr)) == [(120, 120, "_io"), (80, 200, "io"), (1500, 1700, "pyvelocity.cli")]
+
+
+@pytest.mark.parametrize(("module", "expected"), [(None, 1.7), ("io", 0.2), ("pyvelocity.cli", 1.7)])
+def test_sum_import_time(module: str | None, expected: float) -> None:
+    assert sum_import_time(STDERR_IMPORT_TIME, module) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    ("metrics", "expected"),
+    [
+        ({"latency: check": 149.0, "modules: check": 100}, []),
+        ({"latency: check": 151.0, "modules: check": 100}, ["latency: check: 151.0 ms > 100.0 ms"]),
+        ({"latency: check": 50.0, "modules: check": 101}, ["modules: check: 101 > 100"]),
+        # Metric which isn't in the baseline is new, then nothing to compare with.
+        ({"latency: new": 1000.0}, []),
+    ],
+)
+def test_list_regressions(metrics: dict[str, float], expected: list[str]) -> None:
+    baseline = {"latency: check": 100.0, "modules: check": 100}
+    assert list_regressions(metrics, baseline, threshold=0.5) == expected
+
+
+def test_count_modules() -> None:
+    """Each package of dependencies counts as one since its submodules vary by its version."""
+    names = ["io", "json", "json.decoder", "pyvelocity", "pyvelocity.cli", "click", "click.core", "setuptools"]
+    assert count_modules(names) == 7  # noqa: PLR2004
+
+
+def test_baselines(tmp_path: Path) -> None:
+    """Modules are compared on any machine with the same Python, time only on the same environment."""
+    path_baseline = tmp_path / "baseline.json"
+    other = {"environment": {"python": "0.0.0"}, "metrics": {"modules: check": 1, "latency: check": 1.0}}
+    path_baseline.write_text(json.dumps({"modules": [other], "time": [other]}), encoding="utf-8")
+    with pytest.raises(click.ClickException, match="No baseline of modules"):
+        compare({"modules: check": 100, "latency: check": 100.0}, path_baseline, threshold=0.5)
+    update({"modules: check": 100}, path_baseline)
+    baselines = json.loads(path_baseline.read_text(encoding="utf-8"))
+    assert baselines["modules"] == [other, {"environment": describe_interpreter(), "metrics": {"modules: check": 100}}]
+    assert baselines["time"] == [other]
+    # Time is compared only when the baseline of time of this environment exists.
+    compare({"modules: check": 100, "latency: check": 1000.0}, path_baseline, threshold=0.5)
+    with pytest.raises(click.ClickException, match="modules: check: 101 > 100"):
+        compare({"modules: check": 101}, path_baseline, threshold=0.5)
+    update({"modules: check": 100, "latency: check": 100.0}, path_baseline)
+    compare({"modules: check": 100, "latency: check": 149.0}, path_baseline, threshold=0.5)
+    with pytest.raises(click.ClickException, match=r"latency: check: 151\.0 ms > 100\.0 ms"):
+        compare({"modules: check": 100, "latency: check": 151.0}, path_baseline, threshold=0.5)
+    # Updating again replaces the baselines of the same Python and environment.
+    update({"modules: check": 90, "latency: check": 200.0}, path_baseline)
+    baselines = json.loads(path_baseline.read_text(encoding="utf-8"))
+    assert [len(baselines[key]) for key in ("modules", "time")] == [2, 2]
+
+
+@pytest.mark.slow
+def test_modules() -> None:
+    """Number of imported modules doesn't increase from the baseline of this Python, e.g. by heavy top-level import."""
+    baseline = find_baseline_modules(PATH_BASELINE)
+    if baseline is None:
+        pytest.skip(f"No baseline of modules for {describe_interpreter()}, record it by --modules-only --update.")
+    metrics = measure(sorted(PATH_FIXTURES.glob("pyproject_*.toml")), repeat=1, is_modules_only=True)
+    assert list_regressions(metrics, baseline, threshold=0) == []
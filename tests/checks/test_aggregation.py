@@ -1,15 +1,59 @@
 """Tests for aggregation.py."""
 
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
 
+from pyvelocity.checks import Result
 from pyvelocity.checks.aggregation import Checks
 from pyvelocity.checks.aggregation import Results
+from pyvelocity.checks.aggregation import list_affected_check_ids
 from pyvelocity.configurations.aggregation import Configurations
 from pyvelocity.configurations.files.aggregation import ConfigurationFiles
 
 
+@pytest.mark.parametrize(
+    ("files", "expected"),
+    [
+        (["src/package/module.py", "tests/test_module.py"], set()),
+        (["README.md"], {"badges"}),
+        (["setup.cfg", "docs/README.md"], {"legacy-setup-files", "typed"}),
+        (["src/package/py.typed"], {"typed"}),
+        (["__init__.py"], set()),
+    ],
+)
+def test_list_affected_check_ids(files: list[str], expected: set[str]) -> None:
+    assert list_affected_check_ids(files) == expected
+
+
+def test_list_affected_check_ids_py_project_toml() -> None:
+    """Every check is affected since pyproject.toml may change the filter of checks."""
+    assert len(list_affected_check_ids(["pyproject.toml"])) == len(
+        list_affected_check_ids(["README.md", "pyproject.toml"]),
+    )
+    assert "typed" in list_affected_check_ids(["./pyproject.toml"])
+
+
+class TestResults:
+    """Test for Results."""
+
+    @staticmethod
+    @pytest.mark.parametrize(("fail_fast", "expected_length"), [(False, 3), (True, 2)])
+    def test_collect(
+        successful_result: Result,
+        failed_result: Result,
+        *,
+        fail_fast: bool,
+        expected_length: int,
+    ) -> None:
+        """Tests that fail fast stops at the first failing result."""
+        results = Results.collect(iter([successful_result, failed_result, failed_result]), fail_fast=fail_fast)
+        assert len(results.results) == expected_length
+        assert results.is_ok is False
+
+
 class TestChecks:
     """Test for Checks."""
 
@@ -68,24 +112,73 @@ class TestChecks:
             "pyproject.toml is required for requires-python check\n"
             "pyproject.toml is required for classifiers check\n"
             "pyproject.toml is required for zip-safe-false check\n"
+            "pyproject.toml is required for keywords check\n"
+            "README.md file not found\n"
             'Missing tool.setuptools.package-data "*" = ["py.typed"] configuration\n'
             "Missing py.typed files in package directories\n"
-            'Missing "Typing :: Typed" classifier in pyproject.toml\n'
-            "pyproject.toml is required for keywords check\n"
-            "README.md file not found"
+            'Missing "Typing :: Typed" classifier in pyproject.toml'
         )
         assert results.is_ok is False
 
     @staticmethod
     @pytest.mark.usefixtures("ch_tmp_path")
-    def test_legacy_setup_files_detected(
-        configuration_files: ConfigurationFiles,
-        configurations: Configurations,
-    ) -> None:
+    def test_legacy_setup_files_detected() -> None:
         """Tests case when legacy setup files are detected."""
         # Create a setup.cfg file to trigger the legacy-setup-files check
         Path("setup.cfg").touch()
+        # Files are snapshotted when configuration files are created.
+        configuration_files = ConfigurationFiles()
+        configurations = Configurations(configuration_files)
 
         results = Results(list(Checks(configuration_files, configurations).execute()))
         assert "Legacy setup files found: setup.cfg. Use pyproject.toml instead." in results.message
         assert results.is_ok is False
+
+    @staticmethod
+    def test_root(tmp_path: Path, resource_path_root: Path) -> None:
+        """Tests that files are resolved against the project root instead of the current working directory."""
+        shutil.copy(resource_path_root / "pyproject_success.toml", tmp_path / "pyproject.toml")
+        (tmp_path / "setup.py").touch()
+        configuration_files = ConfigurationFiles(tmp_path)
+        configurations = Configurations(configuration_files)
+        results = Results(list(Checks(configuration_files, configurations).execute()))
+        assert results.message == (
+            "Legacy setup files found: setup.py. Use pyproject.toml instead.\nREADME.md file not found"
+        )
+        assert results.is_ok is False
+
+    @staticmethod
+    @pytest.mark.usefixtures("ch_tmp_path")
+    def test_executor(configuration_files: ConfigurationFiles, configurations: Configurations) -> None:
+        """Tests that results are yielded in order of check classes even when checks are executed concurrently."""
+        expected = list(Checks(configuration_files, configurations).execute())
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(Checks(configuration_files, configurations).execute(executor))
+        assert results == expected
+
+    @staticmethod
+    @pytest.mark.usefixtures("ch_tmp_path")
+    def test_time_budget(configuration_files: ConfigurationFiles, configurations: Configurations) -> None:
+        """Tests that checks except cheap ones are skipped when they would exceed time budget."""
+        results = list(Checks(configuration_files, configurations, time_budget=0).execute())
+        assert [result.id for result in results] == [
+            "using-py-project-toml",
+            "line-length",
+            "readme",
+            "requires-python",
+            "classifiers",
+            "zip-safe-false",
+            "keywords",
+            "legacy-setup-files",
+            "badges",
+            "typed",
+        ]
+        assert results[-3:] == [
+            Result(
+                "legacy-setup-files",
+                is_ok=True,
+                message="Skipped legacy-setup-files check since it may exceed time budget 0ms",
+            ),
+            Result("badges", is_ok=True, message="Skipped badges check since it may exceed time budget 0ms"),
+            Result("typed", is_ok=True, message="Skipped typed check since it may exceed time budget 0ms"),
+        ]
@@ -5,6 +5,7 @@ import pytest
 from pyvelocity.checks.classifiers import Classifiers
 from pyvelocity.configurations.aggregation import Configurations
 from pyvelocity.configurations.files.aggregation import ConfigurationFiles
+from pyvelocity.facts import ClassifierIndex
 
 
 class TestClassifiers:
@@ -86,10 +87,8 @@ class TestClassifiersVersionLogic:
     """Test version parsing logic for Classifiers."""
 
     @staticmethod
-    def test_get_classifier_python_versions() -> None:
-        """Test get_classifier_python_versions extracts correct versions."""
-        classifiers_check = Classifiers(None, None)  # type: ignore[arg-type]
-
+    def test_python_versions() -> None:
+        """Test python_versions extracts correct versions."""
         classifiers = [
             "Development Status :: 4 - Beta",
             "Programming Language :: Python",
@@ -100,6 +99,6 @@ class TestClassifiersVersionLogic:
             "Topic :: Software Development",
         ]
 
-        versions = classifiers_check.get_classifier_python_versions(classifiers)
+        versions = ClassifierIndex(classifiers).python_versions
         expected = {"3.10", "3.11", "3.12"}
         assert versions == expected
@@ -5,6 +5,7 @@ import pytest
 from pyvelocity.checks.requires_python import RequiresPython
 from pyvelocity.configurations.aggregation import Configurations
 from pyvelocity.configurations.files.aggregation import ConfigurationFiles
+from pyvelocity.configurations.files.sections.project import RequiresPythonAnalyzer
 
 
 class TestRequiresPython:
@@ -90,8 +91,8 @@ class TestRequiresPythonVersionLogic:
         expected_supports_latest: bool,
     ) -> None:
         """Test supports_latest_python with various version formats."""
-        requires_python_check = RequiresPython(None, None)  # type: ignore[arg-type]
-        assert requires_python_check.supports_latest_python(requires_python_spec) is expected_supports_latest
+        analyzer = RequiresPythonAnalyzer(requires_python_spec)
+        assert analyzer.supports_latest_python() is expected_supports_latest
 
     @staticmethod
     @pytest.mark.parametrize(
@@ -112,6 +113,5 @@ class TestRequiresPythonVersionLogic:
         expected_supports_latest: bool,
     ) -> None:
         """Test edge cases by calling public method that triggers protected method paths."""
-        requires_python_check = RequiresPython(None, None)  # type: ignore[arg-type]
-        result = requires_python_check.supports_latest_python(requires_python_spec)
+        result = RequiresPythonAnalyzer(requires_python_spec).supports_latest_python()
         assert result is expected_supports_latest
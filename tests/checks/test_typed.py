@@ -2,20 +2,23 @@
 
 from __future__ import annotations
 
+import sys
 from pathlib import Path
+from types import ModuleType
 from typing import TYPE_CHECKING
 from unittest.mock import patch
 
 import pytest
+from setuptools.dist import Distribution
 
+from pyvelocity.checks import Cost
+from pyvelocity.checks.typed import ESTIMATED_SECONDS_IMPORT_SETUPTOOLS
 from pyvelocity.checks.typed import Typed
-from pyvelocity.checks.typed import TypingClassifierValidator
 from pyvelocity.configurations.aggregation import Configurations
 from pyvelocity.configurations.files.aggregation import ConfigurationFiles
 
 if TYPE_CHECKING:
     from pyvelocity.checks import Result
-    from pyvelocity.configurations.files.py_project_toml import PyProjectToml
 
 
 class TestTyped:
@@ -115,9 +118,7 @@ class TestTyped:
 
     def _execute_typed_check_with_mock(self, packages: list[str]) -> Result:
         """Execute typed check with mocked packages."""
-        with patch("pyvelocity.checks.typed.Setuptools") as mock_setuptools:
-            mock_instance = mock_setuptools.return_value
-            mock_instance.packages = packages
+        with patch.object(Typed, "_discover_packages", return_value=Distribution({"packages": packages})):
             configuration_files = ConfigurationFiles()
             configurations = Configurations(configuration_files)
             typed_check = Typed(configuration_files, configurations)
@@ -137,9 +138,7 @@ class TestTyped:
     @pytest.mark.usefixtures("ch_tmp_path")
     def test_no_pyproject_toml(configuration_files: ConfigurationFiles, configurations: Configurations) -> None:
         """Tests case when no pyproject.toml exists."""
-        with patch("pyvelocity.checks.typed.Setuptools") as mock_setuptools:
-            mock_instance = mock_setuptools.return_value
-            mock_instance.packages = ["testpackage"]
+        with patch.object(Typed, "_discover_packages", return_value=Distribution({"packages": ["testpackage"]})):
             typed_check = Typed(configuration_files, configurations)
             result = typed_check.execute()
             assert 'Missing tool.setuptools.package-data "*" = ["py.typed"] configuration' in result.message
@@ -151,79 +150,69 @@ class TestTyped:
         configurations: Configurations,
     ) -> None:
         """Tests case when package discovery fails."""
-        with patch("pyvelocity.checks.typed.Setuptools", side_effect=RuntimeError("Discovery failed")):
+        with patch(
+            "setuptools.discovery.ConfigDiscovery",
+            side_effect=RuntimeError("Discovery failed"),
+        ):
             typed_check = Typed(configuration_files, configurations)
             result = typed_check.execute()
             # Should fail due to package discovery failure
             assert "Missing py.typed files in package directories" in result.message
             assert result.is_ok is False
 
-
-class TestTypingClassifierValidator:
-    """Test the TypingClassifierValidator class using pytest fixtures."""
-
-    @staticmethod
-    def test_no_pyproject_toml() -> None:
-        """Test validator when no pyproject.toml exists."""
-        validator = TypingClassifierValidator(None)
-        assert validator.is_typing_classifier_present() is False
-
-    @staticmethod
-    def test_no_project_section(mock_py_project_toml_no_project: PyProjectToml) -> None:
-        """Test validator when project section is missing."""
-        validator = TypingClassifierValidator(mock_py_project_toml_no_project)
-        assert validator.is_typing_classifier_present() is False
-
-    @staticmethod
-    def test_no_classifiers_field(mock_py_project_toml_no_classifiers: PyProjectToml) -> None:
-        """Test validator when classifiers field is missing."""
-        validator = TypingClassifierValidator(mock_py_project_toml_no_classifiers)
-        assert validator.is_typing_classifier_present() is False
-
-    @staticmethod
-    def test_classifiers_value_none(mock_py_project_toml_no_classifiers: PyProjectToml) -> None:
-        """Test validator when classifiers field has None value."""
-        validator = TypingClassifierValidator(mock_py_project_toml_no_classifiers)
-        assert validator.is_typing_classifier_present() is False
-
     @staticmethod
-    def test_classifiers_not_list(mock_py_project_toml_non_list_classifiers: PyProjectToml) -> None:
-        """Test validator when classifiers is not a list."""
-        validator = TypingClassifierValidator(mock_py_project_toml_non_list_classifiers)
-        assert validator.is_typing_classifier_present() is False
-
-    @staticmethod
-    def test_typing_classifier_present(mock_py_project_toml_with_typing_classifier: PyProjectToml) -> None:
-        """Test validator when 'Typing :: Typed' classifier is present."""
-        validator = TypingClassifierValidator(mock_py_project_toml_with_typing_classifier)
-        assert validator.is_typing_classifier_present() is True
-
-    @staticmethod
-    def test_typing_classifier_missing(mock_py_project_toml_without_typing_classifier: PyProjectToml) -> None:
-        """Test validator when 'Typing :: Typed' classifier is not present."""
-        validator = TypingClassifierValidator(mock_py_project_toml_without_typing_classifier)
-        assert validator.is_typing_classifier_present() is False
-
-    @staticmethod
-    def test_empty_classifiers_list(mock_py_project_toml_empty_classifiers: PyProjectToml) -> None:
-        """Test validator when classifiers list is empty."""
-        validator = TypingClassifierValidator(mock_py_project_toml_empty_classifiers)
-        assert validator.is_typing_classifier_present() is False
+    @pytest.mark.parametrize(
+        ("package_directory", "expect_is_ok"),
+        [
+            ("testpackage", True),
+            ("src/testpackage", True),
+        ],
+    )
+    def test_discover_packages_in_root(tmp_path: Path, package_directory: str, *, expect_is_ok: bool) -> None:
+        """Tests that packages are discovered in the project root, not in the current working directory."""
+        package_path = tmp_path / package_directory
+        package_path.mkdir(parents=True)
+        (package_path / "__init__.py").touch()
+        (package_path / "py.typed").touch()
+        configuration_files = ConfigurationFiles(tmp_path)
+        typed_check = Typed(configuration_files, Configurations(configuration_files))
+        assert typed_check._check_py_typed_files() is expect_is_ok  # noqa: SLF001 pylint: disable=protected-access
 
     @staticmethod
-    def test_extract_classifiers_value_py_project_toml_none() -> None:
-        """Test classifiers_value when py_project_toml is None."""
-        validator = TypingClassifierValidator(None)
-        assert validator.classifiers_value is None
+    def test_explicit_packages(tmp_path: Path) -> None:
+        """Packages listed in pyproject.toml are checked even though automatic discovery fails on them."""
+        (tmp_path / "pyproject.toml").write_text(
+            '[project]\nname = "example"\nversion = "0.0.0"\n\n[tool.setuptools]\npackages = ["a", "b"]\n\n[tool.setuptools.package-data]\n"*" = ["py.typed"]\n',
+            encoding="utf-8",
+        )
+        for name in ("a", "b"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "__init__.py").touch()
+            (tmp_path / name / "py.typed").touch()
+        configuration_files = ConfigurationFiles(tmp_path)
+        assert configuration_files.discover_packages().packages == ["a", "b"]
+        typed_check = Typed(configuration_files, Configurations(configuration_files))
+        assert typed_check._check_py_typed_files() is True  # noqa: SLF001 pylint: disable=protected-access
 
     @staticmethod
-    def test_extract_classifiers_value_project_none(mock_py_project_toml_no_project: PyProjectToml) -> None:
-        """Test classifiers_value when project is None."""
-        validator = TypingClassifierValidator(mock_py_project_toml_no_project)
-        assert validator.classifiers_value is None
+    def test_ambiguous_layout(tmp_path: Path) -> None:
+        """Ambiguous flat layout is reported with the message of setuptools instead of missing py.typed files."""
+        (tmp_path / "pyproject.toml").write_text('[project]\nname = "example"\nversion = "0.0.0"\n', encoding="utf-8")
+        for name in ("a", "b"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "__init__.py").touch()
+        configuration_files = ConfigurationFiles(tmp_path)
+        typed_check = Typed(configuration_files, Configurations(configuration_files))
+        result = typed_check.execute()
+        assert result.is_ok is False
+        assert result.message.startswith("Failed to discover packages: Multiple top-level packages discovered")
+        assert "Missing py.typed files in package directories" not in result.message
 
     @staticmethod
-    def test_extract_classifiers_value_classifiers_none(mock_py_project_toml_no_classifiers: PyProjectToml) -> None:
-        """Test classifiers_value when classifiers is None."""
-        validator = TypingClassifierValidator(mock_py_project_toml_no_classifiers)
-        assert validator.classifiers_value is None
+    def test_estimate_seconds() -> None:
+        """Importing setuptools is estimated only until it's imported."""
+        with patch.dict(sys.modules):
+            sys.modules.pop("setuptools", None)
+            assert Typed.estimate_seconds() == Cost.EXPENSIVE.estimated_seconds + ESTIMATED_SECONDS_IMPORT_SETUPTOOLS
+        with patch.dict(sys.modules, {"setuptools": sys.modules.get("setuptools", ModuleType("setuptools"))}):
+            assert Typed.estimate_seconds() == Cost.EXPENSIVE.estimated_seconds
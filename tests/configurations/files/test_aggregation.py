@@ -0,0 +1,93 @@
+"""Tests for aggregation.py."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pyvelocity.checks.aggregation import Checks
+from pyvelocity.configurations.aggregation import Configurations
+from pyvelocity.configurations.files.aggregation import ConfigurationFiles
+from pyvelocity.configurations.files.aggregation import InMemoryConfigurationFiles
+from pyvelocity.configurations.files.readme import DEFAULT_SCAN_LIMIT
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.mark.parametrize(
+    "documents",
+    [
+        {"src/package/__init__.py": "", "src/package/sub/__init__.py": "", "src/package/py.typed": ""},
+        {"package/__init__.py": "", "tests/__init__.py": "", "docs/conf.py": ""},
+        {"README.md": "# Project\n", "setup.cfg": "[metadata]\n"},
+        {},
+    ],
+)
+def test_in_memory(tmp_path: Path, resource_path_root: Path, documents: dict[str, str]) -> None:
+    """Results are the same as the project written to the file system."""
+    content = (resource_path_root / "pyproject_success.toml").read_text(encoding="utf-8")
+    documents = {"pyproject.toml": content, **documents}
+    for name, document in documents.items():
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / name).write_text(document, encoding="utf-8")
+    configuration_files = ConfigurationFiles(tmp_path)
+    expected = list(Checks(configuration_files, Configurations(configuration_files)).execute())
+    in_memory = InMemoryConfigurationFiles(documents)
+    assert list(Checks(in_memory, Configurations(in_memory)).execute()) == expected
+    expected_packages = configuration_files.discover_packages()
+    assert sorted(in_memory.discover_packages().packages or []) == sorted(expected_packages.packages or [])
+
+
+@pytest.mark.parametrize(
+    "setuptools",
+    [
+        'packages = ["a", "b"]\n',
+        'package-dir = {"" = "lib"}\npackages = ["a"]\n',
+        '[tool.setuptools.packages.find]\nwhere = ["lib"]\nexclude = ["b*"]\n',
+        '[tool.setuptools.packages.find]\ninclude = ["a*"]\nnamespaces = false\n',
+    ],
+)
+def test_in_memory_explicit_packages(tmp_path: Path, setuptools: str) -> None:
+    """Packages configured explicitly are the same as the project written to the file system."""
+    content = '[project]\nname = "example"\nversion = "0.0.0"\n\n[tool.setuptools]\n' + setuptools
+    documents = {"pyproject.toml": content}
+    for name in ("a/__init__.py", "a/sub/__init__.py", "b/__init__.py", "lib/a/__init__.py", "lib/b/__init__.py"):
+        documents[name] = ""
+    for name, document in documents.items():
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / name).write_text(document, encoding="utf-8")
+    expected = ConfigurationFiles(tmp_path).discover_packages()
+    actual = InMemoryConfigurationFiles(documents).discover_packages()
+    assert sorted(actual.packages or []) == sorted(expected.packages or [])
+    assert actual.package_dir == expected.package_dir
+
+
+def test_in_memory_without_py_project_toml() -> None:
+    configuration_files = InMemoryConfigurationFiles({"README.md": ""})
+    assert configuration_files.py_project_toml is None
+    assert configuration_files.read_readme() is not None
+    assert configuration_files.exists("./README.md") is True
+
+
+@pytest.mark.parametrize(
+    ("py_project_toml", "expected"),
+    [
+        ("[tool.pyvelocity]\nreadme-scan-kib = 1\n", 1024),
+        ("[tool.pyvelocity]\nreadme-scan-kib = 0\n", DEFAULT_SCAN_LIMIT),
+        ("[tool.pyvelocity]\nreadme-scan-kib = true\n", DEFAULT_SCAN_LIMIT),
+        ("[project]\n", DEFAULT_SCAN_LIMIT),
+    ],
+)
+def test_readme_scan_limit(tmp_path: Path, py_project_toml: str, expected: int) -> None:
+    """The head of README.md up to the limit is read from the file system or documents."""
+    content = "# Project\n" + "x" * 2048
+    (tmp_path / "pyproject.toml").write_text(py_project_toml, encoding="utf-8")
+    (tmp_path / "README.md").write_text(content, encoding="utf-8")
+    documents = {"pyproject.toml": py_project_toml, "README.md": content}
+    for configuration_files in [ConfigurationFiles(tmp_path), InMemoryConfigurationFiles(documents)]:
+        assert configuration_files.readme_scan_limit == expected
+        readme = configuration_files.read_readme()
+        assert readme is not None
+        assert readme.data == content.encode()[:expected]
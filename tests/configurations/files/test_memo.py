@@ -0,0 +1,40 @@
+"""Tests for memo.py."""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+from pyvelocity.configurations.files.memo import ParsedFiles
+from pyvelocity.configurations.files.readme import ReadMe
+from pyvelocity.configurations.files.snapshot import Snapshot
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_disabled(tmp_path: Path) -> None:
+    path = tmp_path / "README.md"
+    path.write_text("# Project\n", encoding="utf-8")
+    parsed_files = ParsedFiles()
+    snapshot = Snapshot(tmp_path)
+    assert parsed_files.get(ReadMe.from_bytes, snapshot, "README.md") is not parsed_files.get(
+        ReadMe.from_bytes,
+        snapshot,
+        "README.md",
+    )
+
+
+def test_enabled(tmp_path: Path) -> None:
+    """Parsed file is reused until its mtime or size changes."""
+    path = tmp_path / "README.md"
+    path.write_text("# Project\n", encoding="utf-8")
+    parsed_files = ParsedFiles()
+    parsed_files.is_enabled = True
+    readme = parsed_files.get(ReadMe.from_bytes, Snapshot(tmp_path), "README.md")
+    assert parsed_files.get(ReadMe.from_bytes, Snapshot(tmp_path), "README.md") is readme
+    path.write_text("# Project!\n", encoding="utf-8")
+    os.utime(path, ns=(0, 0))
+    changed = parsed_files.get(ReadMe.from_bytes, Snapshot(tmp_path), "README.md")
+    assert changed is not readme
+    assert changed.content == "# Project!\n"
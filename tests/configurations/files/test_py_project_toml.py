@@ -0,0 +1,47 @@
+"""Tests for py_project_toml.py."""
+
+import pytest
+
+from pyvelocity.configurations.files import toml_backend
+from pyvelocity.configurations.files.py_project_toml import PyProjectToml
+
+CONTENT = """\
+[project]
+requires-python = ">=3.11"
+keywords = ["pyvelocity"]
+
+[tool.ruff]
+line-length = 119
+"""
+
+
+class TestPyProjectToml:
+    """Test for PyProjectToml."""
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "py_project_toml",
+        [PyProjectToml.from_string(CONTENT), PyProjectToml.from_mapping(toml_backend.loads(CONTENT))],
+    )
+    def test_in_memory(py_project_toml: PyProjectToml) -> None:
+        assert py_project_toml.project is not None
+        assert py_project_toml.project.requires_python.value == ">=3.11"
+        assert py_project_toml.ruff is not None
+        assert py_project_toml.ruff.line_length.value == 119  # noqa: PLR2004
+        assert py_project_toml.black is None
+
+    @staticmethod
+    def test_neither_path_nor_parsed_toml() -> None:
+        with pytest.raises(TypeError):
+            PyProjectToml()
+
+    @staticmethod
+    def test_lazy_sections() -> None:
+        """Each section is built on first access and then reused."""
+        py_project_toml = PyProjectToml.from_string(CONTENT)
+        assert "ruff" not in vars(py_project_toml)
+        assert "project" not in vars(py_project_toml)
+        ruff = py_project_toml.ruff
+        assert py_project_toml.ruff is ruff
+        assert "ruff" in vars(py_project_toml)
+        assert "project" not in vars(py_project_toml)
@@ -31,3 +31,23 @@ class TestReadMe:
         readme = ReadMe(readme_path)
         assert readme.has_badge("test badge") is True
         assert readme.has_badge("missing badge") is False
+
+    @staticmethod
+    def test_from_string() -> None:
+        readme = ReadMe.from_string("This contains a test badge")
+        assert readme.has_badge("test badge") is True
+
+    @staticmethod
+    def test_scan_limit(tmp_path: Path) -> None:
+        """Only the head of README.md is read, so badges beyond the limit aren't found."""
+        readme_path = tmp_path / "README.md"
+        readme_path.write_bytes(b"top badge\n" + b"x" * 1024 + b"\nbottom badge\n")
+        readme = ReadMe(readme_path, limit=1024)
+        assert len(readme.data) == 1024  # noqa: PLR2004
+        assert readme.has_badge("top badge") is True
+        assert readme.has_badge("bottom badge") is False
+
+    @staticmethod
+    def test_content_cut_in_multibyte_character() -> None:
+        readme = ReadMe(content="# プロジェクト", limit=4)
+        assert readme.content == "# �"
@@ -0,0 +1,78 @@
+"""Tests for snapshot.py."""
+
+from __future__ import annotations
+
+from pathlib import PurePosixPath
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pyvelocity.configurations.files.snapshot import SYSCALLS
+from pyvelocity.configurations.files.snapshot import Snapshot
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    (tmp_path / "src" / "package").mkdir(parents=True)
+    (tmp_path / "src" / "package" / "__init__.py").touch()
+    (tmp_path / "src" / "package" / "py.typed").touch()
+    (tmp_path / "pyproject.toml").write_text("[project]\n", encoding="utf-8")
+    (tmp_path / "broken").symlink_to(tmp_path / "missing")
+    return tmp_path
+
+
+def test_exists(project: Path) -> None:
+    """Each directory is listed once regardless of the number of lookups."""
+    snapshot = Snapshot(project)
+    snapshot.prefetch(["pyproject.toml", "setup.py", "setup.cfg"])
+    assert snapshot.syscalls == {"scandir": 1}
+    assert snapshot.exists("pyproject.toml")
+    assert not snapshot.exists("setup.py")
+    assert not snapshot.exists("setup.cfg")
+    assert snapshot.exists(PurePosixPath("src/package/py.typed"))
+    assert snapshot.exists("src/package/__init__.py")
+    assert not snapshot.exists("src/other/py.typed")
+    assert not snapshot.exists("pyproject.toml/py.typed")
+    assert snapshot.syscalls == {"scandir": 3}
+
+
+def test_exists_broken_symbolic_link(project: Path) -> None:
+    snapshot = Snapshot(project)
+    assert not snapshot.exists("broken")
+    assert snapshot.stat("broken") is None
+
+
+def test_read(project: Path) -> None:
+    """File is stat-ed and read at most once."""
+    snapshot = Snapshot(project)
+    for _ in range(2):
+        assert snapshot.read_text("pyproject.toml") == "[project]\n"
+        stat = snapshot.stat("pyproject.toml")
+        assert stat is not None
+        assert stat.st_size == len("[project]\n")
+    assert snapshot.syscalls == {"scandir": 1, "read": 1, "stat": 1}
+    with pytest.raises(FileNotFoundError):
+        snapshot.read_bytes("README.md")
+
+
+def test_syscalls(project: Path) -> None:
+    """System calls of every snapshot in the process are summed up."""
+    SYSCALLS.clear()
+    assert SYSCALLS.summarize() == "0"
+    Snapshot(project).read_bytes("pyproject.toml")
+    Snapshot(project).exists("setup.py")
+    assert SYSCALLS.summarize() == "3 (read: 1, scandir: 2)"
+
+
+def test_read_head(project: Path) -> None:
+    """Head of the file is read up to the size, and sliced from the whole content once it's read."""
+    snapshot = Snapshot(project)
+    assert snapshot.read_bytes("pyproject.toml", 4) == b"[pro"
+    assert snapshot.read_bytes("pyproject.toml", 4) == b"[pro"
+    assert snapshot.syscalls["read"] == 1
+    assert snapshot.read_bytes("pyproject.toml") == b"[project]\n"
+    assert snapshot.read_bytes("pyproject.toml", 2) == b"[p"
+    assert snapshot.syscalls["read"] == 2  # noqa: PLR2004
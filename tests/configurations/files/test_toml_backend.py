@@ -0,0 +1,63 @@
+"""Tests for toml_backend.py."""
+
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pyvelocity.configurations.files import toml_backend
+from pyvelocity.configurations.files.toml_backend import ENVIRONMENT_VARIABLE_TOML_BACKEND
+from pyvelocity.configurations.files.toml_backend import get_backend
+from pyvelocity.configurations.files.toml_backend import list_available_backends
+from pyvelocity.configurations.files.toml_backend import load_backend
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+CONTENT = """\
+[project]
+name = "package"
+classifiers = ["Programming Language :: Python :: 3.11", "Typing :: Typed"]
+
+[tool.setuptools.package-data]
+"*" = ["py.typed"]
+"""
+
+
+@pytest.fixture(autouse=True)
+def _clear_backend() -> Generator[None, None, None]:
+    get_backend.cache_clear()
+    yield
+    get_backend.cache_clear()
+
+
+def test_default(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Standard library is preferred."""
+    monkeypatch.delenv(ENVIRONMENT_VARIABLE_TOML_BACKEND, raising=False)
+    expected = "tomllib" if sys.version_info >= (3, 11) else "tomli"
+    assert get_backend().name == expected
+
+
+@pytest.mark.parametrize("requested", ["tomli", "not-installed", "os"])
+def test_requested(monkeypatch: pytest.MonkeyPatch, requested: str) -> None:
+    """Falls back to the default when the requested backend isn't installed or isn't a TOML parser."""
+    pytest.importorskip("tomli")
+    monkeypatch.setenv(ENVIRONMENT_VARIABLE_TOML_BACKEND, requested)
+    expected = "tomli" if requested == "tomli" or sys.version_info < (3, 11) else "tomllib"
+    assert get_backend().name == expected
+
+
+def test_not_installed() -> None:
+    assert load_backend("rtoml-not-installed") is None
+
+
+def test_available_backends() -> None:
+    """Every installed backend parses the same."""
+    backends = list_available_backends()
+    assert backends
+    expected = toml_backend.loads(CONTENT)
+    assert expected["tool"]["setuptools"]["package-data"] == {"*": ["py.typed"]}
+    for backend in backends:
+        assert backend.loads(CONTENT) == expected
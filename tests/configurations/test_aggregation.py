@@ -0,0 +1,17 @@
+"""Tests for aggregation.py."""
+
+from pyvelocity.configurations.aggregation import Configurations
+from pyvelocity.configurations.files.aggregation import InMemoryConfigurationFiles
+
+
+def test_lazy_tools() -> None:
+    """Each tool is resolved on first access and then reused."""
+    configuration_files = InMemoryConfigurationFiles({"pyproject.toml": "[tool.ruff]\nline-length = 119\n"})
+    configurations = Configurations(configuration_files)
+    assert "ruff" not in vars(configurations)
+    ruff = configurations.ruff
+    assert ruff.line_length.value == 119  # noqa: PLR2004
+    assert configurations.ruff is ruff
+    assert "black" not in vars(configurations)
+    assert configuration_files.py_project_toml is not None
+    assert "black" not in vars(configuration_files.py_project_toml)
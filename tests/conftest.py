@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import io
+import json
 import shutil
+import tarfile
 import tempfile
+import zipfile
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -15,6 +19,7 @@ from pyvelocity.configurations.aggregation import Configurations
 from pyvelocity.configurations.files import ConfigurationFile
 from pyvelocity.configurations.files.aggregation import ConfigurationFiles
 from pyvelocity.configurations.files.py_project_toml import PyProjectToml
+from pyvelocity.git import Git
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -56,6 +61,73 @@ def configured_tmp_path(ch_tmp_path: Path, resource_path_root: Path, files: list
     return ch_tmp_path
 
 
+@pytest.fixture
+def project_roots(tmp_path: Path, resource_path_root: Path) -> list[Path]:
+    """Prepares projects which have different results."""
+    files = ["pyproject_success.toml", "pyproject_error.toml", "pyproject_keywords_missing.toml"]
+    roots = []
+    for index, file in enumerate(files):
+        root = tmp_path / f"project_{index}"
+        root.mkdir()
+        shutil.copy(resource_path_root / file, root / "pyproject.toml")
+        roots.append(root)
+    return roots
+
+
+@pytest.fixture
+# Reason: Using fixture. pylint: disable-next=redefined-outer-name
+def git_repository(tmp_path: Path, project_roots: list[Path]) -> Path:
+    """Commits projects into Git repository, then changes README.md of project_1 in the working tree."""
+    for args in (["init", "--quiet"], ["add", "."], ["commit", "--quiet", "--message", "Initial commit"]):
+        Git(tmp_path).run(
+            "-c",
+            "user.name=pyvelocity",
+            "-c",
+            "user.email=pyvelocity@example.com",
+            "-c",
+            "commit.gpgsign=false",
+            *args,
+        )
+    (project_roots[1] / "README.md").write_text("# Project\n", encoding="utf-8")
+    Git(tmp_path).run("add", ".")
+    return tmp_path
+
+
+@pytest.fixture
+def distributions(tmp_path: Path, resource_path_root: Path) -> list[Path]:
+    """Builds source distribution and wheel of the typed package whose metadata passes checks."""
+    path_sdist = tmp_path / "pyvelocity-0.1.0.tar.gz"
+    members = {
+        "pyproject.toml": (resource_path_root / "pyproject_success.toml").read_bytes(),
+        "README.md": b"# pyvelocity\n",
+        "pyvelocity/__init__.py": b"",
+        "pyvelocity/py.typed": b"",
+    }
+    with tarfile.open(path_sdist, "w:gz") as archive:
+        for name, content in members.items():
+            info = tarfile.TarInfo(f"pyvelocity-0.1.0/{name}")
+            info.size = len(content)
+            archive.addfile(info, io.BytesIO(content))
+    path_wheel = tmp_path / "pyvelocity-0.1.0-py3-none-any.whl"
+    metadata = "\n".join(
+        [
+            "Metadata-Version: 2.1",
+            "Name: pyvelocity",
+            "Version: 0.1.0",
+            "Keywords: pyvelocity,velocity",
+            *(f"Classifier: Programming Language :: Python :: 3.{minor}" for minor in range(10, 15)),
+            "Classifier: Typing :: Typed",
+            "Requires-Python: >=3.10",
+            "",
+        ],
+    )
+    with zipfile.ZipFile(path_wheel, "w") as archive:
+        archive.writestr("pyvelocity/__init__.py", "")
+        archive.writestr("pyvelocity/py.typed", "")
+        archive.writestr("pyvelocity-0.1.0.dist-info/METADATA", metadata)
+    return [path_sdist, path_wheel]
+
+
 def _create_temp_pyproject_toml(content: str) -> PyProjectToml:
     """Create a temporary pyproject.toml file with the given content and return PyProjectToml object."""
     with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
@@ -99,6 +171,7 @@ def mock_setuptools() -> Setuptools:
     # Create a temporary pyproject.toml with setuptools configuration
     content = """[tool.setuptools]
 zip-safe = "false"
+packages = ["testpackage"]
 package-data = {"*" = ["py.typed"]}
 """
     pyproject_toml = _create_temp_pyproject_toml(content)
@@ -109,9 +182,6 @@ package-data = {"*" = ["py.typed"]}
         msg = "Failed to create setuptools configuration"
         raise RuntimeError(msg)
 
-    # Add packages attribute for typed check compatibility
-    setuptools.packages = ["testpackage"]  # type: ignore[attr-defined]
-
     return setuptools
 
 
@@ -121,9 +191,10 @@ def mock_setuptools_with_packages() -> Callable[[list[str]], Setuptools]:
 
     def _mock_setuptools_with_packages(packages: list[str]) -> Setuptools:
         # Create a temporary pyproject.toml with setuptools configuration
-        content = """[tool.setuptools]
+        content = f"""[tool.setuptools]
 zip-safe = "false"
-package-data = {"*" = ["py.typed"]}
+packages = {json.dumps(packages)}
+package-data = {{"*" = ["py.typed"]}}
 """
         pyproject_toml = _create_temp_pyproject_toml(content)
         setuptools = pyproject_toml.setuptools
@@ -133,9 +204,6 @@ package-data = {"*" = ["py.typed"]}
             msg = "Failed to create setuptools configuration"
             raise RuntimeError(msg)
 
-        # Set the specific packages for this instance
-        setuptools.packages = packages  # type: ignore[attr-defined]
-
         return setuptools
 
     return _mock_setuptools_with_packages
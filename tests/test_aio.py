@@ -0,0 +1,67 @@
+"""Tests for aio.py."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from pyvelocity import aio
+from pyvelocity.pyvelocity import check_project
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from pyvelocity.checks.aggregation import Results
+
+
+def test_check_project(project_roots: list[Path]) -> None:
+    """Results are same as synchronous API."""
+    root = project_roots[1]
+    results = asyncio.run(aio.check_project(root))
+    assert results.results == check_project(root).results
+
+
+def test_check_projects(project_roots: list[Path]) -> None:
+    """Every project is checked with bounded concurrency."""
+    roots = project_roots
+
+    async def collect() -> dict[Path, Results]:
+        return {root: results async for root, results in aio.check_projects(roots, concurrency=2)}
+
+    results = asyncio.run(collect())
+    assert {root: value.results for root, value in results.items()} == {
+        root: check_project(root).results for root in roots
+    }
+
+
+def test_check_projects_break(project_roots: list[Path]) -> None:
+    """Stopping iteration cancels projects not yet checked."""
+    roots = project_roots
+
+    async def first() -> Path:
+        generator = aio.check_projects(roots, concurrency=1)
+        root, _ = await anext(generator)
+        await generator.aclose()
+        return root
+
+    assert asyncio.run(first()) in roots
+
+
+def test_check_projects_lazy(project_roots: list[Path]) -> None:
+    """Roots are consumed only as far as the number of pending projects allows."""
+    consumed: list[Path] = []
+
+    def generate_roots() -> Iterator[Path]:
+        for root in project_roots:
+            consumed.append(root)
+            yield root
+
+    async def first() -> Path:
+        generator = aio.check_projects(generate_roots(), concurrency=1)
+        root, _ = await anext(generator)
+        await generator.aclose()
+        return root
+
+    assert asyncio.run(first()) == project_roots[0]
+    assert consumed == project_roots[:1]
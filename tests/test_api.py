@@ -0,0 +1,54 @@
+"""Tests for api.py."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pyvelocity import api
+from pyvelocity.pyvelocity import check_project
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_check_many(project_roots: list[Path], jobs: int) -> None:
+    """Roots are consumed lazily and results are paired with their roots."""
+    consumed = []
+
+    def generate_roots() -> Generator[str, None, None]:
+        for root in project_roots:
+            consumed.append(root)
+            yield str(root)
+
+    stream = api.check_many(generate_roots(), jobs=jobs)
+    assert consumed == []
+    expected = sorted((root, result.id) for root in project_roots for result in check_project(root).results)
+    assert sorted((root, result.id) for root, result in stream) == expected
+
+
+def test_check_many_select(project_roots: list[Path]) -> None:
+    select = ["keywords", "typed"]
+    results = [result for _, result in api.check_many(project_roots, select=select)]
+    assert {result.id for result in results} == {"keywords", "typed"}
+    assert all(isinstance(result, api.Result) for result in results)
+
+
+def test_check_many_unknown_id() -> None:
+    with pytest.raises(ValueError, match="Unknown check IDs: unknown"):
+        api.check_many([], select=["typed", "unknown"])
+
+
+def test_check_documents(resource_path_root: Path) -> None:
+    content = (resource_path_root / "pyproject_success.toml").read_text(encoding="utf-8")
+    results = api.check_documents({"pyproject.toml": content, "setup.py": ""}, select=["legacy-setup-files"])
+    assert results.message == "Legacy setup files found: setup.py. Use pyproject.toml instead."
+
+
+def test_check_revisions(git_repository: Path, project_roots: list[Path]) -> None:
+    checked = dict(api.check_revisions(str(git_repository), ["HEAD"], directory=project_roots[0].name))
+    assert checked["HEAD"] is not None
+    assert checked["HEAD"].results == check_project(project_roots[0]).results
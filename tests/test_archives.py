@@ -0,0 +1,80 @@
+"""Tests for archives.py."""
+
+from __future__ import annotations
+
+import io
+import tarfile
+import zipfile
+from email.parser import HeaderParser
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pyvelocity.archives import METADATA_CHECK_IDS
+from pyvelocity.archives import SourceDistribution
+from pyvelocity.archives import UnsupportedArchiveError
+from pyvelocity.archives import Wheel
+from pyvelocity.archives import check_archive
+from pyvelocity.configurations.files.readme import DEFAULT_SCAN_LIMIT
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_check_archive(distributions: list[Path]) -> None:
+    """Both source distribution and wheel pass checks about metadata."""
+    for path in distributions:
+        results = check_archive(path)
+        assert results.is_ok
+        assert {result.id for result in results.results} <= set(METADATA_CHECK_IDS)
+    # While pyproject.toml in the source distribution filters check typed, wheel has no filter.
+    assert [result.id for result in check_archive(distributions[1]).results] == [
+        "requires-python",
+        "classifiers",
+        "keywords",
+        "typed",
+    ]
+
+
+def test_check_archive_wheel_without_py_typed(tmp_path: Path, distributions: list[Path]) -> None:
+    """Classifier Typing :: Typed requires py.typed in the wheel."""
+    path = tmp_path / "broken-0.1.0-py3-none-any.whl"
+    with zipfile.ZipFile(distributions[1]) as source, zipfile.ZipFile(path, "w") as destination:
+        for name in source.namelist():
+            if not name.endswith("py.typed"):
+                destination.writestr(name, source.read(name))
+    results = check_archive(path)
+    assert not results.is_ok
+    assert [result.id for result in results.results if not result.is_ok] == ["typed"]
+
+
+def test_source_distribution_readme_head(tmp_path: Path) -> None:
+    """Only the head of large README.md is read from the source distribution."""
+    path = tmp_path / "package-0.1.0.tar.gz"
+    content = b"# Project\n" + b"x" * DEFAULT_SCAN_LIMIT * 4
+    with tarfile.open(path, "w:gz") as archive:
+        info = tarfile.TarInfo("package-0.1.0/README.md")
+        info.size = len(content)
+        archive.addfile(info, io.BytesIO(content))
+    configuration_files = SourceDistribution(path).read()
+    assert configuration_files.readme_head == content[:DEFAULT_SCAN_LIMIT]
+    assert configuration_files.exists("README.md")
+    readme = configuration_files.read_readme()
+    assert readme is not None
+    assert readme.data == content[:DEFAULT_SCAN_LIMIT]
+
+
+@pytest.mark.parametrize("name", ["package.zip", "package.whl", "package.tar.gz"])
+def test_check_archive_unsupported(tmp_path: Path, name: str) -> None:
+    path = tmp_path / name
+    path.write_bytes(b"not an archive")
+    with pytest.raises(UnsupportedArchiveError):
+        check_archive(path)
+
+
+def test_wheel_convert_keywords_separated_by_space() -> None:
+    """Old tools separated keywords by space instead of comma."""
+    metadata = HeaderParser().parsestr("Name: package\nVersion: 0.1.0\nKeywords: check velocity\n")
+    assert Wheel.convert(metadata, has_py_typed=False) == {
+        "project": {"name": "package", "version": "0.1.0", "keywords": ["check", "velocity"]},
+    }
@@ -0,0 +1,131 @@
+"""Tests for cache.py."""
+
+from __future__ import annotations
+
+import datetime as dt
+import shutil
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from pyvelocity.cache import NAME_PARSED_PY_PROJECT_TOML
+from pyvelocity.cache import WHERE_CACHE
+from pyvelocity.cache import ParsedFileCache
+from pyvelocity.cache import ResultCache
+from pyvelocity.checks.typed import Typed
+from pyvelocity.pyvelocity import check_project
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_hit(project_roots: list[Path]) -> None:
+    """Unchanged project returns cached results without parsing configuration files."""
+    root = project_roots[2]
+    expected = check_project(root, cache=True).results
+    assert (root / WHERE_CACHE / ".gitignore").read_text(encoding="utf-8").endswith("*\n")
+    with patch("pyvelocity.pyvelocity.ConfigurationFiles", side_effect=AssertionError):
+        assert check_project(root, cache=True).results == expected
+    result_cache = ResultCache(root)
+    assert result_cache.get_all() == expected
+    # Files whose mtime and size are unchanged are not hashed again.
+    assert result_cache.fingerprints.is_hashed is False
+
+
+def test_changed_input(project_roots: list[Path]) -> None:
+    """Only checks whose inputs changed are executed again."""
+    root = project_roots[2]
+    (root / "README.md").write_text("", encoding="utf-8")
+    check_project(root, cache=True)
+    # Modifying content of existing file doesn't change directory structure.
+    (root / "README.md").write_text("# Project\n", encoding="utf-8")
+    with patch.object(Typed, "execute", side_effect=AssertionError):
+        results = {result.id: result for result in check_project(root, cache=True).results}
+    assert results["badges"].message.startswith("README.md is missing the following badges:")
+
+
+def test_changed_tree(project_roots: list[Path]) -> None:
+    """Adding package directory invalidates checks depending on directory structure."""
+    root = project_roots[2]
+    message_before = {result.id: result for result in check_project(root, cache=True).results}["typed"].message
+    # The package configured in pyproject.toml.
+    (root / "pyvelocity").mkdir()
+    (root / "pyvelocity" / "__init__.py").touch()
+    (root / "pyvelocity" / "py.typed").touch()
+    message_after = {result.id: result for result in check_project(root, cache=True).results}["typed"].message
+    assert "Missing py.typed files in package directories" in message_before
+    assert "Missing py.typed files in package directories" not in message_after
+
+
+def test_version_changed(project_roots: list[Path]) -> None:
+    root = project_roots[2]
+    check_project(root, cache=True)
+    with patch("pyvelocity.cache.__version__", "0.0.0"):
+        assert ResultCache(root).get_all() is None
+
+
+def test_broken(project_roots: list[Path]) -> None:
+    root = project_roots[2]
+    (root / WHERE_CACHE).mkdir()
+    (root / WHERE_CACHE / "results.json").write_text("{", encoding="utf-8")
+    assert ResultCache(root).get_all() is None
+    assert check_project(root, cache=True).results == check_project(root).results
+
+
+def test_parsed_file_cache(project_roots: list[Path]) -> None:
+    """Unchanged pyproject.toml isn't parsed again even when results of some checks are executed again."""
+    root = project_roots[2]
+    check_project(root, cache=True)
+    assert (root / WHERE_CACHE / NAME_PARSED_PY_PROJECT_TOML).exists()
+    (root / "README.md").write_text("# Project\n", encoding="utf-8")
+    with patch("pyvelocity.configurations.files.toml_backend.loads", side_effect=AssertionError):
+        results = {result.id: result for result in check_project(root, cache=True).results}
+    assert results["badges"].message.startswith("README.md is missing the following badges:")
+    # Changed pyproject.toml is parsed again.
+    path = root / "pyproject.toml"
+    path.write_text(path.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+    with (
+        patch("pyvelocity.configurations.files.toml_backend.loads", side_effect=ValueError("parsed")),
+        pytest.raises(ValueError, match="parsed"),
+    ):
+        check_project(root, cache=True)
+
+
+def test_parsed_file_cache_broken(tmp_path: Path) -> None:
+    path = tmp_path / "pyproject.toml"
+    path.write_text("[project]\n", encoding="utf-8")
+    parsed_files = ParsedFileCache(tmp_path, "origin")
+    stat = path.stat()
+    assert parsed_files.get(path, stat) is None
+    (tmp_path / NAME_PARSED_PY_PROJECT_TOML).write_bytes(b"broken")
+    assert parsed_files.get(path, stat) is None
+    parsed_files.put(path, stat, {"project": {}})
+    assert parsed_files.get(path, stat) == {"project": {}}
+    # Date and time can't be serialized by marshal.
+    parsed_files.put(path, stat, {"project": {"date": dt.date(2026, 1, 1)}})
+    assert parsed_files.get(path, stat) == {"project": {}}
+
+
+def test_copied(project_roots: list[Path], tmp_path: Path) -> None:
+    """Cache copied from another directory, e.g. committed to Git and checked out, is never trusted."""
+    root = project_roots[2]
+    check_project(root, cache=True)
+    copied = tmp_path / "copied"
+    shutil.copytree(root, copied)
+    result_cache = ResultCache(copied)
+    assert result_cache.get_all() is None
+    assert result_cache.fingerprints.previous == {}
+    path = copied / "pyproject.toml"
+    assert result_cache.parsed_files is not None
+    assert result_cache.parsed_files.get(path, path.stat()) is None
+
+
+def test_copied_parsed_file_cache(tmp_path: Path) -> None:
+    """Parsed file written with another origin isn't unmarshaled."""
+    path = tmp_path / "pyproject.toml"
+    path.write_text("[project]\n", encoding="utf-8")
+    stat = path.stat()
+    ParsedFileCache(tmp_path, "origin").put(path, stat, {"project": {}})
+    with patch("pyvelocity.cache.marshal.loads", side_effect=AssertionError):
+        assert ParsedFileCache(tmp_path, "other").get(path, stat) is None
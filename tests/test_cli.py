@@ -1,16 +1,27 @@
 """Tests for `pyvelocity` package."""
 
+import json
+import os
+import re
+import shutil
+import sys
+
 # Reason: Accept risk of using subprocess.
 from pathlib import Path
 from subprocess import run  # nosec B404
 from unittest.mock import patch
 
+import click
 import pytest
 from click.testing import CliRunner
 
+from pyvelocity import __version__
 from pyvelocity import cli
+from pyvelocity.cache import WHERE_CACHE
 from pyvelocity.checks import Result
 from pyvelocity.checks.aggregation import Results
+from pyvelocity.client import ENVIRONMENT_VARIABLE_SOCKET
+from pyvelocity.git import Git
 
 
 def test_echo_success() -> None:
@@ -61,7 +72,6 @@ def test_echo_success_in_subprocess(temp_setup_py: Path) -> None:
             ["pyproject_error.toml", "setup_error.cfg"],
             3,
             (
-                "Legacy setup files found: setup.cfg. Use pyproject.toml instead.\n"
                 "Line length are not consistent.\n"
                 "\tMost common = 119\n"
                 "\tpyproject.toml tool.docformatter wrap-summaries = 118\n"
@@ -73,6 +83,7 @@ def test_echo_success_in_subprocess(temp_setup_py: Path) -> None:
                 "Programming Language :: Python :: 3.12, "
                 "Programming Language :: Python :: 3.13, "
                 "Programming Language :: Python :: 3.14\n"
+                "Legacy setup files found: setup.cfg. Use pyproject.toml instead.\n"
                 "README.md file not found\n"
                 "Error: Looks there are some of improvements.\n"
             ),
@@ -94,8 +105,7 @@ def test_cli_success_path(successful_result: Result) -> None:
     with (
         # To prevent real checks from running;
         # they trigger setuptools DEBUG logs that close Click's captured stdout via pytest's live log handler.
-        patch("pyvelocity.cli.Checks"),
-        patch("pyvelocity.cli.Results", return_value=successful_results),
+        patch("pyvelocity.pyvelocity.check_projects", return_value=(results for results in [successful_results])),
         patch("pyvelocity.cli.echo_success") as mock_echo_success,
     ):
         runner = CliRunner()
@@ -105,8 +115,281 @@ def test_cli_success_path(successful_result: Result) -> None:
         mock_echo_success.assert_called_once()
 
 
+def test_multiple_roots(tmp_path: Path, resource_path_root: Path) -> None:
+    """Checks several projects in one process without changing the current working directory."""
+    for name in ["project_a", "project_b"]:
+        (tmp_path / name).mkdir()
+        shutil.copy(resource_path_root / "pyproject_success.toml", tmp_path / name / "pyproject.toml")
+    (tmp_path / "project_b" / "setup.py").touch()
+    runner = CliRunner()
+    result = runner.invoke(cli.main, [str(tmp_path / "project_a"), str(tmp_path / "project_b")])
+    assert result.exit_code == 3  # noqa: PLR2004
+    assert result.output == (
+        f"{tmp_path / 'project_a'}:\n"
+        "README.md file not found\n"
+        f"{tmp_path / 'project_b'}:\n"
+        "Legacy setup files found: setup.py. Use pyproject.toml instead.\n"
+        "README.md file not found\n"
+        "Error: Looks there are some of improvements.\n"
+    )
+
+
+def test_cache_opt_in(tmp_path: Path, resource_path_root: Path) -> None:
+    """Results are cached only when --cache is specified, same as the API."""
+    shutil.copy(resource_path_root / "pyproject_success.toml", tmp_path / "pyproject.toml")
+    runner = CliRunner()
+    runner.invoke(cli.main, [str(tmp_path)])
+    assert not (tmp_path / WHERE_CACHE).exists()
+    runner.invoke(cli.main, ["--cache", str(tmp_path)])
+    assert (tmp_path / WHERE_CACHE).is_dir()
+
+
+def test_ambiguous_layout(tmp_path: Path) -> None:
+    """Project whose packages setuptools can't discover is reported as improvement instead of crash."""
+    (tmp_path / "pyproject.toml").write_text('[project]\nname = "example"\nversion = "0.0.0"\n', encoding="utf-8")
+    for name in ["pkga", "pkgb"]:
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "__init__.py").touch()
+    result = CliRunner().invoke(cli.main, [str(tmp_path)])
+    assert result.exit_code == 3  # noqa: PLR2004
+    assert "Failed to discover packages: Multiple top-level packages discovered" in result.output
+
+
+def test_recursive(tmp_path: Path, resource_path_root: Path) -> None:
+    """Checks every project under the directory."""
+    for name in ["packages/project_a", "packages/project_b", ".venv/project_c"]:
+        (tmp_path / name).mkdir(parents=True)
+        shutil.copy(resource_path_root / "pyproject_success.toml", tmp_path / name / "pyproject.toml")
+    runner = CliRunner()
+    result = runner.invoke(cli.main, ["--recursive", str(tmp_path)])
+    assert result.exit_code == 3  # noqa: PLR2004
+    assert result.output == (
+        f"{tmp_path / 'packages/project_a'}:\n"
+        "README.md file not found\n"
+        f"{tmp_path / 'packages/project_b'}:\n"
+        "README.md file not found\n"
+        "Error: Looks there are some of improvements.\n"
+    )
+
+
+def test_recursive_no_project(tmp_path: Path) -> None:
+    runner = CliRunner()
+    result = runner.invoke(cli.main, ["--recursive", str(tmp_path)])
+    assert result.exit_code == 1
+    assert result.output == "Error: No pyproject.toml found.\n"
+
+
 def test_help() -> None:
     runner = CliRunner()
     help_result = runner.invoke(cli.main, ["--help"])
     assert help_result.exit_code == 0
-    assert "--help  Show this message and exit." in help_result.output
+    assert re.search(r"--help\s+Show this message and exit\.", help_result.output)
+
+
+def test_version() -> None:
+    runner = CliRunner()
+    result = runner.invoke(cli.main, ["--version"])
+    assert result.exit_code == 0
+    assert result.output == f"pyvelocity, version {__version__}\n"
+
+
+@pytest.mark.parametrize(
+    ("module", "deferred_modules"),
+    [
+        ("pyvelocity.cli", ["pyvelocity.checks", "pyvelocity.archives", "pyvelocity.daemon", "setuptools"]),
+        ("pyvelocity.pyvelocity", ["setuptools", "concurrent.futures.process"]),
+    ],
+)
+def test_deferred_imports(module: str, deferred_modules: list[str]) -> None:
+    """Modules which take much of startup time are imported only when they are used."""
+    code = f"import json, sys, {module}; print(json.dumps(sorted(sys.modules)))"
+    # Reason: Accept risk of using subprocess since it executes this package by the same interpreter.
+    completed_process = run([sys.executable, "-c", code], check=True, capture_output=True, text=True)  # noqa: S603  # nosec B603
+    imported_modules = set(json.loads(completed_process.stdout))
+    assert imported_modules.isdisjoint(deferred_modules)
+
+
+@pytest.mark.usefixtures("configured_tmp_path")
+@pytest.mark.parametrize("files", [["pyproject_success.toml", "setup_success.cfg"]])
+def test_fail_fast() -> None:
+    """Stops at the first failing check."""
+    runner = CliRunner()
+    result = runner.invoke(cli.main, ["--fail-fast"])
+    assert result.exit_code == 3  # noqa: PLR2004
+    assert result.output == (
+        "Legacy setup files found: setup.cfg. Use pyproject.toml instead.\n"
+        "Error: Looks there are some of improvements.\n"
+    )
+
+
+@pytest.mark.usefixtures("configured_tmp_path")
+@pytest.mark.parametrize("files", [["pyproject_success.toml", "setup_success.cfg"]])
+def test_time_budget() -> None:
+    """Reports checks skipped by time budget without failing."""
+    runner = CliRunner()
+    result = runner.invoke(cli.main, ["--time-budget", "0ms"])
+    assert result.exit_code == 0
+    assert result.output.startswith(
+        "Skipped legacy-setup-files check since it may exceed time budget 0ms\n"
+        "Skipped badges check since it may exceed time budget 0ms\n",
+    )
+
+
+def test_time_budget_cold_process(tmp_path: Path) -> None:
+    """Typed check is skipped by short time budget in a cold process since it imports setuptools."""
+    (tmp_path / "pyproject.toml").write_text('[project]\nname = "example"\nversion = "0.0.0"\n', encoding="utf-8")
+    # Reason: Arguments are built by this test. pylint: disable-next=subprocess-run-check
+    completed_process = run(  # nosec B603
+        [sys.executable, "-m", "pyvelocity", "--time-budget", "100ms", "--format", "ndjson"],
+        cwd=tmp_path,
+        # To check in the cold process even when the daemon is running.
+        env={**os.environ, ENVIRONMENT_VARIABLE_SOCKET: str(tmp_path / "nonexistent.sock")},
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        check=False,
+    )
+    lines = {line["id"]: line for line in map(json.loads, completed_process.stdout.splitlines())}
+    assert lines["typed"]["message"] == "Skipped typed check since it may exceed time budget 100ms"
+
+
+@pytest.mark.parametrize(("value", "expect_seconds"), [("200ms", 0.2), ("1.5s", 1.5), ("2", 2.0), (None, None)])
+def test_convert_duration(value: str | None, expect_seconds: float | None) -> None:
+    assert cli.convert_duration(click.Context(cli.main), click.Option(["--time-budget"]), value) == expect_seconds
+
+
+@pytest.mark.parametrize("value", ["fast", "-1s"])
+def test_time_budget_invalid(value: str) -> None:
+    runner = CliRunner()
+    result = runner.invoke(cli.main, ["--time-budget", value])
+    assert result.exit_code == 2  # noqa: PLR2004
+    assert "Invalid value for '--time-budget'" in result.output
+
+
+@pytest.mark.usefixtures("configured_tmp_path")
+@pytest.mark.parametrize("files", [["pyproject_success.toml", "setup_success.cfg"]])
+def test_format_ndjson() -> None:
+    """Writes a line of JSON for each check."""
+    runner = CliRunner()
+    result = runner.invoke(cli.main, ["--format", "ndjson"])
+    assert result.exit_code == 3  # noqa: PLR2004
+    lines = {line["id"]: line for line in map(json.loads, result.stdout.splitlines())}
+    assert all(set(line) == {"id", "is_ok", "message", "project", "duration"} for line in lines.values())
+    assert lines["using-py-project-toml"]["is_ok"] is True
+    assert lines["legacy-setup-files"] == {
+        "id": "legacy-setup-files",
+        "is_ok": False,
+        "message": "Legacy setup files found: setup.cfg. Use pyproject.toml instead.",
+        "project": ".",
+        "duration": lines["legacy-setup-files"]["duration"],
+    }
+
+
+@pytest.mark.usefixtures("configured_tmp_path")
+@pytest.mark.parametrize("files", [["pyproject_success.toml", "setup_success.cfg"]])
+def test_format_ndjson_fail_fast() -> None:
+    runner = CliRunner()
+    result = runner.invoke(cli.main, ["--format", "ndjson", "--fail-fast"])
+    assert result.exit_code == 3  # noqa: PLR2004
+    assert json.loads(result.stdout.splitlines()[-1])["id"] == "legacy-setup-files"
+
+
+@pytest.mark.usefixtures("configured_tmp_path")
+@pytest.mark.parametrize("files", [["pyproject_success.toml", "setup_success.cfg"]])
+def test_files() -> None:
+    """Executes only checks whose inputs are in changed files, even when they don't exist anymore."""
+    runner = CliRunner()
+    result = runner.invoke(cli.main, ["--files", "setup.cfg", "src/removed.py"])
+    assert result.exit_code == 3  # noqa: PLR2004
+    assert result.output == (
+        "Legacy setup files found: setup.cfg. Use pyproject.toml instead.\n"
+        "Error: Looks there are some of improvements.\n"
+    )
+    result = runner.invoke(cli.main, ["--files", "src/package/module.py"])
+    assert result.exit_code == 0
+    assert result.output == "Looks high velocity! ⚡️ 🚄 ✨\n"
+
+
+def test_files_recursive() -> None:
+    runner = CliRunner()
+    result = runner.invoke(cli.main, ["--files", "--recursive", "pyproject.toml"])
+    assert result.exit_code == 2  # noqa: PLR2004
+    assert "--files can't be used with --recursive, --watch or --changed-since." in result.output
+
+
+def test_roots_not_directory(tmp_path: Path) -> None:
+    runner = CliRunner()
+    result = runner.invoke(cli.main, [str(tmp_path / "missing")])
+    assert result.exit_code == 2  # noqa: PLR2004
+    assert "Invalid value for '[ROOTS]...'" in result.output
+
+
+def test_changed_since(git_repository: Path, project_roots: list[Path]) -> None:
+    """Checks only projects which own files changed since the ref."""
+    runner = CliRunner()
+    args = ["--recursive", "--changed-since", "HEAD", "--format", "ndjson", str(git_repository)]
+    result = runner.invoke(cli.main, args)
+    assert result.exit_code == 3  # noqa: PLR2004
+    assert {json.loads(line)["project"] for line in result.stdout.splitlines()} == {str(project_roots[1])}
+    result = runner.invoke(cli.main, ["--changed-since", "HEAD", str(project_roots[0])])
+    assert result.exit_code == 0
+
+
+def test_changed_since_invalid_ref(git_repository: Path) -> None:
+    runner = CliRunner()
+    result = runner.invoke(cli.main, ["--recursive", "--changed-since", "unknown-ref", str(git_repository)])
+    assert result.exit_code == 1
+    assert result.output.startswith("Error: Failed to list files changed since unknown-ref:")
+
+
+def test_revisions(git_repository: Path, project_roots: list[Path]) -> None:
+    """Checks revisions and tags, and reports revisions which don't have the project."""
+    Git(git_repository).run("tag", "v0.1.0")
+    runner = CliRunner()
+    args = ["revisions", "--repository", str(git_repository), "--directory", project_roots[2].name]
+    result = runner.invoke(cli.main, [*args, "--tags", "HEAD"])
+    assert result.exit_code == 3  # noqa: PLR2004
+    assert result.stdout.startswith("HEAD:\n")
+    assert "\nv0.1.0:\n" in result.stdout
+    result = runner.invoke(cli.main, [*args, "--format", "ndjson", "unknown"])
+    assert result.exit_code == 3  # noqa: PLR2004
+    assert json.loads(result.stdout) == {"revision": "unknown", "error": "not found"}
+
+
+def test_revisions_not_repository(tmp_path: Path) -> None:
+    runner = CliRunner()
+    result = runner.invoke(cli.main, ["revisions", "--repository", str(tmp_path), "HEAD"])
+    assert result.exit_code == 1
+    assert result.output.startswith("Error: ")
+
+
+def test_archive(distributions: list[Path]) -> None:
+    runner = CliRunner()
+    result = runner.invoke(cli.main, ["--archive", *map(str, distributions)])
+    assert result.exit_code == 0
+    assert result.stdout.startswith("Looks high velocity!")
+    result = runner.invoke(cli.main, ["--archive", "--format", "ndjson", str(distributions[1])])
+    assert result.exit_code == 0
+    lines = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [line["id"] for line in lines] == ["requires-python", "classifiers", "keywords", "typed"]
+
+
+def test_archive_invalid(tmp_path: Path, distributions: list[Path]) -> None:
+    runner = CliRunner()
+    result = runner.invoke(cli.main, ["--archive", "--recursive", str(distributions[0])])
+    assert result.exit_code == 2  # noqa: PLR2004
+    result = runner.invoke(cli.main, ["--archive", str(tmp_path / "missing.whl")])
+    assert result.exit_code == 2  # noqa: PLR2004
+    (tmp_path / "package.zip").write_bytes(b"")
+    result = runner.invoke(cli.main, ["--archive", str(tmp_path / "package.zip")])
+    assert result.exit_code == 1
+    assert result.output.startswith("Error: Unsupported archive: package.zip")
+
+
+def test_stats(tmp_path: Path, resource_path_root: Path) -> None:
+    """System calls are reported to stderr."""
+    shutil.copy(resource_path_root / "pyproject_success.toml", tmp_path / "pyproject.toml")
+    runner = CliRunner()
+    result = runner.invoke(cli.main, ["--stats", "--no-cache", str(tmp_path)])
+    assert result.exit_code == 3  # noqa: PLR2004
+    assert result.stderr.startswith("System calls: 2 (read: 1, scandir: 1)\n")
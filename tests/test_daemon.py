@@ -0,0 +1,261 @@
+"""Tests for daemon.py and client.py."""
+
+from __future__ import annotations
+
+import io
+import os
+import socket
+import sys
+import time
+
+# Reason: Accept risk of using subprocess.
+from subprocess import Popen  # nosec B404
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from pyvelocity import __version__
+from pyvelocity import cli
+from pyvelocity import client
+from pyvelocity.client import COMMAND_STOP
+from pyvelocity.client import ENVIRONMENT_VARIABLE_RUNTIME_DIRECTORY
+from pyvelocity.client import ENVIRONMENT_VARIABLE_SOCKET
+from pyvelocity.client import Client
+from pyvelocity.client import DaemonUnavailableError
+from pyvelocity.client import get_socket_path
+from pyvelocity.client import verify_directory
+from pyvelocity.daemon import Daemon
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+requires_unix_socket = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"),
+    reason="Unix socket is not available on this platform.",
+)
+
+
+def wait_for_daemon(path: Path) -> None:
+    for _ in range(1000):
+        if cli.ping(Client(path)) is not None:
+            return
+        time.sleep(0.01)
+    pytest.fail("Daemon didn't start.")
+
+
+@pytest.fixture
+def socket_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    path = tmp_path / "pyvelocity.sock"
+    monkeypatch.setenv(ENVIRONMENT_VARIABLE_SOCKET, str(path))
+    return path
+
+
+@pytest.fixture
+# Reason: Using fixture. pylint: disable-next=redefined-outer-name
+def running_daemon(socket_path: Path) -> Generator[Path, None, None]:
+    """Serves daemon in another process since it redirects standard output of the process."""
+    # Reason: Accept risk of using subprocess.
+    process = Popen([sys.executable, "-m", "pyvelocity", "daemon", "start", "--foreground"])  # nosec B603
+    try:
+        wait_for_daemon(socket_path)
+        yield socket_path
+        Client(socket_path).send(COMMAND_STOP)
+        process.wait(timeout=10)
+    finally:
+        process.kill()
+
+
+def test_forward(running_daemon: Path, project_roots: list[Path], capsys: pytest.CaptureFixture[str]) -> None:
+    """Output and exit code are as same as executing in process."""
+    argv = ["--no-cache", str(project_roots[2])]
+    assert Client(running_daemon).forward(argv) == 3  # noqa: PLR2004
+    captured = capsys.readouterr()
+    expected = CliRunner().invoke(cli.main, argv)
+    assert captured.out == expected.stdout
+    assert captured.err == "Error: Looks there are some of improvements.\n"
+
+
+# Command which raises unexpected error, served by the daemon in another process.
+CODE_DAEMON_RAISING = """
+import sys
+from pathlib import Path
+
+import click
+
+from pyvelocity.daemon import Daemon
+
+
+@click.command()
+def command() -> None:
+    raise RuntimeError("Unexpected error.")
+
+
+Daemon(Path(sys.argv[1]), command).serve_forever()
+"""
+
+
+@requires_unix_socket
+def test_forward_raising(socket_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    """Unexpected error of the command is reported to the client and the daemon keeps running."""
+    # Reason: Accept risk of using subprocess.
+    process = Popen([sys.executable, "-c", CODE_DAEMON_RAISING, str(socket_path)])  # noqa: S603  # nosec B603
+    try:
+        wait_for_daemon(socket_path)
+        assert Client(socket_path).forward([]) == 1
+        assert capsys.readouterr().err.endswith("RuntimeError: Unexpected error.\n")
+        assert cli.ping(Client(socket_path)) is not None
+        Client(socket_path).send(COMMAND_STOP)
+        process.wait(timeout=10)
+    finally:
+        process.kill()
+
+
+def test_forward_different_version(running_daemon: Path) -> None:
+    with patch("pyvelocity.client.__version__", "0.0.0"), pytest.raises(DaemonUnavailableError):
+        Client(running_daemon).forward([])
+
+
+def test_not_running(socket_path: Path) -> None:
+    with pytest.raises(DaemonUnavailableError):
+        Client(socket_path).forward([])
+
+
+@requires_unix_socket
+def test_busy(socket_path: Path) -> None:
+    """Falls back to execute in process when the daemon doesn't accept the request in time."""
+    # Reason: Windows doesn't reach here. pylint: disable-next=no-member
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(str(socket_path))
+        # The connection is queued but never accepted as same as the daemon serving another client.
+        server.listen()
+        with pytest.raises(DaemonUnavailableError):
+            Client(socket_path).forward([])
+
+
+@requires_unix_socket
+def test_get_socket_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Socket is in the runtime directory of the user, or the directory for the user in temporary directory."""
+    monkeypatch.delenv(ENVIRONMENT_VARIABLE_SOCKET, raising=False)
+    monkeypatch.setenv(ENVIRONMENT_VARIABLE_RUNTIME_DIRECTORY, str(tmp_path))
+    assert get_socket_path() == tmp_path / "pyvelocity.sock"
+    monkeypatch.delenv(ENVIRONMENT_VARIABLE_RUNTIME_DIRECTORY)
+    assert get_socket_path().parent.name == f"pyvelocity-{os.getuid()}"
+
+
+@requires_unix_socket
+@pytest.mark.parametrize(("mode", "is_private"), [(0o700, True), (0o1777, True), (0o777, False), (0o770, False)])
+def test_verify_directory(tmp_path: Path, mode: int, *, is_private: bool) -> None:
+    """Other users must not be able to replace the socket in the directory, sticky bit prevents it."""
+    directory = tmp_path / "directory"
+    directory.mkdir()
+    directory.chmod(mode)
+    if is_private:
+        verify_directory(directory)
+    else:
+        with pytest.raises(DaemonUnavailableError):
+            verify_directory(directory)
+
+
+@requires_unix_socket
+def test_socket_of_other_user(socket_path: Path) -> None:
+    """Neither client nor daemon trusts socket which other user created first."""
+    # Reason: Windows doesn't reach here. pylint: disable-next=no-member
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(str(socket_path))
+        server.listen()
+        with (
+            patch("pyvelocity.client.os.getuid", return_value=os.getuid() + 1),
+            pytest.raises(DaemonUnavailableError, match="Socket is not created by the user"),
+        ):
+            Client(socket_path).forward([])
+
+
+@requires_unix_socket
+def test_prepare_not_socket(socket_path: Path) -> None:
+    """Daemon doesn't remove file which isn't socket of the user."""
+    socket_path.write_text("")
+    with pytest.raises(DaemonUnavailableError, match="Socket is not created by the user"):
+        Daemon(socket_path, cli.main).prepare()
+    assert socket_path.exists()
+
+
+@pytest.mark.usefixtures("socket_path")
+def test_main_fallback() -> None:
+    """Executes command in process when the daemon isn't running."""
+    with patch.object(sys, "argv", ["pyvelocity"]), patch("pyvelocity.cli.main") as main:
+        client.main()
+    main.assert_called_once()
+
+
+@pytest.mark.parametrize("argv", [["--watch"], [".", "--watch"], ["daemon", "status"]])
+def test_main_in_process(argv: list[str]) -> None:
+    """Commands which run until interrupted or control the daemon aren't forwarded."""
+    with (
+        patch.object(sys, "argv", ["pyvelocity", *argv]),
+        patch.object(Client, "forward") as forward,
+        patch("pyvelocity.cli.main") as main,
+    ):
+        client.main()
+    forward.assert_not_called()
+    main.assert_called_once()
+
+
+def test_main_forward(running_daemon: Path, project_roots: list[Path]) -> None:
+    with (
+        patch.object(sys, "argv", ["pyvelocity", str(project_roots[0])]),
+        patch.object(Client, "forward", wraps=Client(running_daemon).forward) as forward,
+        pytest.raises(SystemExit) as exc_info,
+    ):
+        client.main()
+    assert exc_info.value.code == 3  # noqa: PLR2004
+    forward.assert_called_once_with([str(project_roots[0])])
+
+
+@pytest.mark.usefixtures("running_daemon")
+def test_status_and_start_when_running() -> None:
+    runner = CliRunner()
+    result = runner.invoke(cli.main, ["daemon", "status"])
+    assert result.exit_code == 0
+    assert result.output.startswith("Daemon is running: pid ")
+    result = runner.invoke(cli.main, ["daemon", "start"])
+    assert result.exit_code == 1
+    assert result.output.startswith("Error: Daemon is already running: ")
+
+
+@pytest.mark.usefixtures("socket_path")
+@pytest.mark.parametrize("command", ["status", "stop"])
+def test_not_running_commands(command: str) -> None:
+    result = CliRunner().invoke(cli.main, ["daemon", command])
+    assert result.exit_code == 1
+    assert result.output == "Error: Daemon is not running.\n"
+
+
+@pytest.mark.slow
+def test_start_and_stop(socket_path: Path) -> None:
+    """Starts daemon in background process."""
+    runner = CliRunner()
+    result = runner.invoke(cli.main, ["daemon", "start"])
+    assert result.exit_code == 0, result.output
+    assert result.output == f"Daemon started: {socket_path}\n"
+    result = runner.invoke(cli.main, ["daemon", "stop"])
+    assert result.exit_code == 0
+    assert result.output == "Daemon stopped.\n"
+
+
+def test_respond(tmp_path: Path) -> None:
+    """Commands to control the daemon are accepted from any version of client."""
+    daemon = Daemon(tmp_path / "pyvelocity.sock", cli.main)
+    daemon.is_running = True
+    file = io.StringIO()
+    assert daemon.respond({"version": "0.0.0", "argv": [], "cwd": str(tmp_path)}, file) == {
+        "error": f"Daemon is running different version: {__version__}",
+    }
+    assert daemon.respond({"version": __version__, "argv": ["--watch"], "cwd": str(tmp_path)}, file) == {
+        "error": "Command runs until interrupted, execute it in the process of the client.",
+    }
+    assert not file.getvalue()
+    assert daemon.respond({"version": "0.0.0", "command": COMMAND_STOP}, file)["version"] == __version__
+    assert daemon.is_running is False
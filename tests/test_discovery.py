@@ -0,0 +1,116 @@
+"""Tests for discovery.py."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pyvelocity.discovery import GitIgnore
+from pyvelocity.discovery import GitIgnorePattern
+from pyvelocity.discovery import ProjectFinder
+from pyvelocity.discovery import ProjectIndex
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _create_project(path: Path) -> None:
+    path.mkdir(parents=True, exist_ok=True)
+    (path / "pyproject.toml").touch()
+
+
+class TestProjectFinder:
+    """Test for ProjectFinder."""
+
+    @staticmethod
+    def test_find(tmp_path: Path) -> None:
+        """Projects are found in order of path and pruned directories are skipped."""
+        for relative_path in [
+            "",
+            "packages/b",
+            "packages/a",
+            "packages/a/nested",
+            ".git/modules/x",
+            ".venv/lib/site-packages/y",
+            "node_modules/z",
+            "build/lib",
+            "ignored/project",
+            "generated/keep",
+        ]:
+            _create_project(tmp_path / relative_path)
+        (tmp_path / ".gitignore").write_text("# comment\n/ignored/\ngenerated/*\n!generated/keep\n", encoding="utf-8")
+        assert list(ProjectFinder(tmp_path).find()) == [
+            tmp_path,
+            tmp_path / "generated/keep",
+            tmp_path / "packages/a",
+            tmp_path / "packages/a/nested",
+            tmp_path / "packages/b",
+        ]
+
+    @staticmethod
+    def test_nested_gitignore(tmp_path: Path) -> None:
+        """Patterns in .gitignore in sub directory are applied only under the directory."""
+        _create_project(tmp_path / "a/tmp")
+        _create_project(tmp_path / "b/tmp")
+        (tmp_path / "a/.gitignore").write_text("tmp\n", encoding="utf-8")
+        assert list(ProjectFinder(tmp_path).find()) == [tmp_path / "b/tmp"]
+
+    @staticmethod
+    def test_gitignore_in_all_directories(tmp_path: Path) -> None:
+        """Pattern with leading "**/" is applied to nested directories even when the rest includes "/"."""
+        _create_project(tmp_path / "a/b/generated/out")
+        _create_project(tmp_path / "a/b/generated/keep")
+        (tmp_path / ".gitignore").write_text("**/generated/out\n", encoding="utf-8")
+        assert list(ProjectFinder(tmp_path).find()) == [tmp_path / "a/b/generated/keep"]
+
+
+class TestGitIgnorePattern:
+    """Test for GitIgnorePattern."""
+
+    @staticmethod
+    @pytest.mark.parametrize("line", ["", "   ", "# comment", "/", "!"])
+    def test_parse_none(line: str) -> None:
+        assert GitIgnorePattern.parse("", line) is None
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        ("line", "relative_path", "is_directory", "expected"),
+        [
+            ("dist", "a/dist", True, True),
+            ("dist/", "a/dist", False, False),
+            ("/dist", "a/dist", True, False),
+            ("/dist", "dist", True, True),
+            ("**/dist", "a/dist", True, True),
+            ("**/build/out", "a/b/build/out", True, True),
+            ("**/build/out", "build/out", True, True),
+            ("**/build/out", "a/rebuild/out", True, False),
+            ("build/out", "a/build/out", True, False),
+            ("*.egg-info", "pkg.egg-info", True, True),
+        ],
+    )
+    def test_matches(line: str, relative_path: str, *, is_directory: bool, expected: bool) -> None:
+        pattern = GitIgnorePattern.parse("", line)
+        assert pattern is not None
+        assert pattern.matches(relative_path, is_directory=is_directory) is expected
+
+
+def test_git_ignore_unreadable(tmp_path: Path) -> None:
+    """Unreadable .gitignore is ignored."""
+    git_ignore = GitIgnore()
+    assert git_ignore.extend("", tmp_path / ".gitignore") is git_ignore
+
+
+class TestProjectIndex:
+    """Test for ProjectIndex."""
+
+    @staticmethod
+    def test_select(tmp_path: Path) -> None:
+        """The deepest project owns the path and paths outside of projects are ignored."""
+        roots = [tmp_path / "packages/a", tmp_path / "packages/a/nested", tmp_path / "packages/ab"]
+        index = ProjectIndex(roots)
+        assert index.find_owner(tmp_path / "packages/a/nested/pyproject.toml") == roots[1]
+        assert index.find_owner(tmp_path / "packages/ab/src/module.py") == roots[2]
+        assert index.find_owner(tmp_path / "packages/README.md") is None
+        paths = [tmp_path / "packages/a/README.md", tmp_path / "packages/a/src/a.py", tmp_path / "tools/x.py"]
+        assert index.select(paths) == {roots[0]}
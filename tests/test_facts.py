@@ -0,0 +1,101 @@
+"""Tests for facts.py."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from pyvelocity.configurations.files.aggregation import ConfigurationFiles
+from pyvelocity.facts import ClassifierIndex
+from pyvelocity.facts import Facts
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pyvelocity.configurations.files.py_project_toml import PyProjectToml
+
+
+def _create_facts(tmp_path: Path, py_project_toml: PyProjectToml | None) -> Facts:
+    configuration_files = ConfigurationFiles(tmp_path)
+    configuration_files.py_project_toml = py_project_toml
+    return configuration_files.facts
+
+
+class TestFacts:
+    """Test for Facts."""
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        ("fixture_name", "expected"),
+        [
+            ("mock_py_project_toml_no_project", False),
+            ("mock_py_project_toml_no_classifiers", False),
+            ("mock_py_project_toml_non_list_classifiers", False),
+            ("mock_py_project_toml_with_typing_classifier", True),
+            ("mock_py_project_toml_without_typing_classifier", False),
+            ("mock_py_project_toml_empty_classifiers", False),
+        ],
+    )
+    def test_has_typing_classifier(
+        tmp_path: Path,
+        request: pytest.FixtureRequest,
+        fixture_name: str,
+        *,
+        expected: bool,
+    ) -> None:
+        """Tests whether 'Typing :: Typed' classifier is present."""
+        facts = _create_facts(tmp_path, request.getfixturevalue(fixture_name))
+        assert facts.has_typing_classifier is expected
+
+    @staticmethod
+    def test_no_pyproject_toml(tmp_path: Path) -> None:
+        """Facts about pyproject.toml are empty when it doesn't exist."""
+        facts = _create_facts(tmp_path, None)
+        assert facts.project is None
+        assert facts.requires_python is None
+        assert facts.supported_versions == set()
+        assert facts.supports_latest_python is False
+        assert facts.classifiers is None
+        assert facts.has_typing_classifier is False
+
+    @staticmethod
+    def test_requires_python(tmp_path: Path, mock_py_project_toml_with_typing_classifier: PyProjectToml) -> None:
+        """Supported versions are derived from the parsed requires-python."""
+        facts = _create_facts(tmp_path, mock_py_project_toml_with_typing_classifier)
+        assert facts.requires_python is not None
+        assert facts.requires_python.value == ">=3.9"
+        assert facts.supports_latest_python is True
+        assert {"3.9", "3.14"} <= facts.supported_versions
+
+    @staticmethod
+    def test_memoized(tmp_path: Path, mock_py_project_toml_with_typing_classifier: PyProjectToml) -> None:
+        """Each fact is computed once and shared by checks of the same project."""
+        configuration_files = ConfigurationFiles(tmp_path)
+        configuration_files.py_project_toml = mock_py_project_toml_with_typing_classifier
+        assert configuration_files.facts is configuration_files.facts
+        with patch("pyvelocity.facts.RequiresPythonAnalyzer") as analyzer:
+            analyzer.return_value.get_requires_python_supported_versions.return_value = {"3.14"}
+            facts = configuration_files.facts
+            assert facts.supported_versions == facts.supported_versions
+            analyzer.assert_called_once_with(">=3.9")
+
+    @staticmethod
+    def test_readme(tmp_path: Path) -> None:
+        """README.md is read from the project root."""
+        assert _create_facts(tmp_path, None).readme is None
+        (tmp_path / "README.md").write_text("# Test", encoding="utf-8")
+        readme = _create_facts(tmp_path, None).readme
+        assert readme is not None
+        assert readme.content == "# Test"
+
+
+def test_classifier_index() -> None:
+    """Classifiers are stripped and indexed."""
+    index = ClassifierIndex(
+        [" Typing :: Typed ", "Programming Language :: Python :: 3.14", "Programming Language :: Python"],
+    )
+    assert "Typing :: Typed" in index
+    assert "Topic :: System" not in index
+    assert index.python_versions == {"3.14"}
@@ -0,0 +1,31 @@
+"""Tests for git.py."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pyvelocity.git import Git
+from pyvelocity.git import GitError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.mark.usefixtures("git_repository")
+def test_list_changed_files(project_roots: list[Path]) -> None:
+    """Paths are absolute even when git is executed in sub directory."""
+    assert Git(project_roots[0]).list_changed_files("HEAD") == [(project_roots[1] / "README.md").resolve()]
+
+
+@pytest.mark.usefixtures("git_repository")
+@pytest.mark.parametrize("ref", ["unknown-ref", "--output=diff.txt"])
+def test_list_changed_files_invalid_ref(project_roots: list[Path], ref: str) -> None:
+    with pytest.raises(GitError):
+        Git(project_roots[0]).list_changed_files(ref)
+
+
+def test_not_repository(tmp_path: Path) -> None:
+    with pytest.raises(GitError):
+        Git(tmp_path).list_changed_files("HEAD")
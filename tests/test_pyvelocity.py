@@ -0,0 +1,63 @@
+"""Tests for pyvelocity.py."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from pyvelocity.pyvelocity import check_project
+from pyvelocity.pyvelocity import check_projects
+from pyvelocity.pyvelocity import stream_project
+from pyvelocity.pyvelocity import stream_projects
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.mark.parametrize(("jobs", "threads"), [(1, 1), (2, 1), (0, 1), (1, 4), (2, 4)])
+def test_check_projects(project_roots: list[Path], jobs: int, threads: int) -> None:
+    """Results are yielded in order of roots regardless of the number of worker processes and threads."""
+    expected = [check_project(root).results for root in project_roots]
+    assert [results.results for results in check_projects(project_roots, jobs=jobs, threads=threads)] == expected
+
+
+def test_check_projects_empty() -> None:
+    assert list(check_projects([], jobs=2)) == []
+
+
+@pytest.mark.parametrize(("jobs", "threads"), [(1, 1), (2, 1), (1, 4), (2, 4)])
+def test_stream_projects(project_roots: list[Path], jobs: int, threads: int) -> None:
+    """Every result is streamed with its root regardless of order of completion."""
+    expected = sorted((root, result.id) for root in project_roots for result in check_project(root).results)
+    streamed = list(stream_projects(project_roots, jobs=jobs, threads=threads))
+    assert sorted((root, result.id) for root, result in streamed) == expected
+    assert all(result.duration >= 0 for _, result in streamed)
+
+
+def test_stream_project_ordered(project_roots: list[Path]) -> None:
+    assert list(stream_project(project_roots[0], threads=4, ordered=True)) == check_project(project_roots[0]).results
+
+
+def test_check_project_files(project_roots: list[Path]) -> None:
+    """Only checks whose inputs are in changed files are executed."""
+    root = project_roots[2]
+    expected = {result.id: result for result in check_project(root).results}
+    assert check_project(root, files=["README.md"]).results == [expected["badges"]]
+
+
+def test_check_project_files_unaffected(project_roots: list[Path]) -> None:
+    """Configuration files are not even parsed when no check is affected."""
+    with patch("pyvelocity.pyvelocity.ConfigurationFiles", side_effect=AssertionError):
+        assert check_project(project_roots[2], files=["src/module.py"], cache=True).results == []
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_check_projects_files(project_roots: list[Path], jobs: int) -> None:
+    """Changed files are looked up by root, projects not in them have no changed files."""
+    files = {project_roots[0]: ["pyproject.toml"]}
+    list_results = [results.results for results in check_projects(project_roots, jobs=jobs, files=files)]
+    assert list_results == [check_project(project_roots[0]).results] + [[]] * (len(project_roots) - 1)
+    streamed = list(stream_projects(project_roots, jobs=jobs, files=files))
+    assert {root for root, _ in streamed} == {project_roots[0]}
@@ -0,0 +1,105 @@
+"""Tests for revisions.py."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pyvelocity.git import CatFile
+from pyvelocity.git import Git
+from pyvelocity.pyvelocity import check_project
+from pyvelocity.revisions import RevisionReader
+from pyvelocity.revisions import check_revisions
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def commit(repository: Path, message: str) -> None:
+    Git(repository).run("add", ".")
+    Git(repository).run(
+        "-c",
+        "user.name=pyvelocity",
+        "-c",
+        "user.email=pyvelocity@example.com",
+        "-c",
+        "commit.gpgsign=false",
+        "commit",
+        "--quiet",
+        "--message",
+        message,
+    )
+
+
+@pytest.mark.parametrize("is_bare", [False, True])
+def test_check_revisions(
+    git_repository: Path,
+    project_roots: list[Path],
+    tmp_path_factory: pytest.TempPathFactory,
+    *,
+    is_bare: bool,
+) -> None:
+    """Results are the same as checking the checked out project."""
+    root = project_roots[0]
+    for name in ["src/package/__init__.py", "src/package/py.typed", "src/package/sub/__init__.py", "setup.cfg"]:
+        (root / name).parent.mkdir(parents=True, exist_ok=True)
+        (root / name).touch()
+    commit(git_repository, "Add package")
+    repository = git_repository
+    if is_bare:
+        repository = tmp_path_factory.mktemp("bare") / "repository.git"
+        Git(git_repository).run("clone", "--quiet", "--bare", str(git_repository), str(repository))
+    expected = check_project(root).results
+    checked = list(check_revisions(repository, ["HEAD", "HEAD~1", "unknown"], directory=root.name))
+    assert [revision for revision, _ in checked] == ["HEAD", "HEAD~1", "unknown"]
+    assert checked[0][1] is not None
+    assert checked[0][1].results == expected
+    assert checked[1][1] is not None
+    assert checked[1][1].results != expected
+    assert checked[2][1] is None
+
+
+def test_read(git_repository: Path, project_roots: list[Path]) -> None:
+    """Reads contents of files which checks read and only existence of others."""
+    (project_roots[1] / "package").mkdir()
+    (project_roots[1] / "package" / "__init__.py").write_text("import os\n", encoding="utf-8")
+    (project_roots[1] / ".hidden").mkdir()
+    (project_roots[1] / ".hidden" / "__init__.py").touch()
+    commit(git_repository, "Add package")
+    with CatFile(git_repository) as cat_file:
+        documents = RevisionReader(cat_file, f"./{project_roots[1].name}/").read("HEAD")
+    assert documents == {
+        "pyproject.toml": (project_roots[1] / "pyproject.toml").read_text(encoding="utf-8"),
+        "README.md": "# Project\n",
+        "package/__init__.py": "",
+    }
+
+
+@pytest.mark.parametrize(
+    ("directory", "expected"),
+    [(".tools/pkg", ".tools/pkg"), ("./.tools/pkg/", ".tools/pkg"), (".", ""), ("./", ""), ("", "")],
+)
+def test_directory(git_repository: Path, project_roots: list[Path], directory: str, expected: str) -> None:
+    """Directory whose name starts with dot is kept as is."""
+    (git_repository / ".tools").mkdir()
+    project_roots[0].rename(git_repository / ".tools" / "pkg")
+    commit(git_repository, "Move project")
+    with CatFile(git_repository) as cat_file:
+        reader = RevisionReader(cat_file, directory)
+        assert reader.directory == expected
+        documents = reader.read("HEAD")
+    assert documents is not None
+    assert ("pyproject.toml" in documents) is bool(expected)
+
+
+def test_cat_file(git_repository: Path, project_roots: list[Path]) -> None:
+    with CatFile(git_repository) as cat_file:
+        content = cat_file.read_blob(f"HEAD:{project_roots[0].name}/pyproject.toml")
+        assert content == (project_roots[0] / "pyproject.toml").read_bytes()
+        tree = cat_file.read_tree("HEAD:")
+        assert tree is not None
+        assert [(entry.name, entry.is_tree) for entry in tree] == [(root.name, True) for root in project_roots]
+        assert cat_file.read("HEAD:missing") is None
+        assert cat_file.read("HEAD\nHEAD") is None
+        assert cat_file.read_tree(f"HEAD:{project_roots[0].name}/pyproject.toml") is None
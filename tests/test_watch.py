@@ -0,0 +1,86 @@
+"""Tests for watch.py."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+from click.testing import CliRunner
+
+from pyvelocity import cli
+from pyvelocity.checks.typed import Typed
+from pyvelocity.configurations.files.memo import PARSED_FILES
+from pyvelocity.watch import NAME_TREE
+from pyvelocity.watch import ProjectWatch
+from pyvelocity.watch import Watcher
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_poll_no_change(project_roots: list[Path]) -> None:
+    project = ProjectWatch(project_roots[2])
+    project.evaluate(set(), is_tree_changed=False)
+    assert project.poll() is None
+
+
+def test_poll_readme(project_roots: list[Path]) -> None:
+    """Editing README.md re-evaluates only badges check."""
+    root = project_roots[2]
+    (root / "README.md").write_text("", encoding="utf-8")
+    project = ProjectWatch(root)
+    before = project.evaluate(set(), is_tree_changed=False)
+    (root / "README.md").write_text("# Project\n", encoding="utf-8")
+    with patch.object(Typed, "execute", side_effect=AssertionError):
+        change = project.poll()
+    assert change is not None
+    assert change.changed_inputs == ["README.md"]
+    assert [result.id for result in change.results.results] == [result.id for result in before.results]
+
+
+def test_poll_tree(project_roots: list[Path]) -> None:
+    """Adding package directory re-evaluates typed check."""
+    root = project_roots[2]
+    project = ProjectWatch(root)
+    project.evaluate(set(), is_tree_changed=False)
+    # The package configured in pyproject.toml.
+    (root / "pyvelocity").mkdir()
+    (root / "pyvelocity" / "__init__.py").touch()
+    (root / "pyvelocity" / "py.typed").touch()
+    change = project.poll()
+    assert change is not None
+    assert change.changed_inputs == [NAME_TREE]
+    assert "Missing py.typed files in package directories" not in change.results.message
+
+
+def test_poll_filter(project_roots: list[Path]) -> None:
+    """Checks removed from filter are executed even when their inputs didn't change."""
+    root = project_roots[1]
+    project = ProjectWatch(root)
+    assert "typed" not in [result.id for result in project.evaluate(set(), is_tree_changed=False).results]
+    path = root / "pyproject.toml"
+    path.write_text(path.read_text(encoding="utf-8").replace('filter = ["typed"]', "filter = []"), encoding="utf-8")
+    change = project.poll()
+    assert change is not None
+    assert change.changed_inputs == ["pyproject.toml"]
+    assert [result.id for result in change.results.results][-1] == "typed"
+
+
+def test_watcher(project_roots: list[Path]) -> None:
+    watcher = Watcher(project_roots, interval=0)
+    changes = watcher.watch()
+    assert [next(changes).root for _ in project_roots] == project_roots
+    (project_roots[0] / "setup.py").touch()
+    change = next(changes)
+    assert change.root == project_roots[0]
+    assert change.changed_inputs == ["setup.py"]
+
+
+def test_cli(project_roots: list[Path]) -> None:
+    """Echos results at first and stops by Ctrl+C."""
+    with patch("pyvelocity.watch.time.sleep", side_effect=KeyboardInterrupt):
+        result = CliRunner().invoke(cli.main, ["--watch", str(project_roots[0])])
+    PARSED_FILES.is_enabled = False
+    PARSED_FILES.entries.clear()
+    assert result.exit_code == 0
+    assert result.output == "README.md file not found\n"